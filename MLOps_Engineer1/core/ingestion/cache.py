@@ -0,0 +1,174 @@
+"""Engineer-1 | Columnar ingestion cache
+
+Keeps the parsed form of each CSV as an uncompressed Arrow IPC file, keyed by
+the source file's content hash and the schema version. Later reads memory-map
+the cache instead of re-parsing CSV text. The cache directory is size-bounded
+and evicts least-recently-used entries. Without pyarrow the cache is disabled
+and reads fall back to plain `pd.read_csv`.
+
+Load-time comparison:
+
+    python -m MLOps_Engineer1.core.ingestion.cache --bench MLOps_Engineer1/data/adult_small.csv
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+import pandas as pd
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc  # noqa: F401 - registers pa.ipc
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+BASE_DIR = Path(__file__).resolve().parents[2]  # .../MLOps_Engineer1
+CACHE_DIR = BASE_DIR / "artifacts" / "cache" / "columnar"
+SCHEMA_PATH = BASE_DIR / "configs" / "schema.yaml"
+BENCH_FILE = BASE_DIR / "artifacts" / "ingestion" / "cache_benchmark.json"
+DEFAULT_MAX_BYTES = int(os.getenv("PULSEAI_CACHE_MAX_BYTES", str(2 * 1024 ** 3)))
+HASH_BLOCK = 1024 * 1024
+
+def content_hash(path: Path) -> str:
+    """sha256 of the file's bytes"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b""):
+            h.update(block)
+    return h.hexdigest()
+
+def schema_version(schema_path: Path = SCHEMA_PATH) -> str:
+    """Short hash of schema.yaml, so a schema change invalidates cached parses"""
+    if not Path(schema_path).exists():
+        return "noschema"
+    return hashlib.sha256(Path(schema_path).read_bytes()).hexdigest()[:12]
+
+class ColumnarCache:
+    def __init__(self, cache_dir: Path = CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    @property
+    def enabled(self) -> bool:
+        return pa is not None
+
+    def key(self, csv_path: Path, schema: Optional[str] = None) -> str:
+        return f"{content_hash(csv_path)}-{schema or schema_version()}"
+
+    def _entry(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.arrow"
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """Memory-map a cached frame, or None on a miss"""
+        path = self._entry(key)
+        if not self.enabled or not path.exists():
+            return None
+        try:
+            with pa.memory_map(str(path), "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+            df = table.to_pandas()
+        except (OSError, pa.ArrowInvalid):
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)  # LRU bookkeeping
+        return df
+
+    def put(self, key: str, df: pd.DataFrame) -> Optional[Path]:
+        """Store a frame; unsupported column types just skip caching"""
+        if not self.enabled:
+            return None
+        try:
+            table = pa.Table.from_pandas(df)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return None
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._entry(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with pa.OSFile(str(tmp), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp, path)
+        self.evict()
+        return path
+
+    def entries(self) -> List[Path]:
+        if not self.cache_dir.exists():
+            return []
+        return list(self.cache_dir.glob("*.arrow"))
+
+    def evict(self) -> List[Path]:
+        """Drop least-recently-used entries until the cache fits in max_bytes"""
+        entries = sorted(self.entries(), key=lambda p: p.stat().st_mtime)
+        total = sum(p.stat().st_size for p in entries)
+        evicted = []
+        while entries and total > self.max_bytes:
+            victim = entries.pop(0)
+            total -= victim.stat().st_size
+            victim.unlink(missing_ok=True)
+            evicted.append(victim)
+        return evicted
+
+def read_csv_cached(csv_path: Path, cache: Optional[ColumnarCache] = None) -> pd.DataFrame:
+    """`pd.read_csv` backed by the columnar cache"""
+    cache = cache or ColumnarCache()
+    if not cache.enabled:
+        return pd.read_csv(csv_path)
+    key = cache.key(csv_path)
+    df = cache.get(key)
+    if df is None:
+        df = pd.read_csv(csv_path)
+        cache.put(key, df)
+    return df
+
+def benchmark(csv_path: Path, repeat: int = 3) -> Dict[str, Any]:
+    """Best-of-`repeat` load times: CSV parse vs. warm cache (hash + memory-map)"""
+    csv_path = Path(csv_path)
+    cache = ColumnarCache()
+
+    def best(fn) -> float:
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    csv_s = best(lambda: pd.read_csv(csv_path))
+    read_csv_cached(csv_path, cache)  # make sure the entry exists
+    key = cache.key(csv_path)
+    return {
+        "file": str(csv_path),
+        "bytes": csv_path.stat().st_size,
+        "cache_enabled": cache.enabled,
+        "csv_parse_s": round(csv_s, 4),
+        "content_hash_s": round(best(lambda: cache.key(csv_path)), 4),
+        "cache_mmap_s": round(best(lambda: cache.get(key)), 4) if cache.enabled else None,
+        "cached_read_s": round(best(lambda: read_csv_cached(csv_path, cache)), 4),
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Columnar ingestion cache")
+    parser.add_argument("--bench", nargs="+", metavar="CSV", help="compare CSV and cache load times")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--evict", action="store_true", help="enforce the size bound now")
+    args = parser.parse_args(argv)
+
+    if args.evict:
+        for path in ColumnarCache().evict():
+            print(f"evicted {path.name}")
+    if args.bench:
+        results = [benchmark(Path(p), args.repeat) for p in args.bench]
+        for r in results:
+            print(f"{r['file']}: csv {r['csv_parse_s']}s | cached {r['cached_read_s']}s "
+                  f"(hash {r['content_hash_s']}s + mmap {r['cache_mmap_s']}s)")
+        BENCH_FILE.parent.mkdir(parents=True, exist_ok=True)
+        BENCH_FILE.write_text(json.dumps(results, indent=2))
+        print(f"Report written to {BENCH_FILE}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+"""Engineer-1 | Streaming ingestion
+
+Lazy, chunked access to a CSV file (or a directory of CSV partitions) so that
+peak memory is bounded by the chunk size instead of the file size.
+
+Memory report (synthesizes inputs of the given sizes and measures each one in a
+fresh interpreter so the RSS high-water mark is not polluted by earlier runs):
+
+    python -m MLOps_Engineer1.core.ingestion.streaming --sizes-mb 10 100 1000 --chunksize 100000
+"""
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import pandas as pd
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+DEFAULT_CHUNKSIZE = 100_000
+
+BASE_DIR = Path(__file__).resolve().parents[2]  # .../MLOps_Engineer1
+REPORT_FILE = BASE_DIR / "artifacts" / "ingestion" / "memory_report.json"
+
+class CsvChunkSource:
+    """Lazy handle over one CSV file or a directory of CSV partitions.
+
+    Nothing is read until the handle is iterated; iteration yields DataFrames
+    of at most ``chunksize`` rows. The handle round-trips through ``to_dict``
+    so it can be passed between ZenML steps as a plain dict artifact.
+    """
+
+    def __init__(self, paths: List[Union[str, Path]], chunksize: int = DEFAULT_CHUNKSIZE):
+        if chunksize <= 0:
+            raise ValueError(f"chunksize must be positive, got {chunksize}")
+        self.paths = [Path(p) for p in paths]
+        self.chunksize = int(chunksize)
+
+    @classmethod
+    def from_path(cls, path: Union[str, Path], chunksize: int = DEFAULT_CHUNKSIZE) -> "CsvChunkSource":
+        """Build a handle from a CSV file or a directory of ``*.csv`` partitions"""
+        path = Path(path)
+        if path.is_dir():
+            paths = sorted(path.glob("*.csv"))
+            if not paths:
+                raise FileNotFoundError(f"No CSV partitions found in {path}")
+            return cls(paths, chunksize)
+        if not path.exists():
+            raise FileNotFoundError(path)
+        return cls([path], chunksize)
+
+    def iter_file(self, path: Path) -> Iterator[pd.DataFrame]:
+        with pd.read_csv(path, chunksize=self.chunksize) as reader:
+            for chunk in reader:
+                yield chunk
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        for path in self.paths:
+            yield from self.iter_file(path)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(p.stat().st_size for p in self.paths)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"paths": [str(p) for p in self.paths], "chunksize": self.chunksize}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CsvChunkSource":
+        return cls(data["paths"], data.get("chunksize", DEFAULT_CHUNKSIZE))
+
+class _Window(io.RawIOBase):
+    """Read-only view of an open binary file that stops at byte ``end``"""
+
+    def __init__(self, f, end: int):
+        self.f = f
+        self.end = end
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        n = min(len(buffer), self.end - self.f.tell())
+        if n <= 0:
+            return 0
+        data = self.f.read(n)
+        buffer[:len(data)] = data
+        return len(data)
+
+class AppendCursor:
+    """How far into an append-only CSV file a consumer has read.
+
+    ``read`` yields, in chunks, the rows written since the cursor's byte
+    offset and moves the offset past the last complete line, so a consumer
+    that keeps the cursor (``to_dict``) parses only new bytes on each visit.
+    A final line without its newline may still be being written; it is left
+    for the next visit. The cursor also remembers the bytes just before its
+    offset: a file that shrank or whose earlier bytes changed was replaced
+    rather than appended to, and ``valid`` turns False.
+    """
+
+    MARK_BYTES = 32
+
+    def __init__(self, path: Union[str, Path], offset: Optional[int] = None, mark: str = "",
+                 chunksize: int = DEFAULT_CHUNKSIZE):
+        self.path = Path(path)
+        self.offset = offset
+        self.mark = mark
+        self.chunksize = int(chunksize)
+
+    @property
+    def columns(self) -> List[str]:
+        with open(self.path, "rb") as f:
+            return list(pd.read_csv(io.BytesIO(f.readline()), nrows=0).columns)
+
+    @property
+    def valid(self) -> bool:
+        if self.offset is None:
+            return self.path.exists()
+        try:
+            with open(self.path, "rb") as f:
+                if f.seek(0, os.SEEK_END) < self.offset:
+                    return False
+                return self._mark(f, self.offset) == self.mark
+        except OSError:
+            return False
+
+    def _mark(self, f, offset: int) -> str:
+        start = max(0, offset - self.MARK_BYTES)
+        f.seek(start)
+        return f.read(offset - start).hex()
+
+    @staticmethod
+    def _line_end(f, start: int, block: int = 1 << 16) -> int:
+        """Offset just after the last newline at or after ``start`` (``start`` if there is none)"""
+        end = f.seek(0, os.SEEK_END)
+        while end > start:
+            pos = max(start, end - block)
+            f.seek(pos)
+            newline = f.read(end - pos).rfind(b"\n")
+            if newline >= 0:
+                return pos + newline + 1
+            end = pos
+        return start
+
+    def read(self, **read_kwargs) -> Iterator[pd.DataFrame]:
+        """Chunks of the complete rows after the cursor (``read_kwargs`` go to ``pd.read_csv``)"""
+        with open(self.path, "rb") as f:
+            header = f.readline()
+            if not header.endswith(b"\n"):
+                return  # the header line itself is not complete yet
+            names = list(pd.read_csv(io.BytesIO(header), nrows=0).columns)
+            start = f.tell() if self.offset is None else self.offset
+            end = self._line_end(f, start)
+            if end > start:
+                f.seek(start)
+                reader = pd.read_csv(io.BufferedReader(_Window(f, end)), header=None, names=names,
+                                     chunksize=self.chunksize, **read_kwargs)
+                with reader:
+                    for chunk in reader:
+                        yield chunk
+            self.offset = end
+            self.mark = self._mark(f, self.offset)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"path": str(self.path), "offset": self.offset, "mark": self.mark}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], chunksize: int = DEFAULT_CHUNKSIZE) -> "AppendCursor":
+        return cls(data["path"], data.get("offset"), data.get("mark", ""), chunksize)
+
+def last_row(path: Union[str, Path], block: int = 1 << 16, **read_kwargs) -> Optional[pd.Series]:
+    """The final row of a CSV file, read from the end of the file (None if it has no rows).
+
+    Rows must not contain quoted line breaks; ``read_kwargs`` go to ``pd.read_csv``.
+    """
+    with open(path, "rb") as f:
+        header = f.readline()
+        body = f.tell()
+        end = f.seek(0, os.SEEK_END)
+        start = end
+        while True:
+            start = max(body, start - block)
+            f.seek(start)
+            lines = f.read(end - start).rstrip(b"\r\n").rsplit(b"\n", 1)
+            if len(lines) > 1 or start == body:
+                break
+            block *= 2
+    if not lines[-1]:
+        return None
+    return pd.read_csv(io.BytesIO(header + lines[-1] + b"\n"), **read_kwargs).iloc[0]
+
+def _peak_rss_bytes() -> Optional[int]:
+    """Process-lifetime RSS high-water mark, if the platform exposes it"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return int(peak if sys.platform == "darwin" else peak * 1024)
+    except ImportError:
+        pass
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return int(getattr(info, "peak_wset", info.rss))
+    except ImportError:
+        return None
+
+def measure_stream(source: CsvChunkSource) -> Dict[str, Any]:
+    """Iterate the whole source and report its memory high-water marks"""
+    rows = chunks = max_chunk_rows = 0
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        for chunk in source:
+            rows += len(chunk)
+            chunks += 1
+            max_chunk_rows = max(max_chunk_rows, len(chunk))
+            del chunk
+        _, peak_traced = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    elapsed = time.perf_counter() - start
+    return {
+        "input_bytes": source.total_bytes,
+        "chunksize": source.chunksize,
+        "rows": rows,
+        "chunks": chunks,
+        "max_chunk_rows": max_chunk_rows,
+        "seconds": round(elapsed, 3),
+        "rows_per_sec": round(rows / elapsed, 1) if elapsed > 0 else None,
+        "peak_traced_bytes": peak_traced,
+        "peak_rss_bytes": _peak_rss_bytes(),
+    }
+
+def _synthesize_csv(path: Path, target_bytes: int, sample_csv: Path) -> Path:
+    """Write a CSV of roughly ``target_bytes`` by repeating the sample rows"""
+    lines = sample_csv.read_text().splitlines()
+    header, rows = lines[0], "\n".join(lines[1:]) + "\n"
+    block = rows * max(1, (1 << 20) // max(1, len(rows)))  # ~1 MB per write
+    with open(path, "w") as f:
+        f.write(header + "\n")
+        written = len(header) + 1
+        while written < target_bytes:
+            f.write(block)
+            written += len(block)
+    return path
+
+def memory_report(sizes_mb: List[float], chunksize: int = DEFAULT_CHUNKSIZE,
+                  sample_csv: Optional[Path] = None, out_file: Path = REPORT_FILE) -> Dict[str, Any]:
+    """Measure streaming ingestion for each input size in a fresh interpreter"""
+    sample_csv = Path(sample_csv or BASE_DIR / "data" / "adult_small.csv")
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size_mb in sizes_mb:
+            csv_path = _synthesize_csv(Path(tmp) / f"input_{size_mb}mb.csv", int(size_mb * (1 << 20)), sample_csv)
+            out = subprocess.run(
+                [sys.executable, "-m", "MLOps_Engineer1.core.ingestion.streaming", "--measure", str(csv_path), "--chunksize", str(chunksize)],
+                check=True, capture_output=True, text=True, cwd=str(BASE_DIR.parent),
+            )
+            result = json.loads(out.stdout.strip().splitlines()[-1])
+            result["input_mb"] = size_mb
+            results.append(result)
+            os.remove(csv_path)
+
+    report = {"chunksize": chunksize, "results": results}
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    out_file.write_text(json.dumps(report, indent=2))
+    return report
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Streaming ingestion memory high-water-mark report")
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[10, 100])
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--measure", help="measure a single existing CSV file or partition directory")
+    args = parser.parse_args(argv)
+
+    if args.measure:
+        print(json.dumps(measure_stream(CsvChunkSource.from_path(args.measure, args.chunksize))))
+        return 0
+
+    report = memory_report(args.sizes_mb, args.chunksize)
+    print(f"{'input MB':>10} {'rows':>12} {'chunks':>8} {'peak traced MB':>15} {'peak RSS MB':>12}")
+    for r in report["results"]:
+        rss = f"{r['peak_rss_bytes'] / 2**20:.1f}" if r["peak_rss_bytes"] else "n/a"
+        print(f"{r['input_mb']:>10} {r['rows']:>12} {r['chunks']:>8} {r['peak_traced_bytes'] / 2**20:>15.1f} {rss:>12}")
+    print(f"Report written to {REPORT_FILE}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,388 @@
+"""Engineer-1 | Synthetic dataset generator
+
+Streams rows with the columns of configs/schema.yaml to CSV or Parquet, one
+chunk at a time. Memory is bounded by ``chunk_rows`` whatever the number of
+rows. The ``generator`` section of the schema gives each column's
+distribution: ``dist: normal`` (mean/std, clipped to min/max) or ``uniform``
+(min/max) for numeric columns, and ``values``/``weights`` for categorical
+ones. A column with no entry gets a default for its dtype.
+
+Data-quality problems are injected at controlled rates:
+  null_rate            nulls in columns that allow them
+  null_violation_rate  nulls in columns that do not
+  duplicate_rate       rows that exactly repeat an earlier row of the same chunk
+  corrupt_rate         numeric cells replaced by tokens such as "?" or "n/a"
+  drift                [{column, kind: gradual|abrupt, magnitude, start, end}]
+
+Drift is positioned by row: ``start``/``end`` are fractions of the dataset.
+An abrupt drift applies in full from ``start``. A gradual one ramps up from
+``start`` to ``end`` (default 1.0). A numeric column shifts by
+``magnitude`` standard deviations. A categorical column moves that share of
+its rows to the reversed weights.
+
+Chunk ``i`` is drawn from ``default_rng([seed, i])``, so the output depends
+only on the seed, the settings and ``chunk_rows``, not on partitioning or
+format.
+
+    python -m MLOps_Engineer1.core.ingestion.synthetic out.csv --rows 10000000
+    python -m MLOps_Engineer1.core.ingestion.synthetic parts/ --rows 50000000 --partition-rows 5000000 --format parquet
+    python -m MLOps_Engineer1.core.ingestion.synthetic drifted.csv --rows 1000000 --drift age:gradual:1.5:0.5 --null-rate 0.05
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import yaml
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+BASE_DIR = Path(__file__).resolve().parents[2]  # .../MLOps_Engineer1
+SCHEMA_PATH = BASE_DIR / "configs" / "schema.yaml"
+
+DEFAULT_CHUNK_ROWS = 500_000
+CORRUPT_TOKENS = ["?", "n/a", "unknown", "#REF!"]
+NUMERIC_DTYPES = ("int64", "int32", "float64", "float32")
+
+def _default_spec(dtype: str) -> Dict[str, Any]:
+    if dtype.startswith("int"):
+        return {"dist": "uniform", "min": 0, "max": 100}
+    if dtype.startswith("float"):
+        return {"dist": "normal", "mean": 0.0, "std": 1.0}
+    return {"values": ["a", "b", "c", "d"]}
+
+def parse_drift(text: str) -> Dict[str, Any]:
+    """``column:kind:magnitude[:start[:end]]`` as a drift spec"""
+    parts = text.split(":")
+    if len(parts) < 3:
+        raise ValueError(f"drift must be column:kind:magnitude[:start[:end]], got {text!r}")
+    drift = {"column": parts[0], "kind": parts[1], "magnitude": float(parts[2])}
+    if len(parts) > 3:
+        drift["start"] = float(parts[3])
+    if len(parts) > 4:
+        drift["end"] = float(parts[4])
+    return drift
+
+class _Column:
+    """One column of a chunk as numpy arrays, before conversion to arrow or pandas"""
+
+    def __init__(self, name: str, values: np.ndarray, labels: Optional[List[str]] = None):
+        self.name = name
+        self.values = values          # numbers, or codes into ``labels``
+        self.labels = labels
+        self.nulls: Optional[np.ndarray] = None
+        self.corrupt: Optional[np.ndarray] = None  # token codes, -1 where the cell is intact
+
+    def take(self, index: np.ndarray) -> None:
+        self.values = self.values[index]
+        if self.nulls is not None:
+            self.nulls = self.nulls[index]
+        if self.corrupt is not None:
+            self.corrupt = self.corrupt[index]
+
+    def to_arrow(self):
+        mask = self.nulls
+        if self.labels is not None:
+            codes = pa.array(self.values, mask=mask)
+            column = pa.DictionaryArray.from_arrays(codes, pa.array(self.labels)).cast(pa.string())
+        else:
+            column = pa.array(self.values, mask=mask)
+        if self.corrupt is not None:
+            tokens = pa.array(np.array(CORRUPT_TOKENS, dtype=object)[np.maximum(self.corrupt, 0)])
+            column = pc.if_else(pa.array(self.corrupt >= 0), tokens, column.cast(pa.string()))
+        return column
+
+    def to_pandas(self) -> pd.Series:
+        if self.labels is not None:
+            values = np.array(self.labels, dtype=object)[self.values]
+        else:
+            values = self.values.astype(object) if (self.nulls is not None or self.corrupt is not None) else self.values
+        if self.nulls is not None:
+            values[self.nulls] = None
+        if self.corrupt is not None:
+            hit = self.corrupt >= 0
+            values = values.astype(object)
+            values[hit] = np.array(CORRUPT_TOKENS, dtype=object)[self.corrupt[hit]]
+        return pd.Series(values, name=self.name)
+
+class SyntheticDataset:
+    def __init__(self, columns: List[Dict[str, Any]], seed: int = 0, null_rate: float = 0.0,
+                 null_violation_rate: float = 0.0, duplicate_rate: float = 0.0, corrupt_rate: float = 0.0,
+                 drift: Optional[List[Dict[str, Any]]] = None, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        """``columns``: schema entries (name, dtype, allow_null), each optionally with a distribution"""
+        if chunk_rows <= 0:
+            raise ValueError(f"chunk_rows must be positive, got {chunk_rows}")
+        for name, rate in (("null_rate", null_rate), ("null_violation_rate", null_violation_rate),
+                           ("duplicate_rate", duplicate_rate), ("corrupt_rate", corrupt_rate)):
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1, got {rate}")
+        self.columns = [c if ("dist" in c or "values" in c) else {**_default_spec(c.get("dtype", "object")), **c}
+                        for c in columns]
+        names = {c["name"] for c in self.columns}
+        self.drift = []
+        for d in drift or []:
+            if d["column"] not in names:
+                raise ValueError(f"drift column {d['column']!r} is not in the schema")
+            if d.get("kind", "gradual") not in ("gradual", "abrupt"):
+                raise ValueError(f"drift kind must be gradual or abrupt, got {d['kind']!r}")
+            self.drift.append({"kind": "gradual", "start": 0.0, "end": 1.0, **d})
+        self.seed = int(seed)
+        self.null_rate = null_rate
+        self.null_violation_rate = null_violation_rate
+        self.duplicate_rate = duplicate_rate
+        self.corrupt_rate = corrupt_rate
+        self.chunk_rows = int(chunk_rows)
+
+    @classmethod
+    def from_config(cls, path: Path = SCHEMA_PATH, **overrides: Any) -> "SyntheticDataset":
+        """Columns and defaults from configs/schema.yaml; keyword arguments that are not None win"""
+        schema = yaml.safe_load(Path(path).read_text())
+        generator = schema.get("generator") or {}
+        specs = generator.get("columns") or {}
+        columns = [{**(specs.get(c["name"]) or {}), **c} for c in schema["columns"]]
+        settings = {k: generator[k] for k in ("null_rate", "null_violation_rate", "duplicate_rate",
+                                              "corrupt_rate", "drift") if generator.get(k) is not None}
+        settings.update({k: v for k, v in overrides.items() if v is not None})
+        return cls(columns, **settings)
+
+    # -- generation -----------------------------------------------------------
+
+    def _drift_weight(self, drift: Dict[str, Any], position: np.ndarray) -> np.ndarray:
+        """Share of the drift applied at each row position (0..1 through the dataset)"""
+        if drift["kind"] == "abrupt":
+            return (position >= drift["start"]).astype(np.float64)
+        span = max(drift["end"] - drift["start"], 1e-12)
+        return np.clip((position - drift["start"]) / span, 0.0, 1.0)
+
+    def _numeric(self, spec: Dict[str, Any], rng: np.random.Generator, n: int,
+                 shift: Optional[np.ndarray]) -> np.ndarray:
+        if spec["dist"] == "normal":
+            values = rng.normal(spec["mean"], spec["std"], n)
+            scale = spec["std"]
+        elif spec["dist"] == "uniform":
+            values = rng.uniform(spec["min"], spec["max"] + (1 if spec["dtype"].startswith("int") else 0), n)
+            scale = (spec["max"] - spec["min"]) / np.sqrt(12)
+        else:
+            raise ValueError(f"unknown distribution {spec['dist']!r} for column {spec['name']!r}")
+        if shift is not None:
+            values += shift * scale
+        if "min" in spec or "max" in spec:
+            values = np.clip(values, spec.get("min"), spec.get("max"))
+        if spec["dtype"].startswith("int"):
+            values = np.floor(values) if spec["dist"] == "uniform" else np.rint(values)
+        return values.astype(spec["dtype"])
+
+    def _categorical(self, spec: Dict[str, Any], rng: np.random.Generator, n: int,
+                     shift: Optional[np.ndarray]) -> np.ndarray:
+        weights = np.asarray(spec.get("weights") or [1.0] * len(spec["values"]), dtype=np.float64)
+        if len(weights) != len(spec["values"]):
+            raise ValueError(f"column {spec['name']!r} has {len(spec['values'])} values but {len(weights)} weights")
+        cdf = np.cumsum(weights / weights.sum())
+        u = rng.random(n)
+        codes = np.searchsorted(cdf, u, side="right")
+        if shift is not None:
+            # drifted rows are drawn from the reversed weights instead
+            moved = rng.random(n) < np.clip(shift, 0.0, 1.0)
+            drifted_cdf = np.cumsum(weights[::-1] / weights.sum())
+            codes[moved] = np.searchsorted(drifted_cdf, u[moved], side="right")
+        return np.minimum(codes, len(weights) - 1).astype(np.int32)
+
+    def _chunk(self, index: int, n: int, total: int) -> List[_Column]:
+        rng = np.random.default_rng([self.seed, index])
+        offset = index * self.chunk_rows
+        position = (offset + np.arange(n)) / max(total, 1) if self.drift else None
+        columns = []
+        for spec in self.columns:
+            shift = None
+            for d in self.drift:
+                if d["column"] == spec["name"]:
+                    part = d["magnitude"] * self._drift_weight(d, position)
+                    shift = part if shift is None else shift + part
+            if "values" in spec and spec.get("dtype", "object") not in NUMERIC_DTYPES:
+                columns.append(_Column(spec["name"], self._categorical(spec, rng, n, shift), list(map(str, spec["values"]))))
+            else:
+                columns.append(_Column(spec["name"], self._numeric(spec, rng, n, shift)))
+
+            column = columns[-1]
+            rate = self.null_rate if spec.get("allow_null", False) else self.null_violation_rate
+            if rate > 0:
+                column.nulls = rng.random(n) < rate
+            if self.corrupt_rate > 0 and column.labels is None:
+                hit = rng.random(n) < self.corrupt_rate
+                column.corrupt = np.where(hit, rng.integers(0, len(CORRUPT_TOKENS), n), -1)
+
+        if self.duplicate_rate > 0 and n > 1:
+            # each duplicate copies a random earlier row; following the chain makes it
+            # copy an original row, so every duplicate matches a row that is present
+            source = np.arange(n)
+            dup = np.flatnonzero(rng.random(n) < self.duplicate_rate)
+            dup = dup[dup > 0]
+            source[dup] = (rng.random(len(dup)) * dup).astype(np.int64)
+            while True:
+                resolved = source[source]
+                if np.array_equal(resolved, source):
+                    break
+                source = resolved
+            for column in columns:
+                column.take(source)
+        return columns
+
+    def chunks(self, rows: int) -> Iterator[List[_Column]]:
+        for index, start in enumerate(range(0, rows, self.chunk_rows)):
+            yield self._chunk(index, min(self.chunk_rows, rows - start), rows)
+
+    def tables(self, rows: int) -> Iterator["pa.Table"]:
+        if pa is None:
+            raise ImportError("pyarrow is required for arrow tables; use frames() instead")
+        for columns in self.chunks(rows):
+            yield pa.table({c.name: c.to_arrow() for c in columns})
+
+    def frames(self, rows: int) -> Iterator[pd.DataFrame]:
+        for columns in self.chunks(rows):
+            yield pd.DataFrame({c.name: c.to_pandas() for c in columns})
+
+    def frame(self, rows: int) -> pd.DataFrame:
+        """All ``rows`` in one DataFrame; only for sizes that fit in memory"""
+        frames = [t.to_pandas() for t in self.tables(rows)] if pa is not None else list(self.frames(rows))
+        return pd.concat(frames, ignore_index=True) if len(frames) != 1 else frames[0]
+
+    # -- output ---------------------------------------------------------------
+
+    def write(self, path: Union[str, Path], rows: int, fmt: Optional[str] = None,
+              partition_rows: Optional[int] = None) -> Dict[str, Any]:
+        """Write ``rows`` rows to a file, or to ``path/part-NNNNN.<fmt>`` partitions
+        of ``partition_rows`` rows each; returns a summary"""
+        path = Path(path)
+        fmt = fmt or ("parquet" if path.suffix == ".parquet" else "csv")
+        if fmt not in ("csv", "parquet"):
+            raise ValueError(f"format must be csv or parquet, got {fmt!r}")
+        if fmt == "parquet" and pa is None:
+            raise ImportError("pyarrow is required to write parquet")
+        if partition_rows is not None and partition_rows <= 0:
+            raise ValueError(f"partition_rows must be positive, got {partition_rows}")
+
+        start = time.perf_counter()
+        targets: List[Path] = []
+        writer = None
+        written = 0       # rows in the current file
+        chunks = self.tables(rows) if pa is not None else self.frames(rows)
+
+        def close() -> None:
+            nonlocal writer
+            if writer is not None:
+                writer.close()
+                os.replace(writer.tmp_path, targets[-1])
+                writer = None
+
+        def open_next(schema) -> None:
+            nonlocal writer, written
+            close()
+            if partition_rows:
+                path.mkdir(parents=True, exist_ok=True)
+                targets.append(path / f"part-{len(targets):05d}.{fmt}")
+            else:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                targets.append(path)
+            writer = _Writer(targets[-1], fmt, schema)
+            written = 0
+
+        try:
+            for chunk in chunks:
+                offset = 0
+                while offset < len(chunk):
+                    if writer is None or (partition_rows and written >= partition_rows):
+                        open_next(chunk.schema if pa is not None else None)
+                    take = len(chunk) - offset
+                    if partition_rows:
+                        take = min(take, partition_rows - written)
+                    writer.write(chunk.slice(offset, take) if pa is not None else chunk.iloc[offset:offset + take])
+                    offset += take
+                    written += take
+            if writer is None:  # rows == 0: still leave a file with the header
+                empty = self.tables(1) if pa is not None else self.frames(1)
+                first = next(empty)
+                open_next(first.schema if pa is not None else None)
+                writer.write(first.slice(0, 0) if pa is not None else first.iloc[0:0])
+            close()
+        except BaseException:
+            if writer is not None:
+                writer.abort()
+            raise
+
+        elapsed = time.perf_counter() - start
+        return {
+            "path": str(path), "format": fmt, "rows": rows, "partitions": len(targets) if partition_rows else 0,
+            "bytes": sum(t.stat().st_size for t in targets), "seed": self.seed, "chunk_rows": self.chunk_rows,
+            "seconds": round(elapsed, 3), "rows_per_sec": round(rows / elapsed, 1) if elapsed > 0 and rows else None,
+        }
+
+class _Writer:
+    """Appends chunks to ``<path>.tmp``; the caller renames it once complete"""
+
+    def __init__(self, path: Path, fmt: str, schema=None):
+        self.tmp_path = path.with_name(path.name + ".tmp")
+        self.fmt = fmt
+        self._header = True
+        if pa is None:
+            self._file = open(self.tmp_path, "w", newline="")
+        elif fmt == "parquet":
+            self._file = pq.ParquetWriter(self.tmp_path, schema)
+        else:
+            self._file = pa_csv.CSVWriter(self.tmp_path, schema)
+
+    def write(self, chunk) -> None:
+        if pa is None:
+            chunk.to_csv(self._file, header=self._header, index=False)
+            self._header = False
+        else:
+            self._file.write_table(chunk)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def abort(self) -> None:
+        try:
+            self._file.close()
+        finally:
+            self.tmp_path.unlink(missing_ok=True)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic dataset with the columns of configs/schema.yaml")
+    parser.add_argument("path", type=Path, help="output file, or directory with --partition-rows")
+    parser.add_argument("--rows", type=int, required=True)
+    parser.add_argument("--format", choices=["csv", "parquet"], default=None,
+                        help="default: from the file suffix, else csv")
+    parser.add_argument("--partition-rows", type=int, default=None, help="rows per part-NNNNN file")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help="rows generated at a time")
+    parser.add_argument("--null-rate", type=float, default=None)
+    parser.add_argument("--null-violation-rate", type=float, default=None)
+    parser.add_argument("--duplicate-rate", type=float, default=None)
+    parser.add_argument("--corrupt-rate", type=float, default=None)
+    parser.add_argument("--drift", action="append", type=parse_drift, default=None,
+                        metavar="COLUMN:KIND:MAGNITUDE[:START[:END]]", help="repeatable; replaces the schema's drift")
+    parser.add_argument("--schema", type=Path, default=SCHEMA_PATH)
+    args = parser.parse_args(argv)
+
+    dataset = SyntheticDataset.from_config(
+        args.schema, seed=args.seed, chunk_rows=args.chunk_rows, null_rate=args.null_rate,
+        null_violation_rate=args.null_violation_rate, duplicate_rate=args.duplicate_rate,
+        corrupt_rate=args.corrupt_rate, drift=args.drift)
+    summary = dataset.write(args.path, args.rows, args.format, args.partition_rows)
+    print(f"✅ Wrote {summary['rows']} rows to {summary['path']} ({summary['rows_per_sec']} rows/s)")
+    print(json.dumps(summary, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,11 +3,46 @@ Engineer 1 - Data Synchronization Module
 Syncs real pipeline results to Engineer 4's dashboard data files
 """
 import json
+import yaml
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 import os
+import time
+
+from MLOps_Engineer1.core.ingestion.streaming import AppendCursor, last_row
+from MLOps_Engineer1.core.integration.instrumentation import mean_wall, read_spans, span, summarize
+from MLOps_Engineer1.core.integration.publish import Publisher
+from MLOps_Engineer1.core.integration.sync_worker import SyncEventQueue
+from MLOps_Engineer1.core.monitoring.fairness import compute_fairness, to_dashboard
+from MLOps_Engineer1.core.monitoring.drift import REFERENCE_FILENAME, REPORT_FILENAME, load_or_fit_reference
+from MLOps_Engineer1.core.monitoring.run_ledger import RunLedger
+from MLOps_Engineer1.core.monitoring.spc import SPCEngine
+from MLOps_Engineer1.core.monitoring.timeseries import TimeSeriesStore, to_epoch
+from MLOps_Engineer1.core.profiling.dataset_profile import (
+    DatasetProfile, PROFILE_FILENAME, load_or_build_profile,
+)
+from MLOps_Engineer1.core.profiling.sketches import SketchStore
+from MLOps_Engineer1.core.scoring.batch import latest_run, load_scores
+from MLOps_Engineer1.core.validation.fingerprint import dataset_fingerprint
+
+SKETCH_WINDOW_DAYS = 30
+SPARK_QUANTILES = [0.05, 0.15, 0.25, 0.35, 0.45, 0.55, 0.65, 0.75, 0.85, 0.95]
+DRIFT_FIELDS = ("p_value", "psi_max", "drifted_columns", "rows")
+INGEST_SPANS = ("ingest_data", "ingest_data_stream")
+VALIDATE_SPANS = ("validate_data", "validate_data_stream")
+SPAN_TAIL_BYTES = 2 ** 20  # the control room only needs the last day or so of spans
+# Series other producers publish as JSON; the sync loads them into the time-series store
+IMPORTED_SERIES = {"metrics": ("metrics_timeseries.json", "dates")}
+
+def _row_offsets(chunks):
+    """(rows before the chunk, chunk) for each chunk"""
+    offset = 0
+    for chunk in chunks:
+        yield offset, chunk
+        offset += len(chunk)
 
 class DataSynchronizer:
     def __init__(self):
@@ -15,41 +50,77 @@ class DataSynchronizer:
         self.e1_artifacts = self.base_dir / "MLOps_Engineer1" / "artifacts"
         self.e4_data = self.base_dir / "MLOps_Engineer4" / "data"
         self.e1_data = self.base_dir / "MLOps_Engineer1" / "data"
+        self.data_file = self.e1_data / "adult_small.csv"
+        self.validation_file = self.e1_artifacts / "validation" / "validation_results.json"
+        self.profile_file = self.e1_artifacts / "validation" / PROFILE_FILENAME
+        self.schema_file = self.base_dir / "MLOps_Engineer1" / "configs" / "schema.yaml"
+        self.spc_state_file = self.e1_artifacts / "spc" / "state.json"
+        self.drift_dir = self.e1_artifacts / "drift"
+        self.drift_state_file = self.drift_dir / "state.json"
+        self.timeseries_file = self.e4_data / "timeseries.db"
+        self.ledger = RunLedger(self.e1_artifacts / "runs.db")
+        self.publisher = Publisher(self.e4_data)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Drop the per-sync caches so the next access re-reads from disk"""
+        self._profile: Optional[DatasetProfile] = None
+        self._profile_loaded = False
+        self._validation_results: Optional[Dict[str, Any]] = None
+        self._validation_loaded = False
+        self._spans: Optional[List[Dict[str, Any]]] = None
+        self._sync_started = time.time()
+
+    def _get_profile(self) -> Optional[DatasetProfile]:
+        """Single-pass dataset profile shared by every sync_* method"""
+        if not self._profile_loaded:
+            self._profile = load_or_build_profile(self.data_file, self.profile_file)
+            self._profile_loaded = True
+        return self._profile
+
+    def _get_validation_results(self) -> Optional[Dict[str, Any]]:
+        """Validation results JSON, read at most once per sync"""
+        if not self._validation_loaded:
+            if self.validation_file.exists():
+                with open(self.validation_file, 'r') as f:
+                    self._validation_results = json.load(f)
+            self._validation_loaded = True
+        return self._validation_results
+
+    def _get_spans(self) -> List[Dict[str, Any]]:
+        """Recent step timing spans, read at most once per sync"""
+        if self._spans is None:
+            self._spans = read_spans(tail_bytes=SPAN_TAIL_BYTES)
+        return self._spans
+
+    def _config(self, section: str) -> Dict[str, Any]:
+        """A section of configs/schema.yaml, empty if absent"""
+        if not self.schema_file.exists():
+            return {}
+        return yaml.safe_load(self.schema_file.read_text()).get(section) or {}
         
     def sync_validation_data(self) -> Dict[str, Any]:
         """Sync validation results from E1 pipeline to E4 dashboard"""
-        validation_file = self.e1_artifacts / "validation" / "validation_results.json"
+        validation_results = self._get_validation_results()
         
-        if not validation_file.exists():
+        if validation_results is None:
             return {"error": "No validation results found"}
             
-        # Load real validation results
-        with open(validation_file, 'r') as f:
-            validation_results = json.load(f)
-            
-        # Load the actual dataset to get real metrics
-        data_file = self.e1_data / "adult_small.csv"
-        if data_file.exists():
-            df = pd.read_csv(data_file)
-            
-            # Calculate real missing values
-            missing_values = {}
-            for col in df.columns:
-                missing_count = df[col].isna().sum()
-                if missing_count > 0:
-                    missing_values[col] = int(missing_count)
+        profile = self._get_profile()
+        if profile is not None:
+            missing_values = profile.missing_values
             
             # Create comprehensive validation data
             validation_data = {
-                "row_count": len(df),
-                "column_count": len(df.columns),
+                "row_count": profile.row_count,
+                "column_count": profile.column_count,
                 "missing_values": missing_values,
-                "data_types": {col: str(df[col].dtype) for col in df.columns},
+                "data_types": profile.dtypes,
                 "validation_status": "passed" if validation_results.get("ok", False) else "failed",
                 "last_validated": datetime.now().isoformat(),
-                "quality_score": self._calculate_quality_score(df, missing_values),
+                "quality_score": self._calculate_quality_score(profile),
                 "anomalies_detected": len(validation_results.get("rules", {})),
-                "duplicate_rows": int(df.duplicated().sum()),
+                "duplicate_rows": profile.duplicate_rows,
                 "validation_issues": {
                     "missing_issues": len(validation_results.get("missing", {})),
                     "dtype_issues": len(validation_results.get("dtypes", {})),
@@ -71,83 +142,85 @@ class DataSynchronizer:
                 "error": "Source data file not found"
             }
         
-        # Write to E4 data directory
-        output_file = self.e4_data / "validation.json"
-        with open(output_file, 'w') as f:
-            json.dump(validation_data, f, indent=2)
+        self.publisher.write_json("validation.json", validation_data)
             
         return validation_data
     
     def sync_control_meta(self) -> Dict[str, Any]:
         """Generate real-time control room metadata"""
-        validation_file = self.e1_artifacts / "validation" / "validation_results.json"
+        validation_results = self._get_validation_results()
         
-        # Calculate real metrics based on pipeline results
-        if validation_file.exists():
-            with open(validation_file, 'r') as f:
-                validation_results = json.load(f)
-            
-            success_rate = 100.0 if validation_results.get("ok", False) else 85.0
+        # Status follows the latest validation; the counts come from the run ledger
+        if validation_results is not None:
             status = "active" if validation_results.get("ok", False) else "warning"
             alerts = 0 if validation_results.get("ok", False) else 1
         else:
-            success_rate = 0.0
             status = "error"
             alerts = 1
+        success_rate = self.ledger.success_rate()
+        if success_rate is None:  # no validation run finished in the last 24 hours
+            success_rate = self.ledger.success_rate(window=None)
+        if success_rate is None and validation_results is not None:
+            # An empty ledger (e.g. a fresh install): the latest validation is the only run known
+            success_rate = 100.0 if validation_results.get("ok", False) else 0.0
+        drift_alerts = self._get_drift_alerts_24h()
+        queue = self._get_queue_size()
         
         # Generate realistic control metadata with all required fields
         control_data = {
             "operator_id": "OP-E1-001",
-            "batches_today": self._get_batch_count(),
+            "batches_today": self.ledger.batches_today(),
             "last_update": datetime.now().isoformat(),
             "status": status,
-            "total_processed": self._get_total_processed(),
+            "total_processed": self.ledger.total_processed(),
             "success_rate": success_rate,
             "avg_processing_time": self._get_avg_processing_time(),
+            "avg_sync_time": self._get_avg_sync_time(),
             "alerts": alerts,
-            "system_health": "good" if success_rate > 95 else "warning" if success_rate > 80 else "critical",
+            "system_health": "unknown" if success_rate is None else
+                             "good" if success_rate > 95 else "warning" if success_rate > 80 else "critical",
             # Additional fields required by control room dashboard
-            "drift_alerts_24h": alerts,
-            "ooc_percent": 100.0 - success_rate,  # Out of control percentage
-            "queue": self._get_queue_size(),
-            "time_to_completion": self._get_time_to_completion()
+            "drift_alerts_24h": drift_alerts if drift_alerts is not None else alerts,
+            "ooc_percent": None if success_rate is None else 100.0 - success_rate,  # Out of control percentage
+            "queue": queue,
+            "time_to_completion": self._get_time_to_completion(queue),
+            "step_timings": self._get_step_timings(),
         }
         
-        # Write to E4 data directory
-        output_file = self.e4_data / "control_meta.json"
-        with open(output_file, 'w') as f:
-            json.dump(control_data, f, indent=2)
+        self.publisher.write_json("control_meta.json", control_data)
             
         return control_data
     
     def sync_parameters_data(self) -> Dict[str, Any]:
         """Generate parameters data based on real validation results"""
-        validation_file = self.e1_artifacts / "validation" / "validation_results.json"
-        
-        if validation_file.exists():
-            with open(validation_file, 'r') as f:
-                validation_results = json.load(f)
-            
+        if self._get_validation_results() is not None:
             # Generate parameters based on actual data columns
-            data_file = self.e1_data / "adult_small.csv"
-            if data_file.exists():
-                df = pd.read_csv(data_file)
+            profile = self._get_profile()
+            if profile is not None:
                 parameters = []
                 
-                for i, col in enumerate(df.columns[:4]):  # Limit to first 4 columns
-                    # Generate realistic spark data based on column values
-                    if df[col].dtype in ['int64', 'float64']:
-                        spark_data = df[col].head(10).tolist()
+                # Column shape over the last SKETCH_WINDOW_DAYS of validation runs when
+                # sketches exist: a quantile curve for numerics, heavy-hitter counts otherwise
+                sketch = SketchStore(self.e1_artifacts / "validation" / "sketches").merged(
+                    since=timedelta(days=SKETCH_WINDOW_DAYS))
+                for col in profile.columns[:4]:  # Limit to first 4 columns
+                    col_sketch = sketch.columns.get(col.name) if sketch is not None else None
+                    if col_sketch is not None and col_sketch.tdigest is not None:
+                        spark_data = [round(float(v), 4) for v in col_sketch.tdigest.quantile(SPARK_QUANTILES)]
+                    elif col_sketch is not None and col_sketch.topk is not None:
+                        spark_data = [count for _, count in col_sketch.topk.top(10)]
+                    elif col.is_numeric:
+                        spark_data = list(col.head)
                     else:
                         # For categorical data, use value counts as spark
-                        spark_data = df[col].value_counts().head(10).tolist()
+                        spark_data = [count for _, count in col.value_counts]
                     
                     # Calculate OOC percentage based on missing values
-                    missing_pct = (df[col].isna().sum() / len(df)) * 100
+                    missing_pct = (col.null_count / profile.row_count) * 100 if profile.row_count else 0.0
                     ooc_pct = max(0.1, missing_pct * 2)  # Scale missing values to OOC
                     
                     parameters.append({
-                        "name": col.replace('_', ' ').title(),
+                        "name": col.name.replace('_', ' ').title(),
                         "spark": spark_data,
                         "ooc": ooc_pct,
                         "pass": ooc_pct < 5.0  # Pass if OOC < 5%
@@ -161,46 +234,192 @@ class DataSynchronizer:
         else:
             parameters = []
         
-        output_file = self.e4_data / "parameters.json"
-        with open(output_file, 'w') as f:
-            json.dump(parameters, f, indent=2)
+        self.publisher.write_json("parameters.json", parameters)
         
         return parameters
     
     def sync_spc_data(self) -> Dict[str, Any]:
-        """Generate SPC chart data based on real processing metrics"""
-        # Generate realistic SPC data based on processing times
-        import random
-        
-        batches = list(range(1, 21))  # 20 batches
-        base_value = self._get_avg_processing_time()
-        values = [base_value + random.gauss(0, 0.5) for _ in batches]
-        
-        mean_val = sum(values) / len(values)
-        std_val = (sum((x - mean_val) ** 2 for x in values) / len(values)) ** 0.5
-        
-        spc_data = {
-            "batch": batches,
-            "value": values,
-            "mean": mean_val,
-            "ucl": mean_val + 3 * std_val,
-            "lcl": max(0, mean_val - 3 * std_val)
-        }
+        """Update X-bar/R, EWMA and CUSUM charts with newly arrived batches of the monitored metric"""
+        config = self._config("spc")
+        metric = config.get("metric", "age")
+        size = int(config.get("subgroup_size", 5))
+
+        state = {}
+        if self.spc_state_file.exists():
+            state = json.loads(self.spc_state_file.read_text())
+        engine = None
+        if state.get("metric") == metric and "engine" in state and "cursor" in state:
+            engine = SPCEngine.from_dict(state["engine"])
+        cursor = AppendCursor.from_dict(state["cursor"]) if engine is not None else AppendCursor(self.data_file)
+        pending = state.get("pending", []) if engine is not None else []
+        store = TimeSeriesStore(self.timeseries_file)
+
+        # A different metric/subgroup size, or a source that was replaced rather
+        # than appended to, starts the charts over
+        if engine is None or engine.subgroup_size != size or cursor.path != self.data_file or \
+                (self.data_file.exists() and not cursor.valid):
+            engine, cursor, pending = SPCEngine(subgroup_size=size), AppendCursor(self.data_file), []
+            store.drop("spc")
+
+        if self.data_file.exists() and metric in cursor.columns:
+            # Only the metric column of the rows appended since the last sync is parsed;
+            # values short of a complete subgroup wait in the state for the next one
+            new = [pd.to_numeric(chunk[metric], errors="coerce").dropna().to_numpy(dtype=float)
+                   for chunk in cursor.read(usecols=[metric])]
+            values = np.concatenate([np.asarray(pending, dtype=float), *new])
+            n_new = len(values) // size * size
+            if n_new:
+                points = engine.append_subgroups(values[:n_new].reshape(-1, size))
+                store.append("spc", points["batch"], {name: points[name] for name in
+                             ("value", "range", "ewma", "cusum_pos", "cusum_neg")})
+            pending = values[n_new:].tolist()
+
+        self.spc_state_file.parent.mkdir(parents=True, exist_ok=True)
+        self.spc_state_file.write_text(json.dumps(
+            {"metric": metric, "cursor": cursor.to_dict(), "pending": pending, "engine": engine.to_dict()}))
+
+        spc_data = {"metric": metric, **engine.chart()}
         
-        output_file = self.e4_data / "spc.json"
-        with open(output_file, 'w') as f:
-            json.dump(spc_data, f, indent=2)
+        self.publisher.write_json("spc.json", spc_data)
         
         return spc_data
     
+    def sync_drift_data(self) -> Dict[str, Any]:
+        """Test the rows appended since the last check against the frozen reference profile"""
+        config = self._config("drift")
+        reference_rows = int(config.get("reference_rows", 1000))
+        min_batch = int(config.get("min_batch_rows", 500))
+        alpha = float(config.get("alpha", 0.05))
+
+        if not self.data_file.exists():
+            return {"error": "Source data file not found"}
+        head = pd.read_csv(self.data_file, nrows=reference_rows)
+        if len(head) < reference_rows:
+            return {"status": "collecting reference", "rows": len(head), "reference_rows": reference_rows}
+
+        # The reference binning is fitted once and reused until its rows change
+        reference = load_or_fit_reference(head, self.drift_dir / REFERENCE_FILENAME)
+        state = {}
+        if self.drift_state_file.exists():
+            state = json.loads(self.drift_state_file.read_text())
+        cursor = AppendCursor.from_dict(state["cursor"]) if "cursor" in state else None
+        store = TimeSeriesStore(self.timeseries_file)
+        # A new reference, or a source that was replaced rather than appended to,
+        # starts the timeline over; the cursor then skips the reference rows
+        if state.get("reference_key") != reference.key or cursor is None or \
+                cursor.path != self.data_file or not cursor.valid:
+            state = {"reference_key": reference.key, "skip": reference_rows}
+            cursor = AppendCursor(self.data_file)
+            store.drop("drift")
+
+        # Only the rows appended since the last check are parsed; categorical
+        # columns stay text so they match the reference vocabulary
+        before = cursor.to_dict()
+        skip = state.get("skip", 0)
+        chunks = cursor.read(dtype={name: str for name in reference.categorical})
+        current = reference.histogram_chunks(chunk.iloc[max(0, skip - offset):]
+                                             for offset, chunk in _row_offsets(chunks))
+        if current.rows >= min_batch:
+            report = reference.compare(current, alpha)
+            now = datetime.now()
+            point = {"p_value": report["p_value"], "psi_max": report["psi_max"],
+                     "drifted_columns": len(report["drifted_columns"]), "rows": report["rows"]}
+            # sub-second times, so two checks within one second stay two points
+            store.append("drift", [pd.Timestamp(now).value / 1e9], {field: [value] for field, value in point.items()})
+            self.drift_dir.mkdir(parents=True, exist_ok=True)
+            (self.drift_dir / REPORT_FILENAME).write_text(json.dumps(
+                {"checked_at": now.isoformat(timespec="seconds"), **report}, indent=2))
+            state = {"reference_key": reference.key, "cursor": cursor.to_dict()}
+        else:
+            # Too few new rows: they are read again, with the next ones, on a later sync
+            state["cursor"] = before
+
+        self.drift_state_file.parent.mkdir(parents=True, exist_ok=True)
+        self.drift_state_file.write_text(json.dumps(state))
+
+        # The history stays in the time-series store; the JSON gets the recent checks.
+        # Until the first check the dashboard keeps whatever timeline it has
+        recent = store.tail("drift", int(config.get("timeline_points", 500)), fields=list(DRIFT_FIELDS))
+        if not len(recent):
+            return {"status": "waiting for rows", "new_rows": current.rows, "min_batch_rows": min_batch}
+        timeline = {"dates": [d.isoformat(timespec="seconds") for d in pd.to_datetime(recent["t"], unit="s")]}
+        for field in DRIFT_FIELDS:
+            values = recent[field] if field in recent else pd.Series(np.nan, index=recent.index)
+            cast = int if field in ("drifted_columns", "rows") else float
+            timeline[field] = [None if pd.isna(v) else cast(v) for v in values]
+        self.publisher.write_json("drift_timeline.json", timeline)
+
+        return timeline
+
+    def sync_fairness_data(self) -> Dict[str, Any]:
+        """Per-group and pairwise-intersection fairness metrics of the scored data"""
+        config = self._config("fairness")
+        label = config.get("label", "income")
+        prediction = config.get("prediction", "prediction")
+        version_column = config.get("model_version", "model_version")
+        sensitive = list(config.get("sensitive", []))
+
+        if not self.data_file.exists():
+            return {"error": "Source data file not found"}
+        # Columns, model version and fingerprint come from the header, the last row and the
+        # manifest, so an unchanged input is a cache lookup without parsing the rows
+        columns = AppendCursor(self.data_file).columns
+        if prediction in columns:
+            fingerprint = dataset_fingerprint([self.data_file], self.schema_file)
+            last = last_row(self.data_file, dtype={version_column: str}) if version_column in columns else None
+
+            def load(usecols):
+                return pd.read_csv(self.data_file, usecols=usecols, dtype={version_column: str})
+        else:
+            # Predictions from the newest batch-scoring run, if any
+            run = latest_run()
+            tail = load_scores(Path(run["run_dir"]), last_part=True) if run is not None else pd.DataFrame()
+            columns, fingerprint = list(tail.columns), run["fingerprint"] if run is not None else None
+            last = tail.iloc[-1] if version_column in columns and len(tail) else None
+
+            def load(usecols):
+                return load_scores(Path(run["run_dir"]), columns=usecols)
+        missing = [c for c in [label, prediction, *sensitive] if c not in columns]
+        if missing or not sensitive:
+            # Unscored data: the dashboard keeps whatever fairness data it has
+            return {"status": "skipped", "missing_columns": missing}
+        usecols = list(dict.fromkeys([label, prediction, *sensitive]))
+        if last is not None:
+            # Only the rows scored by the latest model
+            model_version = str(last[version_column])
+            usecols.append(version_column)
+
+            def frame():
+                df = load(usecols)
+                return df[df[version_column].astype(str) == model_version]
+        else:
+            model_version = os.getenv("PULSEAI_MODEL_VERSION", "unversioned")
+
+            def frame():
+                return load(usecols)
+
+        # Cached per model version and data fingerprint; the rows are read only on a miss
+        result = compute_fairness(frame, label, prediction, sensitive, model_version, fingerprint,
+                                  positive=config.get("positive_label"))
+        fairness_data = to_dashboard(result, int(config.get("max_intersections", 20)),
+                                     int(config.get("min_count", 30)))
+
+        self.publisher.write_json("fairness.json", fairness_data)
+
+        return fairness_data
+
+    def sync_timeseries_data(self) -> Dict[str, Any]:
+        """Load the JSON-published series into the time-series store (the dashboard only reads it)"""
+        store = TimeSeriesStore(self.timeseries_file)
+        imported = [series for series, (source, time_key) in IMPORTED_SERIES.items()
+                    if store.import_json(series, self.e4_data / source, time_key)]
+        return {"imported": imported}
+
     def sync_ooc_breakdown(self) -> Dict[str, Any]:
         """Generate OOC breakdown based on real data issues"""
-        validation_file = self.e1_artifacts / "validation" / "validation_results.json"
+        validation_results = self._get_validation_results()
         
-        if validation_file.exists():
-            with open(validation_file, 'r') as f:
-                validation_results = json.load(f)
-            
+        if validation_results is not None:
             # Create breakdown based on actual issues
             parameters = []
             ooc_values = []
@@ -225,78 +444,100 @@ class DataSynchronizer:
             "ooc": ooc_values
         }
         
-        output_file = self.e4_data / "ooc_breakdown.json"
-        with open(output_file, 'w') as f:
-            json.dump(ooc_data, f, indent=2)
+        self.publisher.write_json("ooc_breakdown.json", ooc_data)
         
         return ooc_data
     
     def sync_all_data(self) -> Dict[str, Any]:
         """Sync all data from E1 to E4"""
         results = {}
+        self.refresh()
+        stages = [
+            ("validation", self.sync_validation_data),
+            ("drift", self.sync_drift_data),
+            ("fairness", self.sync_fairness_data),
+            ("control_meta", self.sync_control_meta),
+            ("parameters", self.sync_parameters_data),
+            ("spc", self.sync_spc_data),
+            ("timeseries", self.sync_timeseries_data),
+            ("ooc_breakdown", self.sync_ooc_breakdown),
+        ]
         
-        try:
-            results["validation"] = self.sync_validation_data()
-            results["control_meta"] = self.sync_control_meta()
-            results["parameters"] = self.sync_parameters_data()
-            results["spc"] = self.sync_spc_data()
-            results["ooc_breakdown"] = self.sync_ooc_breakdown()
-            results["sync_timestamp"] = datetime.now().isoformat()
-            results["status"] = "success"
-        except Exception as e:
-            results["status"] = "error"
-            results["error"] = str(e)
+        # Files land one by one (each atomically); the dashboard sees them as one
+        # manifest version once the batch ends
+        with span("sync_all_data"), self.publisher.batch():
+            try:
+                for key, sync in stages:
+                    with span(sync.__name__):
+                        results[key] = sync()
+                results["sync_timestamp"] = datetime.now().isoformat()
+                results["status"] = "success"
+            except Exception as e:
+                results["status"] = "error"
+                results["error"] = str(e)
             
         return results
     
-    def _calculate_quality_score(self, df: pd.DataFrame, missing_values: Dict) -> float:
+    def _calculate_quality_score(self, profile: DatasetProfile) -> float:
         """Calculate data quality score based on completeness and consistency"""
-        total_cells = len(df) * len(df.columns)
-        missing_cells = sum(missing_values.values())
+        total_cells = profile.row_count * profile.column_count
+        missing_cells = sum(profile.missing_values.values())
         completeness = (total_cells - missing_cells) / total_cells if total_cells > 0 else 0
         
         # Factor in duplicates
-        duplicate_penalty = df.duplicated().sum() / len(df) if len(df) > 0 else 0
+        duplicate_penalty = profile.duplicate_rows / profile.row_count if profile.row_count > 0 else 0
         
         quality_score = (completeness * 0.8 - duplicate_penalty * 0.2) * 100
         return max(0.0, min(100.0, quality_score))
     
-    def _get_batch_count(self) -> int:
-        """Get realistic batch count based on validation runs"""
-        # Count validation artifacts or use time-based estimation
-        validation_dir = self.e1_artifacts / "validation"
-        if validation_dir.exists():
-            return len(list(validation_dir.glob("*.json"))) + 12  # Base count
-        return 15
+    def _get_drift_alerts_24h(self) -> Optional[int]:
+        """Drift checks in the last 24 hours whose p-value fell below alpha (None before the first check)"""
+        store = TimeSeriesStore(self.timeseries_file)
+        if store.bounds("drift") is None:
+            return None
+        alpha = float(self._config("drift").get("alpha", 0.05))
+        since = to_epoch([datetime.now() - timedelta(hours=24)])[0]
+        recent = store.query("drift", start=since, fields=["p_value"])
+        if "p_value" not in recent:
+            return 0
+        return int((recent["p_value"] < alpha).sum())
     
-    def _get_total_processed(self) -> int:
-        """Get total processed records"""
-        data_file = self.e1_data / "adult_small.csv"
-        if data_file.exists():
-            df = pd.read_csv(data_file)
-            return len(df)
-        return 32561  # Default adult dataset size
+    def _get_avg_processing_time(self) -> Optional[float]:
+        """Measured seconds per batch: mean ingest + mean validation of the recent runs (None before any)"""
+        spans = self._get_spans()
+        parts = [t for t in (mean_wall(spans, INGEST_SPANS), mean_wall(spans, VALIDATE_SPANS)) if t is not None]
+        return round(sum(parts), 3) if parts else None
     
-    def _get_avg_processing_time(self) -> float:
-        """Calculate average processing time"""
-        # This could be enhanced to read from MLflow metrics
-        return 2.5  # Realistic processing time in seconds
+    def _get_avg_sync_time(self) -> Optional[float]:
+        """Measured seconds per full dashboard sync (None before the first)"""
+        t = mean_wall(self._get_spans(), ["sync_all_data"])
+        return round(t, 3) if t is not None else None
     
     def _get_queue_size(self) -> int:
-        """Get current processing queue size"""
-        # Based on validation status - more items queued if issues found
-        validation_file = self.e1_artifacts / "validation" / "validation_results.json"
-        if validation_file.exists():
-            with open(validation_file, 'r') as f:
-                validation_results = json.load(f)
-            return 0 if validation_results.get("ok", False) else 3
-        return 5  # Default queue size
+        """Runs in progress (run ledger) plus runs finished since this sync began, not yet on the dashboard"""
+        return self.ledger.queue_depth() + len(SyncEventQueue().pending_since(self._sync_started))
+    
+    def _get_time_to_completion(self, queue: int) -> float:
+        """Minutes until the queued runs reach the dashboard: the runs in progress finish, then one more sync"""
+        if not queue:
+            return 0.0
+        in_progress = self.ledger.queue_depth() * (self._get_avg_processing_time() or 0.0)
+        return round((in_progress + (self._get_avg_sync_time() or 0.0)) / 60, 3)
     
-    def _get_time_to_completion(self) -> float:
-        """Get estimated time to completion in minutes"""
-        queue_size = self._get_queue_size()
-        avg_time_per_batch = self._get_avg_processing_time() / 60  # Convert to minutes
-        return queue_size * avg_time_per_batch + 15  # Base completion time
+    def _get_step_timings(self) -> List[Dict[str, Any]]:
+        """Per-step timing summary over the last 24 hours of spans"""
+        since = time.time() - 24 * 3600
+        summary = summarize([s for s in self._get_spans() if s.get("ts", 0) >= since])
+        return [{
+            "step": name,
+            "runs": e["count"],
+            "errors": e["errors"],
+            "mean_wall_s": round(e["mean_wall_s"], 3),
+            "mean_cpu_s": round(e["cpu_s"] / e["count"], 3),
+            "rows_per_sec": round(e["rows_per_sec"], 1) if e["rows_per_sec"] else None,
+            "peak_rss_mb": e["peak_rss_mb"],
+            "last_run": datetime.fromtimestamp(e["last_ts"]).isoformat(timespec="seconds"),
+        } for name, e in sorted(summary.items())]
 
 def sync_pipeline_data():
     """Convenience function to sync all pipeline data"""
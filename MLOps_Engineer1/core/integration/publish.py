@@ -0,0 +1,132 @@
+"""Engineer-1 | Atomic publish of dashboard data files
+
+Every file is written to a temporary file in the target directory and moved
+into place with ``os.replace``, so a reader sees either the old or the new
+content, never a partial write. After a set of files is published,
+``manifest.json`` is rewritten (also atomically) with a new, strictly
+increasing version and the sha256 of every published file. The dashboard
+polls only the manifest and re-reads the files whose hash changed.
+
+Commits from different processes (the sync worker, a manual sync) are
+serialized by an advisory lock on ``.manifest.lock``, so neither loses the
+other's entries. A manifest that exists but cannot be read raises
+:class:`ManifestError` rather than restarting the version count.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+MANIFEST_FILENAME = "manifest.json"
+LOCK_FILENAME = ".manifest.lock"
+
+class ManifestError(RuntimeError):
+    """The manifest exists but is unreadable; publishing would make versions go backwards"""
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+def read_manifest(data_dir: Path) -> Dict[str, Any]:
+    path = Path(data_dir) / MANIFEST_FILENAME
+    try:
+        manifest = json.loads(path.read_text())
+    except FileNotFoundError:
+        return {"version": 0, "files": {}}
+    except (OSError, ValueError) as e:
+        raise ManifestError(f"Cannot read {path}: {e}") from e
+    if not isinstance(manifest.get("version"), int) or not isinstance(manifest.get("files"), dict):
+        raise ManifestError(f"{path} has no version or files")
+    return manifest
+
+@contextmanager
+def manifest_lock(data_dir: Path):
+    """Exclusive lock for a manifest read-modify-write (a no-op where fcntl is unavailable)"""
+    path = Path(data_dir) / LOCK_FILENAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+class Publisher:
+    """Publishes JSON files into ``data_dir`` and versions them in the manifest.
+
+    Outside :meth:`batch` each write commits a manifest version of its own;
+    inside it, all writes are committed together when the batch ends.
+    """
+
+    def __init__(self, data_dir: Path):
+        self.data_dir = Path(data_dir)
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._depth = 0
+
+    def write_json(self, name: str, obj: Any) -> bool:
+        """Publish ``obj`` as ``name``; returns False if the content was unchanged"""
+        data = json.dumps(obj, indent=2).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.data_dir / name
+        current = read_manifest(self.data_dir)["files"].get(name)
+        # Unchanged content is left alone so its mtime and readers' caches stay valid
+        changed = not (current and current["sha256"] == digest
+                       and path.exists() and path.stat().st_size == current["size"])
+        if changed:
+            atomic_write_bytes(path, data)
+            self._pending[name] = {"sha256": digest, "size": len(data)}
+        if self._depth == 0:
+            self.commit()
+        return changed
+
+    def commit(self) -> Dict[str, Any]:
+        """Write a new manifest version if anything was published since the last commit"""
+        if not self._pending:
+            return read_manifest(self.data_dir)
+        with manifest_lock(self.data_dir):
+            manifest = read_manifest(self.data_dir)
+            now = datetime.now().isoformat()
+            version = manifest["version"] + 1
+            for name, entry in self._pending.items():
+                manifest["files"][name] = {**entry, "version": version, "published_at": now}
+            manifest.update(version=version, published_at=now, changed=sorted(self._pending))
+            atomic_write_bytes(self.data_dir / MANIFEST_FILENAME,
+                               json.dumps(manifest, indent=2).encode("utf-8"))
+        self._pending.clear()
+        return manifest
+
+    @contextmanager
+    def batch(self):
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self.commit()
+
+    def changed_since(self, version: int) -> List[str]:
+        """Files published after manifest ``version``"""
+        files = read_manifest(self.data_dir)["files"]
+        return sorted(name for name, entry in files.items() if entry.get("version", 0) > version)
@@ -0,0 +1,282 @@
+"""Engineer-1 | Background dashboard sync
+
+Pipeline steps no longer regenerate the dashboard themselves. When a step
+finishes it drops an event ("validation finished for fingerprint X") into a
+spool directory, ``artifacts/sync/events``, and returns. A worker process
+watches that directory and runs ``sync_pipeline_data`` for the events. A
+burst of events is coalesced into one sync: the worker waits until no new
+event has arrived for ``debounce`` seconds, but never delays a sync by more
+than ``max_delay`` seconds. Events are deleted only after a successful sync.
+A failed sync keeps them and is retried with backoff.
+
+Sync lag is how long the oldest coalesced event waited before the dashboard
+reflected it. The worker writes it after every sync to ``artifacts/sync/status.json``
+and publishes it as ``sync_status.json`` for the control room.
+
+``notify`` starts a worker if none is alive. A worker holds
+``artifacts/sync/worker.lock`` and touches it while running; a lock untouched
+for STALE_AFTER seconds is taken over. PULSEAI_SYNC_WORKER selects the mode:
+  auto (default)  enqueue, and spawn a worker that exits once idle
+  external        enqueue only; a long-running worker (--forever) is managed elsewhere
+  inline          sync in the calling process, as before
+
+    python -m MLOps_Engineer1.core.integration.sync_worker --forever
+    python -m MLOps_Engineer1.core.integration.sync_worker --status
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from MLOps_Engineer1.core.integration.publish import atomic_write_bytes
+
+BASE_DIR = Path(__file__).resolve().parents[2]  # .../MLOps_Engineer1
+SYNC_DIR = BASE_DIR / "artifacts" / "sync"
+EVENTS_DIR = SYNC_DIR / "events"
+STATUS_FILE = SYNC_DIR / "status.json"
+LOCK_FILE = SYNC_DIR / "worker.lock"
+SPAWN_MARKER = SYNC_DIR / "worker.spawned"
+LOG_FILE = SYNC_DIR / "worker.log"
+
+WORKER_MODE = os.getenv("PULSEAI_SYNC_WORKER", "auto").lower()
+STALE_AFTER = 30.0       # seconds without a heartbeat before a worker's lock is taken over
+HEARTBEAT_EVERY = 5.0
+SPAWN_GRACE = 10.0       # a just-spawned worker has this long to take the lock before another is spawned
+IDLE_EXIT = 60.0         # a spawned worker exits after this long without events
+
+class SyncEventQueue:
+    """One JSON file per event; file names sort in arrival order"""
+
+    def __init__(self, root: Path = EVENTS_DIR):
+        self.root = Path(root)
+
+    def put(self, kind: str, **fields: Any) -> Path:
+        event = {"kind": kind, "created_at": time.time(), **fields}
+        path = self.root / f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}.json"
+        atomic_write_bytes(path, json.dumps(event).encode())
+        return path
+
+    def pending(self) -> List[Path]:
+        return sorted(self.root.glob("*.json")) if self.root.exists() else []
+
+    def pending_since(self, ts: float) -> List[Path]:
+        """Pending events queued after epoch time ``ts`` (read from the file names)"""
+        return [p for p in self.pending() if int(p.name[:20]) > ts * 1e9]
+
+    def read(self, paths: List[Path]) -> List[Dict[str, Any]]:
+        events = []
+        for path in paths:
+            try:
+                events.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                continue  # unreadable events still trigger the sync; they are acked with the rest
+        return events
+
+    def ack(self, paths: List[Path]) -> None:
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+def _lock_is_fresh(lock: Path = LOCK_FILE, max_age: float = STALE_AFTER) -> bool:
+    try:
+        return time.time() - lock.stat().st_mtime < max_age
+    except FileNotFoundError:
+        return False
+
+def _acquire_lock(lock: Path = LOCK_FILE) -> bool:
+    lock.parent.mkdir(parents=True, exist_ok=True)
+    for _ in range(2):
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if _lock_is_fresh(lock):
+                return False
+            try:
+                lock.unlink()  # stale: its worker died without releasing it
+            except FileNotFoundError:
+                pass
+            continue
+        with os.fdopen(fd, "w") as f:
+            f.write(str(os.getpid()))
+        return True
+    return False
+
+def _release_lock(lock: Path = LOCK_FILE) -> None:
+    try:
+        if lock.read_text().strip() == str(os.getpid()):
+            lock.unlink()
+    except (FileNotFoundError, ValueError):
+        pass
+
+def _default_sync() -> Dict[str, Any]:
+    from MLOps_Engineer1.core.integration.data_sync import sync_pipeline_data
+    return sync_pipeline_data()
+
+def _publish_status(status: Dict[str, Any]) -> None:
+    """sync_status.json for the control room (outside the sync's own manifest batch)"""
+    from MLOps_Engineer1.core.integration.publish import Publisher
+    Publisher(BASE_DIR.parent / "MLOps_Engineer4" / "data").write_json("sync_status.json", status)
+
+class SyncWorker:
+    def __init__(self, queue: Optional[SyncEventQueue] = None, sync: Callable[[], Dict[str, Any]] = _default_sync,
+                 debounce: float = 1.0, max_delay: float = 10.0, poll: float = 0.25,
+                 status_file: Path = STATUS_FILE, publish_status: Optional[Callable[[Dict[str, Any]], None]] = _publish_status):
+        self.queue = queue or SyncEventQueue()
+        self.sync = sync
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.poll = poll
+        self.status_file = Path(status_file)
+        self.publish_status = publish_status
+        self.failures = 0
+
+    def _coalesce(self) -> List[Path]:
+        """Wait for the burst to settle, then take every pending event"""
+        start = last_arrival = time.monotonic()
+        paths = self.queue.pending()
+        while time.monotonic() - start < self.max_delay:
+            time.sleep(self.poll)
+            now = self.queue.pending()
+            if len(now) != len(paths):
+                paths, last_arrival = now, time.monotonic()
+            elif time.monotonic() - last_arrival >= self.debounce:
+                break
+        return self.queue.pending()
+
+    def run_once(self) -> Optional[Dict[str, Any]]:
+        """Sync for every pending event; None if there were none"""
+        if not self.queue.pending():
+            return None
+        paths = self._coalesce()
+        if not paths:
+            return None  # acked by another worker meanwhile
+        events = self.queue.read(paths)
+        start = time.time()
+        try:
+            result = self.sync()
+            error = result.get("error") if result.get("status") == "error" else None
+        except Exception as e:
+            error = str(e)
+        finished = time.time()
+        oldest = min((e.get("created_at", start) for e in events), default=start)
+        status = {
+            "status": "error" if error else "ok",
+            "error": error,
+            "last_sync_at": datetime.fromtimestamp(finished).isoformat(),
+            "sync_seconds": round(finished - start, 3),
+            "lag_seconds": round(finished - oldest, 3),
+            "events_coalesced": len(paths),
+            "fingerprints": sorted({e["fingerprint"] for e in events if e.get("fingerprint")}),
+            "pending": 0,
+            "failures": 0,
+        }
+        if error:
+            self.failures += 1
+            status.update(failures=self.failures, pending=len(self.queue.pending()))
+        else:
+            self.failures = 0
+            self.queue.ack(paths)
+            status["pending"] = len(self.queue.pending())
+        self._write_status(status)
+        return status
+
+    def _write_status(self, status: Dict[str, Any]) -> None:
+        atomic_write_bytes(self.status_file, json.dumps(status, indent=2).encode())
+        if self.publish_status is not None:
+            try:
+                self.publish_status(status)
+            except Exception as e:
+                print(f"⚠️ Could not publish sync status: {e}")
+
+    def serve(self, idle_exit: Optional[float] = IDLE_EXIT, lock: Path = LOCK_FILE) -> int:
+        """Process events until idle for ``idle_exit`` seconds (forever if None); 1 if another worker runs"""
+        if not _acquire_lock(lock):
+            return 1
+        stop = threading.Event()
+
+        def heartbeat():
+            while not stop.wait(HEARTBEAT_EVERY):
+                lock.touch()
+
+        threading.Thread(target=heartbeat, name="sync-heartbeat", daemon=True).start()
+        idle_since = time.monotonic()
+        try:
+            while True:
+                status = self.run_once()
+                if status is not None:
+                    idle_since = time.monotonic()
+                    if status["status"] == "error":
+                        print(f"⚠️ Dashboard sync failed ({status['error']}); retrying")
+                        time.sleep(min(60.0, 2.0 ** self.failures))
+                    continue
+                if idle_exit is not None and time.monotonic() - idle_since >= idle_exit:
+                    return 0
+                time.sleep(self.poll)
+        finally:
+            stop.set()
+            _release_lock(lock)
+
+def ensure_worker() -> bool:
+    """Spawn a detached worker unless one is alive; True if one was spawned"""
+    if _lock_is_fresh() or _lock_is_fresh(SPAWN_MARKER, SPAWN_GRACE):
+        return False
+    SYNC_DIR.mkdir(parents=True, exist_ok=True)
+    SPAWN_MARKER.touch()
+    kwargs: Dict[str, Any] = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True  # survives the pipeline process
+    with open(LOG_FILE, "a") as log:
+        subprocess.Popen([sys.executable, "-m", "MLOps_Engineer1.core.integration.sync_worker"],
+                         cwd=str(BASE_DIR.parent), stdout=log, stderr=subprocess.STDOUT,
+                         stdin=subprocess.DEVNULL, **kwargs)
+    return True
+
+def notify(kind: str, fingerprint: Optional[str] = None, mode: str = WORKER_MODE) -> None:
+    """Tell the dashboard sync that a step finished; returns without waiting for the sync"""
+    try:
+        if mode == "inline":
+            result = _default_sync()
+            print(f"✅ Data synced to Engineer 4 dashboard: {result.get('status', 'unknown')}")
+            return
+        SyncEventQueue().put(kind, fingerprint=fingerprint, pid=os.getpid())
+        if mode == "auto" and ensure_worker():
+            print(f"🔁 Dashboard sync worker started (log: {LOG_FILE})")
+    except Exception as e:
+        print(f"⚠️ Data sync failed: {e}")
+
+def read_status(path: Path = STATUS_FILE) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return None
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Coalescing background worker for the dashboard sync")
+    parser.add_argument("--forever", action="store_true", help="keep running when idle")
+    parser.add_argument("--idle-exit", type=float, default=IDLE_EXIT, help="seconds idle before exiting")
+    parser.add_argument("--debounce", type=float, default=1.0, help="quiet period that ends a burst of events")
+    parser.add_argument("--max-delay", type=float, default=10.0, help="longest a burst may delay its sync")
+    parser.add_argument("--status", action="store_true", help="print the last sync status and exit")
+    args = parser.parse_args(argv)
+
+    if args.status:
+        status = read_status() or {"status": "never run"}
+        status["pending"] = len(SyncEventQueue().pending())
+        print(json.dumps(status, indent=2))
+        return 0
+    worker = SyncWorker(debounce=args.debounce, max_delay=args.max_delay)
+    return worker.serve(idle_exit=None if args.forever else args.idle_exit)
+
+if __name__ == "__main__":
+    sys.exit(main())
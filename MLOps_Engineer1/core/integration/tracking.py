@@ -0,0 +1,237 @@
+"""Engineer-1 | Non-blocking MLflow logging
+
+Pipeline steps record metrics, params, dicts and artifacts on a
+``QueuedRun``. Each call only queues the record. A background worker creates
+the MLflow run, sends metrics and params in ``log_batch`` calls (up to the
+MLflow limits of 1000 metrics / 100 params per call), uploads dicts and
+artifacts, and terminates the run. A slow or remote tracking store therefore
+never sits on a step's critical path.
+
+Artifacts are copied to a spool directory when they are queued, so a file
+rewritten by the next run cannot change what gets uploaded. Whatever is still
+queued is flushed at interpreter exit; the wait is capped by
+PULSEAI_MLFLOW_FLUSH_TIMEOUT seconds.
+
+PULSEAI_MLFLOW_MODE selects the mode:
+  async (default)  queue and log in the background
+  sync             same records, flushed before the ``with`` block returns
+  off              no-op; mlflow is not imported at all
+
+    with get_tracker().run("validation") as run:
+        run.log_metric("validation_ok", 1.0)
+        run.log_artifact(json_path, "validation")
+"""
+import atexit
+import json
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+MODE = os.getenv("PULSEAI_MLFLOW_MODE", "async").lower()
+FLUSH_TIMEOUT = float(os.getenv("PULSEAI_MLFLOW_FLUSH_TIMEOUT", "30"))
+
+MAX_METRICS_PER_BATCH = 1000
+MAX_PARAMS_PER_BATCH = 100
+
+class QueuedRun:
+    """Records for one MLflow run; every method returns immediately"""
+
+    def __init__(self, tracker: "AsyncTracker", run_name: str, tags: Optional[Dict[str, str]] = None):
+        self._tracker = tracker
+        self.key = uuid.uuid4().hex
+        self._tracker._put(("start", self.key, {"run_name": run_name, "tags": dict(tags or {})}))
+
+    def log_metric(self, key: str, value: float, step: Optional[int] = None) -> None:
+        self._tracker._put(("metric", self.key, (key, float(value), int(time.time() * 1000), step or 0)))
+
+    def log_metrics(self, metrics: Dict[str, float], step: Optional[int] = None) -> None:
+        for key, value in metrics.items():
+            self.log_metric(key, value, step)
+
+    def log_param(self, key: str, value: Any) -> None:
+        self._tracker._put(("param", self.key, (key, str(value))))
+
+    def log_dict(self, dictionary: Dict[str, Any], artifact_file: str) -> None:
+        # snapshot now: the caller may keep mutating its dict
+        snapshot = json.loads(json.dumps(dictionary, default=str))
+        self._tracker._put(("dict", self.key, (snapshot, artifact_file)))
+
+    def log_artifact(self, local_path: Union[str, Path], artifact_path: Optional[str] = None) -> None:
+        if self._tracker.mode == "off":
+            return
+        local_path = Path(local_path)
+        spool = Path(tempfile.mkdtemp(prefix="pulseai-mlflow-"))
+        shutil.copy2(local_path, spool / local_path.name)
+        self._tracker._put(("artifact", self.key, (str(spool / local_path.name), artifact_path)))
+
+    def end(self, status: str = "FINISHED") -> None:
+        self._tracker._put(("end", self.key, status))
+        if self._tracker.mode == "sync":
+            self._tracker.flush()
+
+    def __enter__(self) -> "QueuedRun":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end("FAILED" if exc_type else "FINISHED")
+
+class AsyncTracker:
+    """Queue of MLflow records drained by one background worker"""
+
+    def __init__(self, mode: str = MODE, flush_timeout: float = FLUSH_TIMEOUT, client=None):
+        if mode not in ("async", "sync", "off"):
+            raise ValueError(f"PULSEAI_MLFLOW_MODE must be async, sync or off, got {mode!r}")
+        self.mode = mode
+        self.flush_timeout = flush_timeout
+        self._client = client
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._runs: Dict[str, Optional[str]] = {}  # run key -> MLflow run id (None if creation failed)
+        # metrics and params wait here until a full log_batch, the run's end or a flush
+        self._metrics: Dict[str, list] = {}
+        self._params: Dict[str, list] = {}
+        self.errors: List[str] = []
+        if mode != "off":
+            atexit.register(self.close)
+
+    def run(self, run_name: str, tags: Optional[Dict[str, str]] = None) -> QueuedRun:
+        return QueuedRun(self, run_name, tags)
+
+    def _put(self, item) -> None:
+        if self.mode == "off":
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._work, name="mlflow-logger", daemon=True)
+                self._thread.start()
+        self._queue.put(item)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything queued so far is logged; False on timeout"""
+        if self.mode == "off" or self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(("flush", None, done))
+        return done.wait(self.flush_timeout if timeout is None else timeout)
+
+    def close(self) -> None:
+        if not self.flush():
+            print(f"⚠️ MLflow logging still pending after {self.flush_timeout:g}s at exit; "
+                  f"unsent records are dropped")
+
+    # -- worker ---------------------------------------------------------------
+
+    def _mlflow_client(self):
+        if self._client is None:
+            from mlflow.tracking import MlflowClient
+            self._client = MlflowClient()
+        return self._client
+
+    @staticmethod
+    def _experiment_id(client) -> str:
+        if os.getenv("MLFLOW_EXPERIMENT_ID"):
+            return os.environ["MLFLOW_EXPERIMENT_ID"]
+        name = os.getenv("MLFLOW_EXPERIMENT_NAME")
+        if name:
+            experiment = client.get_experiment_by_name(name)
+            return experiment.experiment_id if experiment else client.create_experiment(name)
+        return "0"  # MLflow's Default experiment
+
+    def _work(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            # take whatever else is already queued, so its metrics share log_batch calls
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._process(batch)
+
+    def _process(self, batch) -> None:
+        for kind, key, payload in batch:
+            try:
+                if kind == "flush":
+                    self._send_batches(list(self._runs))
+                    payload.set()
+                elif kind == "start":
+                    client = self._mlflow_client()
+                    run = client.create_run(self._experiment_id(client), run_name=payload["run_name"],
+                                            tags=payload["tags"] or None)
+                    self._runs[key] = run.info.run_id
+                elif self._runs.get(key) is None:
+                    self._discard(key, kind, payload)  # its run could not be created
+                elif kind == "metric":
+                    self._metrics.setdefault(key, []).append(payload)
+                    if len(self._metrics[key]) >= MAX_METRICS_PER_BATCH:
+                        self._send_batches([key])
+                elif kind == "param":
+                    self._params.setdefault(key, []).append(payload)
+                    if len(self._params[key]) >= MAX_PARAMS_PER_BATCH:
+                        self._send_batches([key])
+                elif kind == "dict":
+                    self._mlflow_client().log_dict(self._runs[key], *payload)
+                elif kind == "artifact":
+                    try:
+                        self._mlflow_client().log_artifact(self._runs[key], *payload)
+                    finally:
+                        shutil.rmtree(Path(payload[0]).parent, ignore_errors=True)
+                elif kind == "end":
+                    self._send_batches([key])
+                    self._mlflow_client().set_terminated(self._runs.pop(key), status=payload)
+            except Exception as e:
+                if kind == "start":
+                    self._runs[key] = None
+                self.errors.append(f"{kind}: {e}")
+                print(f"⚠️ MLflow logging failed ({kind}): {e}")
+
+    def _send_batches(self, keys: List[str]) -> None:
+        """log_batch the waiting metrics and params of these runs"""
+        pending = [(key, self._metrics.pop(key, []), self._params.pop(key, [])) for key in keys]
+        pending = [p for p in pending if (p[1] or p[2]) and self._runs.get(p[0]) is not None]
+        if not pending:
+            return
+        try:
+            from mlflow.entities import Metric, Param
+        except ImportError as e:
+            self.errors.append(f"log_batch: {e}")
+            print(f"⚠️ MLflow logging failed (log_batch): {e}")
+            return
+
+        for key, key_metrics, key_params in pending:
+            run_id = self._runs[key]
+            run_metrics = [Metric(k, v, ts, step) for k, v, ts, step in key_metrics]
+            run_params = [Param(k, v) for k, v in key_params]
+            while run_metrics or run_params:
+                try:
+                    self._mlflow_client().log_batch(run_id, metrics=run_metrics[:MAX_METRICS_PER_BATCH],
+                                                    params=run_params[:MAX_PARAMS_PER_BATCH])
+                except Exception as e:
+                    self.errors.append(f"log_batch: {e}")
+                    print(f"⚠️ MLflow logging failed (log_batch): {e}")
+                run_metrics = run_metrics[MAX_METRICS_PER_BATCH:]
+                run_params = run_params[MAX_PARAMS_PER_BATCH:]
+
+    def _discard(self, key: str, kind: str, payload) -> None:
+        if kind == "artifact":
+            shutil.rmtree(Path(payload[0]).parent, ignore_errors=True)
+        elif kind == "end":
+            self._runs.pop(key, None)
+
+_tracker: Optional[AsyncTracker] = None
+_tracker_lock = threading.Lock()
+
+def get_tracker() -> AsyncTracker:
+    """Process-wide tracker, so every step shares one queue and worker"""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = AsyncTracker()
+        return _tracker
@@ -0,0 +1,388 @@
+"""Engineer-1 | Vectorized data drift engine
+
+Compares a batch of rows against a frozen reference profile without an
+external monitoring service. The reference is binned once: numeric columns
+on a fine grid of reference quantiles (``bins * resolution`` bins), and
+categorical columns on their most frequent values plus an "other" slot.
+Every column also has a missing-value slot. The binning is saved to a
+pickle-free ``.npz`` and reused for every later batch.
+
+A batch is reduced to one counts matrix per column kind. All numeric columns
+are sorted in a single ``np.sort`` call and their counts read off at the
+reference edges. All categorical codes are counted in a single
+``np.bincount``. Counts are additive, so a batch can be histogrammed chunk by
+chunk. The tests then run on the ``(columns x bins)`` matrices at once:
+
+* PSI and chi-square on ``bins`` quantile bins (numeric) or the category slots;
+* two-sample Kolmogorov-Smirnov on the fine numeric grid (a slight
+  underestimate of the exact statistic).
+
+A column's p-value is its KS p-value if numeric, chi-square otherwise. The
+batch p-value is the Bonferroni-adjusted minimum over columns.
+
+    python -m MLOps_Engineer1.core.monitoring.drift reference.csv current.csv
+    python -m MLOps_Engineer1.core.monitoring.drift --bench --rows 1000000 --columns 300
+"""
+import argparse
+import hashlib
+import json
+import math
+import sys
+import time
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+BASE_DIR = Path(__file__).resolve().parents[2]  # .../MLOps_Engineer1
+DRIFT_DIR = BASE_DIR / "artifacts" / "drift"
+REFERENCE_FILENAME = "reference.npz"
+REPORT_FILENAME = "latest_report.json"
+REFERENCE_VERSION = 1
+
+PSI_BINS = 10          # quantile bins for PSI / chi-square
+KS_RESOLUTION = 10     # fine bins per PSI bin for the KS statistic
+MAX_CATEGORIES = 32    # categorical slots before values fall into "other"
+PSI_EPS = 1e-4         # floor on bin shares so empty bins keep PSI finite
+PSI_THRESHOLD = 0.2    # conventional "significant shift" level
+_ITER = 300            # series / continued-fraction terms for the chi-square tail
+
+def reference_key(df: pd.DataFrame) -> str:
+    """Content key of the rows a reference is fitted on"""
+    hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return f"{len(df)}:{list(df.columns)}:{hashlib.sha256(hashes.tobytes()).hexdigest()}"
+
+def _sorted_columns(df: pd.DataFrame, columns: List[str]):
+    """Each numeric column's values sorted, as one (columns, rows) matrix with NaN last,
+    plus the number of non-missing values per column. Non-numeric values become NaN."""
+    if not columns:
+        return np.empty((0, len(df))), np.zeros(0, dtype=np.int64)
+    block = df if list(df.columns) == list(columns) else df[columns]
+    if not all(pd.api.types.is_numeric_dtype(t) for t in block.dtypes):
+        block = block.apply(pd.to_numeric, errors="coerce")
+    # pandas keeps a same-dtype block column-major, so the transpose is usually free
+    X = np.ascontiguousarray(block.to_numpy(dtype=np.float64, na_value=np.nan).T)
+    S = np.sort(X, axis=1)
+    present = np.array([np.searchsorted(row, np.inf, side="right") for row in S], dtype=np.int64)
+    return S, present
+
+class Histogram:
+    """Counts of one batch on a reference's bins; histograms of chunks add up"""
+
+    def __init__(self, numeric: np.ndarray, categorical: np.ndarray, rows: int):
+        self.numeric = numeric          # (numeric columns, fine bins + 1 missing)
+        self.categorical = categorical  # (categorical columns, MAX_CATEGORIES + other + missing)
+        self.rows = rows
+
+    def merge(self, other: "Histogram") -> "Histogram":
+        return Histogram(self.numeric + other.numeric, self.categorical + other.categorical,
+                         self.rows + other.rows)
+
+    def __add__(self, other: "Histogram") -> "Histogram":
+        return self.merge(other)
+
+class ReferenceProfile:
+    """Frozen binning of the reference data plus the reference's own counts"""
+
+    def __init__(self, numeric: List[str], edges: np.ndarray, categorical: List[str],
+                 vocab: List[List[str]], bins: int = PSI_BINS, resolution: int = KS_RESOLUTION,
+                 key: str = ""):
+        self.numeric = list(numeric)
+        self.edges = np.asarray(edges, dtype=np.float64).reshape(len(self.numeric), -1)
+        self.categorical = list(categorical)
+        self.vocab = [list(v) for v in vocab]
+        self.bins = bins
+        self.resolution = resolution
+        self.key = key
+        self.counts: Optional[Histogram] = None
+        self._indexers = [pd.Index(v) for v in self.vocab]
+
+    @property
+    def columns(self) -> List[str]:
+        return self.numeric + self.categorical
+
+    @classmethod
+    def fit(cls, df: pd.DataFrame, bins: int = PSI_BINS, resolution: int = KS_RESOLUTION,
+            key: str = "") -> "ReferenceProfile":
+        """Bin edges from the reference quantiles (all numeric columns in one call)"""
+        numeric = [c for c in df.columns
+                   if pd.api.types.is_numeric_dtype(df[c]) and not pd.api.types.is_bool_dtype(df[c])
+                   and df[c].notna().any()]
+        categorical = [c for c in df.columns if c not in numeric]
+        quantiles = np.linspace(0.0, 1.0, bins * resolution + 1)[1:-1]
+        S, present = _sorted_columns(df, numeric)
+        # linear-interpolated quantiles of the non-missing values, read off the sorted rows
+        pos = quantiles[None, :] * (np.maximum(present, 1) - 1)[:, None]
+        lo = np.floor(pos).astype(np.int64)
+        hi = np.minimum(lo + 1, np.maximum(present, 1)[:, None] - 1)
+        frac = pos - lo
+        edges = np.take_along_axis(S, lo, axis=1) * (1 - frac) + np.take_along_axis(S, hi, axis=1) * frac
+        vocab = [[str(v) for v in df[c].dropna().astype(str).value_counts().index[:MAX_CATEGORIES]]
+                 for c in categorical]
+        profile = cls(numeric, edges, categorical, vocab, bins, resolution, key)
+        profile.counts = profile.histogram(df, sorted_numeric=(S, present))
+        return profile
+
+    def histogram(self, df: pd.DataFrame, sorted_numeric=None) -> Histogram:
+        rows = len(df)
+        # numeric: sort every column once, then the count at or below each edge is a position
+        width = self.edges.shape[1] + 2
+        numeric = np.zeros((len(self.numeric), width), dtype=np.int64)
+        if len(self.numeric) and rows:
+            S, present = sorted_numeric or _sorted_columns(df, self.numeric)
+            cdf = np.empty((len(self.numeric), width - 1), dtype=np.int64)
+            for j in range(len(self.numeric)):
+                cdf[j, :-1] = np.searchsorted(S[j, :present[j]], self.edges[j], side="right")
+            cdf[:, -1] = present
+            numeric[:, 0] = cdf[:, 0]
+            numeric[:, 1:-1] = np.diff(cdf, axis=1)
+            numeric[:, -1] = rows - present
+
+        # categorical: slot codes for every column, counted by one bincount
+        slots = MAX_CATEGORIES + 2
+        categorical = np.zeros((len(self.categorical), slots), dtype=np.int64)
+        if len(self.categorical) and rows:
+            codes = np.empty((len(self.categorical), rows), dtype=np.int64)
+            for j, (name, index) in enumerate(zip(self.categorical, self._indexers)):
+                # factorize first so each distinct value is looked up once
+                local, uniques = pd.factorize(df[name])
+                lookup = index.get_indexer(pd.Index(uniques).astype(str))
+                lookup = np.where(lookup < 0, MAX_CATEGORIES, lookup)
+                codes[j] = np.where(local < 0, MAX_CATEGORIES + 1, lookup[local]) + j * slots
+            categorical = np.bincount(codes.ravel(), minlength=len(self.categorical) * slots)
+            categorical = categorical.reshape(len(self.categorical), slots)
+        return Histogram(numeric, categorical, rows)
+
+    def histogram_chunks(self, chunks: Iterable[pd.DataFrame]) -> Histogram:
+        total = Histogram(np.zeros_like(self.counts.numeric), np.zeros_like(self.counts.categorical), 0)
+        for chunk in chunks:
+            total = total + self.histogram(chunk)
+        return total
+
+    def _coarse(self, fine: np.ndarray) -> np.ndarray:
+        """Fine numeric bins summed into ``bins`` quantile bins, missing slot kept"""
+        starts = np.arange(0, self.bins * self.resolution, self.resolution)
+        return np.concatenate((np.add.reduceat(fine[:, :-1], starts, axis=1), fine[:, -1:]), axis=1)
+
+    def compare(self, current, alpha: float = 0.05) -> Dict[str, Any]:
+        """Drift report of ``current`` (a DataFrame or a :class:`Histogram`) against the reference"""
+        cur = current if isinstance(current, Histogram) else self.histogram(current)
+        ref = self.counts
+        num_ref, num_cur = self._coarse(ref.numeric), self._coarse(cur.numeric)
+        psi_values = np.concatenate((psi(num_ref, num_cur), psi(ref.categorical, cur.categorical)))
+        chi2_stat, chi2_p = (np.concatenate(pair) for pair in zip(
+            chi2_test(num_ref, num_cur), chi2_test(ref.categorical, cur.categorical)))
+        ks_stat, ks_p = ks_test(ref.numeric[:, :-1], cur.numeric[:, :-1])
+        n_num = len(self.numeric)
+        p_values = np.concatenate((ks_p, chi2_p[n_num:]))
+        drifted = (p_values < alpha) | (psi_values > PSI_THRESHOLD)
+
+        columns = {}
+        for i, name in enumerate(self.columns):
+            columns[name] = {
+                "kind": "numeric" if i < n_num else "categorical",
+                "psi": _round(psi_values[i]),
+                "chi2": _round(chi2_stat[i]),
+                "chi2_p_value": _round(chi2_p[i]),
+                "ks": _round(ks_stat[i]) if i < n_num else None,
+                "ks_p_value": _round(ks_p[i]) if i < n_num else None,
+                "p_value": _round(p_values[i]),
+                "drifted": bool(drifted[i]),
+            }
+        finite = p_values[~np.isnan(p_values)]
+        return {
+            "rows": cur.rows,
+            "reference_rows": ref.rows,
+            "alpha": alpha,
+            "p_value": _round(min(1.0, float(finite.min()) * len(finite))) if len(finite) else None,
+            "psi_max": _round(np.nanmax(psi_values)) if len(psi_values) and cur.rows else None,
+            "drifted_columns": [name for name, col in columns.items() if col["drifted"]],
+            "columns": columns,
+        }
+
+    def save(self, path: Path) -> Path:
+        meta = {"version": REFERENCE_VERSION, "numeric": self.numeric, "categorical": self.categorical,
+                "vocab": self.vocab, "bins": self.bins, "resolution": self.resolution, "key": self.key,
+                "rows": self.counts.rows}
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez_compressed(f, meta=np.array(json.dumps(meta)), edges=self.edges,
+                                numeric=self.counts.numeric, categorical=self.counts.categorical)
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["ReferenceProfile"]:
+        """The saved reference, or None if it is missing or from another format version"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.get("version") != REFERENCE_VERSION:
+                return None
+            profile = cls(meta["numeric"], data["edges"], meta["categorical"], meta["vocab"],
+                          meta["bins"], meta["resolution"], meta["key"])
+            profile.counts = Histogram(data["numeric"].copy(), data["categorical"].copy(), meta["rows"])
+        return profile
+
+def load_or_fit_reference(df: pd.DataFrame, path: Path) -> ReferenceProfile:
+    """Reuse the saved reference if it was fitted on the same rows, otherwise fit and save it"""
+    key = reference_key(df)
+    profile = ReferenceProfile.load(path)
+    if profile is None or profile.key != key:
+        profile = ReferenceProfile.fit(df, key=key)
+        profile.save(path)
+    return profile
+
+def load_report(drift_dir: Path = DRIFT_DIR) -> Optional[Dict[str, Any]]:
+    path = Path(drift_dir) / REPORT_FILENAME
+    return json.loads(path.read_text()) if path.exists() else None
+
+def _round(x, digits: int = 6):
+    x = float(x)
+    return None if math.isnan(x) else round(x, digits)
+
+def _shares(counts: np.ndarray) -> np.ndarray:
+    total = counts.sum(axis=1, keepdims=True)
+    return counts / np.where(total == 0, 1, total)
+
+def psi(ref: np.ndarray, cur: np.ndarray, eps: float = PSI_EPS) -> np.ndarray:
+    """Population stability index per row of two (columns x bins) count matrices"""
+    p = np.maximum(_shares(ref), eps)
+    q = np.maximum(_shares(cur), eps)
+    out = ((q - p) * np.log(q / p)).sum(axis=1)
+    return np.where((ref.sum(axis=1) == 0) | (cur.sum(axis=1) == 0), np.nan, out)
+
+def chi2_test(ref: np.ndarray, cur: np.ndarray):
+    """Chi-square test of homogeneity per row: (statistic, p-value); bins empty in both are ignored"""
+    ref = ref.astype(np.float64)
+    cur = cur.astype(np.float64)
+    n_ref = ref.sum(axis=1, keepdims=True)
+    n_cur = cur.sum(axis=1, keepdims=True)
+    total = ref + cur
+    n = n_ref + n_cur
+    with np.errstate(divide="ignore", invalid="ignore"):
+        e_ref = total * n_ref / n
+        e_cur = total * n_cur / n
+        terms = np.where(e_ref > 0, (ref - e_ref) ** 2 / e_ref, 0.0) + \
+            np.where(e_cur > 0, (cur - e_cur) ** 2 / e_cur, 0.0)
+    stat = terms.sum(axis=1)
+    dof = (total > 0).sum(axis=1) - 1
+    valid = (n_ref[:, 0] > 0) & (n_cur[:, 0] > 0)
+    p = np.where(dof > 0, chi2_sf(stat, np.maximum(dof, 1)), 1.0)
+    return np.where(valid, stat, np.nan), np.where(valid, p, np.nan)
+
+def ks_test(ref: np.ndarray, cur: np.ndarray):
+    """Two-sample KS on binned counts per row: (statistic, asymptotic p-value)"""
+    n_ref = ref.sum(axis=1)
+    n_cur = cur.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cdf_ref = np.cumsum(ref, axis=1) / n_ref[:, None]
+        cdf_cur = np.cumsum(cur, axis=1) / n_cur[:, None]
+        d = np.abs(cdf_ref - cdf_cur).max(axis=1) if ref.shape[1] else np.zeros(len(ref))
+        n_eff = n_ref * n_cur / (n_ref + n_cur)
+    valid = (n_ref > 0) & (n_cur > 0)
+    p = kolmogorov_sf(np.where(valid, d, 0.0), np.where(valid, n_eff, 1.0))
+    return np.where(valid, d, np.nan), np.where(valid, p, np.nan)
+
+def kolmogorov_sf(d: np.ndarray, n_eff: np.ndarray) -> np.ndarray:
+    """P(D > d) for the two-sample KS statistic (Stephens' small-sample correction)"""
+    sqrt_n = np.sqrt(n_eff)
+    lam = (sqrt_n + 0.12 + 0.11 / sqrt_n) * d
+    k = np.arange(1, 101)[:, None]
+    terms = 2.0 * (-1.0) ** (k - 1) * np.exp(-2.0 * k ** 2 * lam[None, :] ** 2)
+    p = terms.sum(axis=0)
+    # the alternating series is useless near lambda=0, where the tail probability is 1
+    return np.clip(np.where(lam < 0.2, 1.0, p), 0.0, 1.0)
+
+def chi2_sf(x: np.ndarray, dof: np.ndarray) -> np.ndarray:
+    """Chi-square upper tail probability, i.e. the regularized gamma Q(dof/2, x/2)"""
+    a, x = np.broadcast_arrays(np.asarray(dof, dtype=np.float64) / 2.0, np.asarray(x, dtype=np.float64) / 2.0)
+    out = np.ones(a.shape)
+    log_gamma = np.array([math.lgamma(v) for v in a.ravel()]).reshape(a.shape)
+    tiny = 1e-300
+    with np.errstate(divide="ignore", over="ignore", under="ignore", invalid="ignore"):
+        prefix = np.exp(-x + a * np.log(x) - log_gamma)
+        series = (x < a + 1) & (x > 0)
+        if series.any():
+            # lower tail P by its power series, Q = 1 - P
+            aa, xx = a[series], x[series]
+            term = 1.0 / aa
+            total = term.copy()
+            ap = aa.copy()
+            for _ in range(_ITER):
+                ap += 1.0
+                term *= xx / ap
+                total += term
+            out[series] = 1.0 - total * prefix[series]
+        frac = x >= a + 1
+        if frac.any():
+            # upper tail Q by its continued fraction (modified Lentz)
+            aa, xx = a[frac], x[frac]
+            b = xx + 1.0 - aa
+            c = np.full(aa.shape, 1.0 / tiny)
+            d = 1.0 / b
+            h = d.copy()
+            for i in range(1, _ITER):
+                an = -i * (i - aa)
+                b = b + 2.0
+                d = an * d + b
+                d = np.where(np.abs(d) < tiny, tiny, d)
+                c = b + an / c
+                c = np.where(np.abs(c) < tiny, tiny, c)
+                d = 1.0 / d
+                h *= d * c
+            out[frac] = prefix[frac] * h
+    return np.clip(out, 0.0, 1.0)
+
+def _synthetic_chunks(rows: int, columns: int, chunksize: int, shift: float = 0.0, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    names = [f"x{i}" for i in range(columns)]
+    for start in range(0, rows, chunksize):
+        n = min(chunksize, rows - start)
+        # column-major like a frame parsed from CSV
+        yield pd.DataFrame(rng.normal(shift, 1.0, size=(columns, n)).T, columns=names)
+
+def benchmark(rows: int, columns: int, chunksize: int = 100_000, reference_rows: int = 100_000) -> Dict[str, Any]:
+    """Time a full check of ``rows x columns`` numeric data against a fitted reference"""
+    start = time.perf_counter()
+    reference = ReferenceProfile.fit(next(_synthetic_chunks(reference_rows, columns, reference_rows, seed=1)))
+    fit_s = time.perf_counter() - start
+    hist, hist_s = None, 0.0
+    for chunk in _synthetic_chunks(rows, columns, chunksize, shift=0.01):
+        start = time.perf_counter()  # data generation is not timed
+        part = reference.histogram(chunk)
+        hist = part if hist is None else hist + part
+        hist_s += time.perf_counter() - start
+    start = time.perf_counter()
+    report = reference.compare(hist)
+    tests_s = time.perf_counter() - start
+    return {"rows": rows, "columns": columns, "reference_rows": reference_rows, "fit_s": round(fit_s, 3),
+            "histogram_s": round(hist_s, 3), "tests_s": round(tests_s, 4),
+            "total_s": round(hist_s + tests_s, 3), "p_value": report["p_value"],
+            "drifted_columns": len(report["drifted_columns"])}
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Data drift of a CSV against a reference CSV")
+    parser.add_argument("reference", nargs="?", type=Path)
+    parser.add_argument("current", nargs="?", type=Path)
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--bench", action="store_true", help="time a synthetic full check instead")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--columns", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        print(json.dumps(benchmark(args.rows, args.columns, args.chunksize), indent=2))
+        return 0
+    if args.reference is None or args.current is None:
+        parser.error("reference and current CSVs are required unless --bench is given")
+    reference = ReferenceProfile.fit(pd.read_csv(args.reference))
+    current = reference.histogram_chunks(pd.read_csv(args.current, chunksize=args.chunksize))
+    print(json.dumps(reference.compare(current, args.alpha), indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""Engineer-1 | Sliced fairness metrics
+
+Accuracy, TPR, FPR and selection rate for every group of each sensitive
+attribute and every pairwise intersection of two attributes. Each row's
+outcome is encoded as one of four confusion cells (tn, fp, fn, tp). One
+``np.bincount`` per attribute or attribute pair then counts the cells of all
+of its slices at once. The metrics for every slice are computed together
+from the stacked counts.
+
+Cost is linear in rows per attribute family. A pair of attributes never
+allocates more slots than there are rows: when the cross product of their
+levels is larger, only the observed combinations are numbered. Results are
+cached per (model version, data fingerprint, settings) under
+``artifacts/fairness/cache``.
+
+    python -m MLOps_Engineer1.core.monitoring.fairness scored.csv --label income --positive ">50K" \\
+        --prediction prediction --sensitive workclass education_num
+    python -m MLOps_Engineer1.core.monitoring.fairness --bench --rows 5000000 --levels 50 40 30 20
+"""
+import argparse
+import hashlib
+import io
+import json
+import sys
+import time
+from datetime import datetime
+from itertools import combinations
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from MLOps_Engineer1.core.integration.publish import atomic_write_bytes
+
+BASE_DIR = Path(__file__).resolve().parents[2]  # .../MLOps_Engineer1
+CACHE_DIR = BASE_DIR / "artifacts" / "fairness" / "cache"
+
+METRICS = ("accuracy", "tpr", "fpr", "selection_rate")
+
+def _as_bool(values, positive=None) -> np.ndarray:
+    values = pd.Series(values)
+    if positive is not None:
+        return (values.astype(str) == str(positive)).to_numpy()
+    return values.astype(bool).to_numpy()
+
+def slice_metrics(y_true, y_pred, sensitive: pd.DataFrame, intersections: bool = True,
+                  min_count: int = 1) -> pd.DataFrame:
+    """One row per slice with at least ``min_count`` rows: slice, kind, attributes, count and METRICS.
+
+    ``y_true`` and ``y_pred`` are boolean (positive class) arrays aligned with ``sensitive``.
+    Missing attribute values form a group of their own.
+    """
+    y_true = np.asarray(y_true, dtype=bool)
+    y_pred = np.asarray(y_pred, dtype=bool)
+    outcome = (y_true.astype(np.int64) << 1) | y_pred  # 0 tn, 1 fp, 2 fn, 3 tp
+    n = len(outcome)
+
+    codes, levels = {}, {}
+    for name in sensitive.columns:
+        c, uniques = pd.factorize(sensitive[name], use_na_sentinel=False)
+        codes[name] = c.astype(np.int64)
+        levels[name] = np.asarray(pd.Index(uniques).astype(str), dtype=object)
+
+    families: List[Sequence[str]] = [(name,) for name in sensitive.columns]
+    if intersections:
+        families += list(combinations(sensitive.columns, 2))
+
+    counts, labels, kinds, attrs = [], [], [], []
+    for family in families:
+        if len(family) == 1:
+            name = family[0]
+            code, slots = codes[name], len(levels[name])
+            parts = [np.arange(slots)]
+        else:
+            a, b = family
+            ka, kb = len(levels[a]), len(levels[b])
+            code, slots = codes[a] * kb + codes[b], ka * kb
+            observed = None
+            if slots > n:
+                # number only the combinations that occur, so slots never exceed rows
+                observed, code = np.unique(code, return_inverse=True)
+                slots = len(observed)
+            combo = observed if observed is not None else np.arange(slots)
+            parts = [combo // kb, combo % kb]
+        cells = np.bincount(code * 4 + outcome, minlength=slots * 4).reshape(slots, 4)
+        keep = cells.sum(axis=1) >= max(min_count, 1)
+        counts.append(cells[keep])
+        label = None
+        for name, idx in zip(family, parts):
+            term = name + "=" + pd.Series(levels[name][idx[keep]], dtype=object)
+            label = term if label is None else label + " & " + term
+        labels.append(label)
+        kinds.append(np.full(int(keep.sum()), "group" if len(family) == 1 else "intersection", dtype=object))
+        attrs.append(np.full(int(keep.sum()), " & ".join(family), dtype=object))
+
+    if not counts:
+        return pd.DataFrame(columns=["slice", "kind", "attributes", "count", *METRICS])
+    cells = np.concatenate(counts).astype(np.float64)
+    tn, fp, fn, tp = cells.T
+    total = cells.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        metrics = {
+            "accuracy": (tp + tn) / total,
+            "tpr": tp / (tp + fn),
+            "fpr": fp / (fp + tn),
+            "selection_rate": (tp + fp) / total,
+        }
+    return pd.DataFrame({
+        "slice": pd.concat(labels, ignore_index=True),
+        "kind": np.concatenate(kinds),
+        "attributes": np.concatenate(attrs),
+        "count": total.astype(np.int64),
+        **metrics,
+    })
+
+def overall_metrics(y_true, y_pred) -> Dict[str, float]:
+    frame = slice_metrics(y_true, y_pred, pd.DataFrame({"all": np.zeros(len(np.asarray(y_true)), dtype=np.int8)}))
+    row = frame.iloc[0] if len(frame) else None
+    return {m: (None if row is None or pd.isna(row[m]) else float(row[m])) for m in METRICS}
+
+class FairnessCache:
+    """Slice tables keyed by (model version, data fingerprint, settings), one JSON file each"""
+
+    def __init__(self, root: Path = CACHE_DIR, max_entries: int = 64):
+        self.root = Path(root)
+        self.max_entries = max_entries
+
+    @staticmethod
+    def key(model_version: str, fingerprint: str, settings: Dict[str, Any]) -> str:
+        raw = json.dumps([model_version, fingerprint, settings], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()[:24]
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The cached entry ({"meta", "slices"}) or None"""
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            doc = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        path.touch()  # most recently used survives eviction
+        slices = pd.read_json(io.StringIO(json.dumps(doc["slices"])), orient="split", precise_float=True)
+        return {"meta": doc["meta"], "slices": slices}
+
+    def put(self, key: str, slices: pd.DataFrame, meta: Dict[str, Any]) -> Path:
+        path = self._path(key)
+        doc = {"meta": meta, "slices": json.loads(slices.to_json(orient="split", index=False, double_precision=15))}
+        # latest() may be read by the dashboard at any moment, so never expose a partial file
+        atomic_write_bytes(path, json.dumps(doc).encode("utf-8"))
+        entries = sorted(self.root.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for stale in entries[:max(0, len(entries) - self.max_entries)]:
+            stale.unlink()
+        return path
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """The most recently computed or used entry"""
+        entries = sorted(self.root.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        return self.get(entries[-1].stem) if entries else None
+
+def compute_fairness(frame: Union[pd.DataFrame, Callable[[], pd.DataFrame]], label: str, prediction: str,
+                     sensitive: Sequence[str], model_version: str, fingerprint: str, positive=None,
+                     intersections: bool = True, cache: Optional[FairnessCache] = None) -> Dict[str, Any]:
+    """Slice metrics of a scored frame, reused from the cache for a known model version + data.
+
+    ``frame`` may be a callable returning the frame, so that the rows are only
+    loaded on a cache miss.
+    """
+    cache = cache or FairnessCache()
+    settings = {"label": label, "prediction": prediction, "sensitive": list(sensitive),
+                "positive": positive, "intersections": intersections}
+    key = cache.key(model_version, fingerprint, settings)
+    entry = cache.get(key)
+    if entry is not None:
+        return entry
+    if callable(frame):
+        frame = frame()
+    y_true = _as_bool(frame[label], positive)
+    y_pred = _as_bool(frame[prediction], positive)
+    slices = slice_metrics(y_true, y_pred, frame[list(sensitive)], intersections)
+    meta = {"model_version": model_version, "fingerprint": fingerprint, "rows": len(frame),
+            "overall": overall_metrics(y_true, y_pred), "computed_at": datetime.now().isoformat(), **settings}
+    cache.put(key, slices, meta)
+    return {"meta": meta, "slices": slices}
+
+def to_dashboard(result: Dict[str, Any], max_intersections: int = 20, min_count: int = 30) -> Dict[str, Any]:
+    """fairness.json: every group plus the least accurate sufficiently large intersections"""
+    slices = result["slices"]
+    groups = slices[slices["kind"] == "group"]
+    worst = slices[(slices["kind"] == "intersection") & (slices["count"] >= min_count)]
+    worst = worst.nsmallest(max_intersections, "accuracy")
+    shown = pd.concat([groups, worst], ignore_index=True)
+    shown = shown.astype(object).where(shown.notna(), None)
+    return {
+        "model_version": result["meta"]["model_version"],
+        "overall": result["meta"]["overall"],
+        "slices_total": len(slices),
+        "group": shown["slice"].tolist(),
+        "kind": shown["kind"].tolist(),
+        "count": [int(c) for c in shown["count"]],
+        **{m: [None if v is None else round(float(v), 4) for v in shown[m]] for m in METRICS},
+    }
+
+def benchmark(rows: int, levels: Sequence[int], seed: int = 0) -> Dict[str, Any]:
+    """Time every group and pairwise intersection of synthetic attributes with ``levels`` values each"""
+    rng = np.random.default_rng(seed)
+    sensitive = pd.DataFrame({f"a{i}": rng.integers(0, k, rows) for i, k in enumerate(levels)})
+    y_true = rng.random(rows) < 0.3
+    y_pred = np.where(rng.random(rows) < 0.85, y_true, ~y_true)
+    start = time.perf_counter()
+    slices = slice_metrics(y_true, y_pred, sensitive)
+    elapsed = time.perf_counter() - start
+    return {"rows": rows, "levels": list(levels), "slices": len(slices), "seconds": round(elapsed, 3)}
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Fairness metrics for every group and pairwise intersection")
+    parser.add_argument("path", nargs="?", type=Path, help="scored CSV")
+    parser.add_argument("--label")
+    parser.add_argument("--prediction", default="prediction")
+    parser.add_argument("--positive", default=None, help="positive class value (default: truthiness)")
+    parser.add_argument("--sensitive", nargs="+", default=[])
+    parser.add_argument("--no-intersections", action="store_true")
+    parser.add_argument("--bench", action="store_true", help="time a synthetic run instead")
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--levels", type=int, nargs="+", default=[50, 40, 30, 20])
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        print(json.dumps(benchmark(args.rows, args.levels), indent=2))
+        return 0
+    if args.path is None or not args.label or not args.sensitive:
+        parser.error("path, --label and --sensitive are required unless --bench is given")
+    frame = pd.read_csv(args.path)
+    slices = slice_metrics(_as_bool(frame[args.label], args.positive), _as_bool(frame[args.prediction], args.positive),
+                           frame[args.sensitive], not args.no_intersections)
+    print(slices.to_string(index=False))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""Engineer-1 | Pipeline run ledger
+
+One SQLite row per pipeline run: id, kind (validation, scoring), start and
+end time, rows, input fingerprint and status. A run is inserted as
+``running`` when it starts. When it ends it becomes ``succeeded``,
+``failed`` (it finished, but the data failed its checks), ``error`` (it
+raised) or ``skipped`` (its input was already processed and nothing was
+done). Skipped runs stay in the history but count neither as batches nor
+towards the success rate or totals.
+
+The control room's figures are all index lookups, so they cost the same
+after years of history:
+  batches today    range count on (kind, started_at)
+  success rate     same range, grouped by status (the index covers it); all time
+                   from the totals row; None while no run has finished
+  queue depth      range count on (status, started_at); a ``running`` row older
+                   than STALE_RUNNING belongs to a crashed run and is not counted
+  total processed  a per-kind totals row, updated in the same transaction
+                   that finishes a run
+
+    with RunLedger().run("validation", fingerprint=fp) as run:
+        ...
+        run.rows = len(df)
+        run.finish("succeeded" if issues["ok"] else "failed")
+
+    python -m MLOps_Engineer1.core.monitoring.run_ledger --recent 20
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+BASE_DIR = Path(__file__).resolve().parents[2]  # .../MLOps_Engineer1
+LEDGER_FILE = BASE_DIR / "artifacts" / "runs.db"
+
+STATUSES = ("running", "succeeded", "failed", "error", "skipped")
+STALE_RUNNING = 6 * 3600  # seconds after which an unfinished run no longer counts as queued
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      TEXT PRIMARY KEY,
+    kind        TEXT NOT NULL,
+    started_at  REAL NOT NULL,
+    finished_at REAL,
+    rows        INTEGER,
+    fingerprint TEXT,
+    status      TEXT NOT NULL,
+    error       TEXT,
+    pid         INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_kind_started ON runs (kind, started_at, status);
+CREATE INDEX IF NOT EXISTS runs_status_started ON runs (status, started_at);
+CREATE INDEX IF NOT EXISTS runs_fingerprint ON runs (fingerprint);
+CREATE TABLE IF NOT EXISTS totals (
+    kind      TEXT PRIMARY KEY,
+    runs      INTEGER NOT NULL,
+    succeeded INTEGER NOT NULL,
+    failed    INTEGER NOT NULL,
+    errors    INTEGER NOT NULL,
+    rows      INTEGER NOT NULL
+);
+"""
+
+def _midnight(now: Optional[float] = None) -> float:
+    """Epoch seconds of local midnight today"""
+    today = datetime.fromtimestamp(now if now is not None else time.time())
+    return today.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+
+class LedgerRun:
+    """An open ledger row; set ``rows``/``fingerprint`` and ``finish`` it (the ``with`` block does otherwise)"""
+
+    def __init__(self, ledger: "RunLedger", kind: str, fingerprint: Optional[str] = None):
+        self.ledger = ledger
+        self.kind = kind
+        self.fingerprint = fingerprint
+        self.rows: Optional[int] = None
+        self.run_id = uuid.uuid4().hex
+        self.started_at = time.time()
+        self.status = "running"
+
+    def finish(self, status: str = "succeeded", error: Optional[str] = None) -> None:
+        if self.status != "running":
+            return
+        self.ledger._finish(self, status, error)
+        self.status = status
+
+    def __enter__(self) -> "LedgerRun":
+        self.ledger._start(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.finish("error", f"{exc_type.__name__}: {exc}")
+        else:
+            self.finish("succeeded")
+
+class RunLedger:
+    def __init__(self, path: Path = LEDGER_FILE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        # short-lived connections: steps, the sync worker and the CLI share the file
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def run(self, kind: str, fingerprint: Optional[str] = None) -> LedgerRun:
+        return LedgerRun(self, kind, fingerprint)
+
+    def _start(self, run: LedgerRun) -> None:
+        with self._connect() as conn:
+            conn.execute("INSERT INTO runs (run_id, kind, started_at, fingerprint, status, pid) "
+                         "VALUES (?, ?, ?, ?, 'running', ?)",
+                         (run.run_id, run.kind, run.started_at, run.fingerprint, os.getpid()))
+
+    def _finish(self, run: LedgerRun, status: str, error: Optional[str]) -> None:
+        if status not in STATUSES[1:]:
+            raise ValueError(f"status must be one of {STATUSES[1:]}, got {status!r}")
+        rows = int(run.rows or 0)
+        with self._connect() as conn:
+            conn.execute("UPDATE runs SET finished_at = ?, rows = ?, fingerprint = ?, status = ?, error = ? "
+                         "WHERE run_id = ?", (time.time(), rows, run.fingerprint, status, error, run.run_id))
+            if status == "skipped":
+                return
+            conn.execute(
+                "INSERT INTO totals VALUES (?, 1, ?, ?, ?, ?) ON CONFLICT (kind) DO UPDATE SET "
+                "runs = runs + 1, succeeded = succeeded + excluded.succeeded, failed = failed + excluded.failed, "
+                "errors = errors + excluded.errors, rows = rows + excluded.rows",
+                (run.kind, int(status == "succeeded"), int(status == "failed"), int(status == "error"), rows))
+
+    # -- control room queries --------------------------------------------------
+
+    def batches_today(self, kind: str = "validation", now: Optional[float] = None) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM runs WHERE kind = ? AND started_at >= ? "
+                                "AND status != 'skipped'", (kind, _midnight(now))).fetchone()[0]
+
+    def total_processed(self, kind: str = "validation") -> int:
+        """Rows processed by every finished run of ``kind``"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT rows FROM totals WHERE kind = ?", (kind,)).fetchone()
+        return row[0] if row else 0
+
+    def success_rate(self, kind: str = "validation", window: Optional[float] = 24 * 3600,
+                     now: Optional[float] = None) -> Optional[float]:
+        """Percent of the runs started in the last ``window`` seconds (all time if None) that
+        succeeded; None if none finished (skipped runs do not count)"""
+        if window is None:
+            with self._connect() as conn:
+                row = conn.execute("SELECT succeeded, runs FROM totals WHERE kind = ?", (kind,)).fetchone()
+            return round(100.0 * row[0] / row[1], 2) if row and row[1] else None
+        since = (now if now is not None else time.time()) - window
+        with self._connect() as conn:
+            counts = dict(conn.execute("SELECT status, COUNT(*) FROM runs WHERE kind = ? AND started_at >= ? "
+                                       "GROUP BY status", (kind, since)).fetchall())
+        finished = sum(n for status, n in counts.items() if status not in ("running", "skipped"))
+        return round(100.0 * counts.get("succeeded", 0) / finished, 2) if finished else None
+
+    def queue_depth(self, now: Optional[float] = None) -> int:
+        """Runs of any kind in progress (started within STALE_RUNNING and not finished)"""
+        since = (now if now is not None else time.time()) - STALE_RUNNING
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM runs WHERE status = 'running' AND started_at >= ?",
+                                (since,)).fetchone()[0]
+
+    def recent(self, n: int = 20, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        sql, params = "SELECT * FROM runs", []
+        if kind is not None:
+            sql += " WHERE kind = ?"
+            params.append(kind)
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(sql + " ORDER BY started_at DESC LIMIT ?", params + [n]).fetchall()
+        return [dict(r) for r in rows]
+
+    def stats(self, kind: str = "validation") -> Dict[str, Any]:
+        return {
+            "batches_today": self.batches_today(kind),
+            "total_processed": self.total_processed(kind),
+            "success_rate": self.success_rate(kind),
+            "queue_depth": self.queue_depth(),
+        }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Pipeline run ledger")
+    parser.add_argument("--file", type=Path, default=LEDGER_FILE)
+    parser.add_argument("--kind", default="validation")
+    parser.add_argument("--recent", type=int, default=0, help="also list the N most recent runs")
+    args = parser.parse_args(argv)
+
+    ledger = RunLedger(args.file)
+    print(json.dumps(ledger.stats(args.kind), indent=2))
+    for run in ledger.recent(args.recent, args.kind) if args.recent else []:
+        started = datetime.fromtimestamp(run["started_at"]).isoformat(timespec="seconds")
+        took = f"{run['finished_at'] - run['started_at']:.2f}s" if run["finished_at"] else "-"
+        print(f"{started}  {run['status']:<9} {took:>9} {run['rows'] or 0:>12,} rows  "
+              f"{(run['fingerprint'] or '')[:12]}  {run['run_id'][:8]}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
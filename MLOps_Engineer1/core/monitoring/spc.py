@@ -0,0 +1,219 @@
+"""Engineer-1 | Statistical Process Control engine
+
+NumPy-vectorized X-bar/R, EWMA and CUSUM charts with Western Electric rule
+detection. Control limits are kept as running sums (grand mean of subgroup
+means, mean range), so appending batches updates them in O(new batches)
+without revisiting history; only the last few points are retained for the
+run-based rules and a bounded window is kept for display.
+"""
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# X-bar/R chart constants by subgroup size n (ASTM / Montgomery tables)
+_A2 = {2: 1.880, 3: 1.023, 4: 0.729, 5: 0.577, 6: 0.483, 7: 0.419, 8: 0.373, 9: 0.337, 10: 0.308,
+       11: 0.285, 12: 0.266, 13: 0.249, 14: 0.235, 15: 0.223, 16: 0.212, 17: 0.203, 18: 0.194,
+       19: 0.187, 20: 0.180, 21: 0.173, 22: 0.167, 23: 0.162, 24: 0.157, 25: 0.153}
+_D3 = {2: 0.0, 3: 0.0, 4: 0.0, 5: 0.0, 6: 0.0, 7: 0.076, 8: 0.136, 9: 0.184, 10: 0.223,
+       11: 0.256, 12: 0.283, 13: 0.307, 14: 0.328, 15: 0.347, 16: 0.363, 17: 0.378, 18: 0.391,
+       19: 0.403, 20: 0.415, 21: 0.425, 22: 0.434, 23: 0.443, 24: 0.451, 25: 0.459}
+_D4 = {2: 3.267, 3: 2.574, 4: 2.282, 5: 2.114, 6: 2.004, 7: 1.924, 8: 1.864, 9: 1.816, 10: 1.777,
+       11: 1.744, 12: 1.717, 13: 1.693, 14: 1.672, 15: 1.653, 16: 1.637, 17: 1.622, 18: 1.608,
+       19: 1.597, 20: 1.585, 21: 1.575, 22: 1.566, 23: 1.557, 24: 1.548, 25: 1.541}
+
+# Western Electric rules: (name, window, required hits, sigma threshold)
+WE_RULES = [
+    ("beyond_3sigma", 1, 1, 3.0),
+    ("2_of_3_beyond_2sigma", 3, 2, 2.0),
+    ("4_of_5_beyond_1sigma", 5, 4, 1.0),
+    ("8_same_side", 8, 8, 0.0),
+]
+TAIL = max(w for _, w, _, _ in WE_RULES) - 1
+
+def _window_hits(flags: np.ndarray, window: int) -> np.ndarray:
+    """Number of True flags in each trailing window (len(flags) - window + 1 values)"""
+    cs = np.concatenate(([0], np.cumsum(flags, dtype=np.int64)))
+    return cs[window:] - cs[:-window]
+
+def western_electric(values: np.ndarray, center: float, sigma: float, n_prefix: int = 0) -> Dict[str, np.ndarray]:
+    """Boolean rule flags for each value; the first `n_prefix` values only provide history"""
+    n_new = len(values) - n_prefix
+    if sigma <= 0 or n_new <= 0:
+        return {name: np.zeros(max(n_new, 0), dtype=bool) for name, _, _, _ in WE_RULES}
+    z = (values - center) / sigma
+    out = {}
+    for name, window, hits, threshold in WE_RULES:
+        flagged = np.zeros(n_new, dtype=bool)
+        for side in (z > threshold, z < -threshold):
+            if window == 1:
+                flagged |= side[n_prefix:]
+                continue
+            counts = _window_hits(side, window)  # counts[i] covers values[i : i + window]
+            # the window ending at new point j starts at n_prefix + j - window + 1
+            start = n_prefix - window + 1
+            if start < 0:
+                counts = np.concatenate((np.zeros(-start, dtype=counts.dtype), counts))
+                start = 0
+            flagged |= counts[start:start + n_new] >= hits
+        out[name] = flagged
+    return out
+
+def cusum(x: np.ndarray, reference: float, start: float = 0.0) -> np.ndarray:
+    """Upper CUSUM C_t = max(0, C_{t-1} + x_t - reference), vectorized.
+
+    With D_t the cumulative sum of (x - reference), C_t = D_t - min(-start, min_{j<=t} D_j).
+    """
+    d = np.cumsum(x - reference)
+    return d - np.minimum(-start, np.minimum.accumulate(d))
+
+class SPCEngine:
+    def __init__(self, subgroup_size: int = 5, ewma_lambda: float = 0.2, ewma_L: float = 3.0,
+                 cusum_k: float = 0.5, cusum_h: float = 5.0, window: int = 200):
+        if subgroup_size not in _A2:
+            raise ValueError(f"subgroup_size must be between 2 and 25, got {subgroup_size}")
+        self.subgroup_size = subgroup_size
+        self.ewma_lambda = ewma_lambda
+        self.ewma_L = ewma_L
+        self.cusum_k = cusum_k
+        self.cusum_h = cusum_h
+        self.window = window
+        # running state
+        self.n_batches = 0
+        self.sum_xbar = 0.0
+        self.sum_range = 0.0
+        self.ewma_last: Optional[float] = None
+        self.cusum_pos = 0.0
+        self.cusum_neg = 0.0
+        self.tail: List[float] = []
+        # bounded display window
+        self.recent: Dict[str, List[Any]] = {"batch": [], "value": [], "range": [], "ewma": [],
+                                             "cusum_pos": [], "cusum_neg": []}
+        self.violations: List[Dict[str, Any]] = []
+
+    @property
+    def center(self) -> float:
+        return self.sum_xbar / self.n_batches if self.n_batches else 0.0
+
+    @property
+    def r_bar(self) -> float:
+        return self.sum_range / self.n_batches if self.n_batches else 0.0
+
+    @property
+    def sigma(self) -> float:
+        """Standard deviation of subgroup means, estimated from R-bar"""
+        return _A2[self.subgroup_size] * self.r_bar / 3.0
+
+    def limits(self) -> Dict[str, float]:
+        n = self.subgroup_size
+        center, r_bar = self.center, self.r_bar
+        ewma_sigma = self.sigma * float(np.sqrt(self.ewma_lambda / (2 - self.ewma_lambda)))
+        return {
+            "mean": center,
+            "ucl": center + _A2[n] * r_bar,
+            "lcl": center - _A2[n] * r_bar,
+            "r_bar": r_bar,
+            "r_ucl": _D4[n] * r_bar,
+            "r_lcl": _D3[n] * r_bar,
+            "ewma_ucl": center + self.ewma_L * ewma_sigma,
+            "ewma_lcl": center - self.ewma_L * ewma_sigma,
+            "cusum_h": self.cusum_h * self.sigma,
+        }
+
+    def append_subgroups(self, values: np.ndarray) -> Dict[str, Any]:
+        """Append a (batches x subgroup_size) array of raw measurements"""
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 2 or values.shape[1] != self.subgroup_size:
+            raise ValueError(f"expected shape (batches, {self.subgroup_size}), got {values.shape}")
+        return self.append(values.mean(axis=1), np.ptp(values, axis=1))
+
+    def append(self, xbar: np.ndarray, ranges: np.ndarray) -> Dict[str, Any]:
+        """Append per-batch subgroup means and ranges; returns the appended chart points"""
+        xbar = np.asarray(xbar, dtype=float)
+        ranges = np.asarray(ranges, dtype=float)
+        if len(xbar) == 0:
+            return {"batch": np.arange(0), "rules": {}}
+        first = self.n_batches + 1
+        self.n_batches += len(xbar)
+        self.sum_xbar += float(xbar.sum())
+        self.sum_range += float(ranges.sum())
+        center, sigma = self.center, self.sigma
+
+        start = center if self.ewma_last is None else self.ewma_last
+        ewma = pd.Series(np.concatenate(([start], xbar))).ewm(alpha=self.ewma_lambda, adjust=False).mean().to_numpy()[1:]
+        k = self.cusum_k * sigma
+        c_pos = cusum(xbar, center + k, self.cusum_pos)
+        c_neg = cusum(-xbar, -(center - k), self.cusum_neg)
+        self.ewma_last, self.cusum_pos, self.cusum_neg = float(ewma[-1]), float(c_pos[-1]), float(c_neg[-1])
+
+        history = np.concatenate((np.asarray(self.tail, dtype=float), xbar))
+        rules = western_electric(history, center, sigma, n_prefix=len(self.tail))
+        self.tail = history[-TAIL:].tolist()
+
+        batches = np.arange(first, first + len(xbar))
+        lim = self.limits()
+        rules["ewma"] = (ewma > lim["ewma_ucl"]) | (ewma < lim["ewma_lcl"])
+        rules["cusum"] = (c_pos > lim["cusum_h"]) | (c_neg > lim["cusum_h"])
+
+        for name, arr in (("batch", batches), ("value", xbar), ("range", ranges), ("ewma", ewma),
+                          ("cusum_pos", c_pos), ("cusum_neg", c_neg)):
+            self.recent[name] = (self.recent[name] + arr[-self.window:].tolist())[-self.window:]
+        # Per-point violation records are only materialised for the display window
+        oldest = self.recent["batch"][0]
+        visible = batches >= oldest
+        self.violations = [v for v in self.violations if v["batch"] >= oldest] + [
+            {"batch": int(b), "rule": name} for name, flags in rules.items() for b in batches[flags & visible]]
+        return {"batch": batches, "value": xbar, "range": ranges, "ewma": ewma,
+                "cusum_pos": c_pos, "cusum_neg": c_neg, "rules": rules}
+
+    def chart(self) -> Dict[str, Any]:
+        """Display window in the spc.json shape the Live SPC chart reads, plus extra series"""
+        lim = self.limits()
+        return {
+            "batch": self.recent["batch"],
+            "value": self.recent["value"],
+            "mean": lim["mean"],
+            "ucl": lim["ucl"],
+            "lcl": lim["lcl"],
+            "range": self.recent["range"],
+            "ewma": self.recent["ewma"],
+            "cusum_pos": self.recent["cusum_pos"],
+            "cusum_neg": self.recent["cusum_neg"],
+            "limits": lim,
+            "violations": self.violations,
+            "total_batches": self.n_batches,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "config": {"subgroup_size": self.subgroup_size, "ewma_lambda": self.ewma_lambda,
+                       "ewma_L": self.ewma_L, "cusum_k": self.cusum_k, "cusum_h": self.cusum_h,
+                       "window": self.window},
+            "n_batches": self.n_batches, "sum_xbar": self.sum_xbar, "sum_range": self.sum_range,
+            "ewma_last": self.ewma_last, "cusum_pos": self.cusum_pos, "cusum_neg": self.cusum_neg,
+            "tail": self.tail, "recent": self.recent, "violations": self.violations,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SPCEngine":
+        engine = cls(**data["config"])
+        for key in ("n_batches", "sum_xbar", "sum_range", "ewma_last", "cusum_pos", "cusum_neg",
+                    "tail", "recent", "violations"):
+            setattr(engine, key, data[key])
+        return engine
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict()))
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["SPCEngine"]:
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            return cls.from_dict(json.loads(path.read_text()))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
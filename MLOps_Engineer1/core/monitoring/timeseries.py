@@ -0,0 +1,211 @@
+"""Engineer-1 | Append-only time-series store
+
+Dashboard series (model metrics, drift p-values, SPC batches) kept in one
+SQLite file as long-format points ``(series, field, t, value)``. The primary
+key clusters each field's points by ``t``, so a range query reads only the
+rows in the window, and appends never rewrite history. ``t`` is epoch
+seconds for dated series and the batch number for SPC.
+
+The E1 sync is the only writer; the dashboard opens the store ``read_only``.
+"""
+import json
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+import pandas as pd
+
+# rollup aggregates; "last" (value at the latest t in each bucket) is handled separately
+AGGREGATES = {"avg": "AVG", "min": "MIN", "max": "MAX", "sum": "SUM", "count": "COUNT", "last": None}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS points (
+    series TEXT NOT NULL,
+    field  TEXT NOT NULL,
+    t      REAL NOT NULL,
+    value  REAL,
+    PRIMARY KEY (series, field, t)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS points_series_t ON points (series, t);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+def to_epoch(dates: Iterable[Any]) -> list:
+    """Date strings / datetimes -> epoch seconds"""
+    return (pd.to_datetime(pd.Series(list(dates))).astype("int64") // 10**9).astype(float).tolist()
+
+class TimeSeriesStore:
+    def __init__(self, path: Path, read_only: bool = False):
+        """``read_only`` opens an existing store for queries only (the dashboard's side)"""
+        self.path = Path(path)
+        self.read_only = read_only
+        if read_only:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        # One short-lived connection per operation keeps the store safe to share
+        # between Streamlit sessions (threads) and the sync process.
+        if self.read_only:
+            conn = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True, timeout=30)
+        else:
+            conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def append(self, series: str, t: Sequence[float], fields: Dict[str, Sequence[Any]]) -> int:
+        """Append points; re-appending an existing (series, field, t) overwrites it"""
+        rows = [(series, name, float(ti), None if v is None else float(v))
+                for name, values in fields.items() for ti, v in zip(t, values)]
+        with self._connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO points VALUES (?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def drop(self, series: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM points WHERE series = ?", (series,))
+
+    def bounds(self, series: str) -> Optional[Tuple[float, float]]:
+        with self._connect() as conn:
+            lo, hi = conn.execute("SELECT MIN(t), MAX(t) FROM points WHERE series = ?", (series,)).fetchone()
+        return None if lo is None else (lo, hi)
+
+    def query(self, series: str, start: Optional[float] = None, end: Optional[float] = None,
+              fields: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Points with start <= t <= end, one column per field, ordered by t"""
+        sql, params = "SELECT t, field, value FROM points WHERE series = ?", [series]
+        if start is not None:
+            sql += " AND t >= ?"
+            params.append(start)
+        if end is not None:
+            sql += " AND t <= ?"
+            params.append(end)
+        if fields:
+            sql += f" AND field IN ({','.join('?' * len(fields))})"
+            params.extend(fields)
+        with self._connect() as conn:
+            long = pd.read_sql_query(sql + " ORDER BY t", conn, params=params)
+        return self._pivot(long)
+
+    def tail(self, series: str, n: int, fields: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """The last ``n`` distinct timestamps of a series"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT DISTINCT t FROM points WHERE series = ? ORDER BY t DESC LIMIT 1 OFFSET ?",
+                               (series, max(n - 1, 0))).fetchone()
+        return self.query(series, start=row[0] if row else None, fields=fields)
+
+    def rollup(self, series: str, bucket: float, agg: str = "avg", start: Optional[float] = None,
+               end: Optional[float] = None) -> pd.DataFrame:
+        """Aggregate each field into buckets of width ``bucket`` (t is the bucket start)"""
+        if agg not in AGGREGATES:
+            raise ValueError(f"agg must be one of {sorted(AGGREGATES)}, got {agg!r}")
+        bucket_t = "CAST(t / :bucket AS INTEGER) * :bucket"
+        where = "series = :series"
+        if start is not None:
+            where += " AND t >= :start"
+        if end is not None:
+            where += " AND t <= :end"
+        if agg == "last":
+            # value at the latest t within each bucket
+            sql = (f"SELECT {bucket_t} AS t, p.field, p.value FROM points p JOIN ("
+                   f"SELECT field, MAX(t) AS mt FROM points WHERE {where} GROUP BY field, {bucket_t}) m "
+                   f"ON p.series = :series AND p.field = m.field AND p.t = m.mt ORDER BY t")
+        else:
+            sql = (f"SELECT {bucket_t} AS t, field, {AGGREGATES[agg]}(value) AS value FROM points "
+                   f"WHERE {where} GROUP BY field, {bucket_t} ORDER BY t")
+        params = {"series": series, "bucket": bucket, "start": start, "end": end}
+        with self._connect() as conn:
+            long = pd.read_sql_query(sql, conn, params=params)
+        return self._pivot(long)
+
+    def count(self, series: str, start: Optional[float] = None, end: Optional[float] = None) -> int:
+        """Number of distinct timestamps in the window"""
+        sql, params = "SELECT COUNT(DISTINCT t) FROM points WHERE series = ?", [series]
+        if start is not None:
+            sql += " AND t >= ?"
+            params.append(start)
+        if end is not None:
+            sql += " AND t <= ?"
+            params.append(end)
+        with self._connect() as conn:
+            return conn.execute(sql, params).fetchone()[0]
+
+    def extrema(self, series: str, bucket: float, start: Optional[float] = None, end: Optional[float] = None,
+                fields: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Min and max of each field per bucket, long-format (t, field, value).
+
+        Both points sit at the middle of the bucket's observed time span, which
+        draws a vertical min/max bar per bucket. One scan computes both aggregates.
+        """
+        where, params = "series = :series", {"series": series, "bucket": bucket, "start": start, "end": end}
+        if start is not None:
+            where += " AND t >= :start"
+        if end is not None:
+            where += " AND t <= :end"
+        if fields:
+            names = {f"f{i}": name for i, name in enumerate(fields)}
+            where += f" AND field IN ({','.join(':' + k for k in names)})"
+            params.update(names)
+        sql = (f"SELECT field, (MIN(t) + MAX(t)) / 2 AS mid, MIN(value) AS lo, MAX(value) AS hi FROM points "
+               f"WHERE {where} GROUP BY field, CAST(t / :bucket AS INTEGER)")
+        with self._connect() as conn:
+            wide = pd.read_sql_query(sql, conn, params=params)
+        wide = wide.rename(columns={"mid": "t"})
+        long = wide.melt(id_vars=["field", "t"], value_vars=["lo", "hi"], var_name="bound", value_name="value")
+        return long.sort_values(["t", "bound"], ascending=[True, False], kind="stable")[["t", "field", "value"]]
+
+    def query_long(self, series: str, start: Optional[float] = None, end: Optional[float] = None,
+                   fields: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Like :meth:`query`, but long-format (t, field, value)"""
+        wide = self.query(series, start, end, fields)
+        return wide.melt(id_vars="t", var_name="field", value_name="value").dropna(subset=["value"])
+
+    @staticmethod
+    def _pivot(long: pd.DataFrame) -> pd.DataFrame:
+        if long.empty:
+            return pd.DataFrame({"t": pd.Series(dtype=float)})
+        wide = long.pivot_table(index="t", columns="field", values="value", aggfunc="last", dropna=False)
+        wide.columns.name = None
+        return wide.reset_index()
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+
+    def import_json(self, series: str, json_path: Path, time_key: str = "dates") -> bool:
+        """Load a legacy {time_key: [...], field: [...]} JSON document into ``series``.
+
+        Only re-imported when the file changed since the last import.
+        """
+        json_path = Path(json_path)
+        if not json_path.exists():
+            return False
+        stat = json_path.stat()
+        signature = f"{stat.st_mtime_ns}:{stat.st_size}"
+        if self.get_meta(f"import:{series}") == signature:
+            return False
+        doc = json.loads(json_path.read_text())
+        times = doc[time_key]
+        t = to_epoch(times) if time_key == "dates" else [float(x) for x in times]
+        fields = {k: v for k, v in doc.items()
+                  if k != time_key and isinstance(v, list) and len(v) == len(times)
+                  and all(x is None or isinstance(x, (int, float)) for x in v)}
+        self.append(series, t, fields)
+        self.set_meta(f"import:{series}", signature)
+        return True
@@ -1,9 +1,27 @@
 """Engineer-1 | Pipeline: ingestion -> validation (ZenML)."""
+from typing import Optional
 from zenml.pipelines import pipeline
-from MLOps_Engineer1.core.pipelines.steps.ingest import ingest_data
-from MLOps_Engineer1.core.pipelines.steps.validate import validate_data
+from MLOps_Engineer1.core.ingestion.streaming import DEFAULT_CHUNKSIZE
+from MLOps_Engineer1.core.pipelines.steps.ingest import ingest_data, ingest_data_stream
+from MLOps_Engineer1.core.pipelines.steps.score import score_data_stream
+from MLOps_Engineer1.core.pipelines.steps.validate import validate_data, validate_data_stream
 
 @pipeline
-def ingestion_validation_pipeline():
-    df = ingest_data()
-    _ = validate_data(df)
\ No newline at end of file
+def ingestion_validation_pipeline(chunksize: Optional[int] = None, path: Optional[str] = None,
+                                  workers: Optional[int] = None, fingerprint: Optional[str] = None,
+                                  force: bool = False, score: bool = False, score_url: Optional[str] = None,
+                                  parallelism: Optional[int] = None):
+    source = None
+    if chunksize or path:
+        # Streaming mode: pass a lazy chunked handle instead of a DataFrame.
+        # `path` may be a directory of CSV partitions, validated on `workers` processes.
+        source = ingest_data_stream(chunksize=chunksize or DEFAULT_CHUNKSIZE, path=path)
+        report = validate_data_stream(source, workers=workers, force=force)
+    else:
+        df = ingest_data()
+        report = validate_data(df, fingerprint=fingerprint, force=force)
+    if score:
+        if source is None:
+            # Scoring always streams, whichever way the data was validated
+            source = ingest_data_stream(chunksize=DEFAULT_CHUNKSIZE, path=path)
+        _ = score_data_stream(source, report, url=score_url, parallelism=parallelism)
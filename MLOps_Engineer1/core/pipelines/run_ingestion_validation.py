@@ -1,9 +1,48 @@
 """Engineer-1 | Runner for ingestion+validation (ZenML 0.84+ safe)."""
+import argparse
+import sys
 from pathlib import Path
+from MLOps_Engineer1.core.ingestion.streaming import CsvChunkSource
+from MLOps_Engineer1.core.monitoring.run_ledger import RunLedger
 from MLOps_Engineer1.core.pipelines.ingestion_validation_pipeline import ingestion_validation_pipeline
+from MLOps_Engineer1.core.pipelines.steps.ingest import CSV_PATH
+from MLOps_Engineer1.core.pipelines.steps.validate import JSON_PATH
+from MLOps_Engineer1.core.validation.fingerprint import FingerprintStore, dataset_fingerprint
+
+def _input_fingerprint(path):
+    """Cheap fingerprint of the pipeline input, or None for the synthesized fallback"""
+    if path:
+        return dataset_fingerprint(CsvChunkSource.from_path(path).paths)
+    return dataset_fingerprint([CSV_PATH]) if CSV_PATH.exists() else None
 
 if __name__ == "__main__":
-    p = ingestion_validation_pipeline()
+    parser = argparse.ArgumentParser(description="Run the ingestion + validation pipeline")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help="stream the input in chunks of this many rows instead of loading it whole")
+    parser.add_argument("--path", default=None,
+                        help="CSV file or directory of CSV partitions to validate (implies streaming mode)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes used to validate partitions in parallel (default: all cores)")
+    parser.add_argument("--force", action="store_true",
+                        help="re-validate even if this data + schema fingerprint was already validated")
+    parser.add_argument("--score", action="store_true",
+                        help="batch-score the validated data (resumes an interrupted run of the same data)")
+    parser.add_argument("--score-url", default=None,
+                        help="serving API base URL to score against (default: scoring.url in schema.yaml)")
+    parser.add_argument("--parallelism", type=int, default=None, help="chunks scored concurrently")
+    args = parser.parse_args()
+
+    fingerprint = _input_fingerprint(args.path)
+    if fingerprint and not args.force and not args.score and FingerprintStore().is_current(fingerprint) and JSON_PATH.exists():
+        print(f"⏭️ Data and schema unchanged (fingerprint {fingerprint[:12]}); skipping run. Use --force to re-validate.")
+        with RunLedger().run("validation", fingerprint) as ledger_run:
+            ledger_run.finish("skipped")
+        print(f"Check artifacts at: {JSON_PATH.parent.resolve()}")
+        sys.exit(0)
+
+    p = ingestion_validation_pipeline(chunksize=args.chunksize, path=args.path, workers=args.workers,
+                                      fingerprint=fingerprint, force=args.force, score=args.score,
+                                      score_url=args.score_url, parallelism=args.parallelism)
     
     # Execute pipeline - handle the response object properly
     try:
@@ -1,66 +1,160 @@
 """Engineer-1 | Validation Step
 
 Validates dtypes & nulls against configs/schema.yaml, writes artifacts,
-and logs validation_ok metric and artifacts to MLflow.
+and queues the validation_ok metric and artifacts for MLflow. Each call is
+recorded as a timing span (core/integration/instrumentation.py) and as a
+run in the pipeline run ledger (core/monitoring/run_ledger.py).
 """
 from zenml.steps import step
+import hashlib
 import pandas as pd
 from pathlib import Path
+from typing import Optional
 import yaml, json
-import mlflow
 
-def _dtype_name(series: pd.Series) -> str:
-    return str(series.dtype)
+from MLOps_Engineer1.core.ingestion.streaming import CsvChunkSource
+from MLOps_Engineer1.core.integration.instrumentation import span
+from MLOps_Engineer1.core.integration.sync_worker import notify as notify_sync
+from MLOps_Engineer1.core.integration.tracking import get_tracker
+from MLOps_Engineer1.core.monitoring.run_ledger import LedgerRun, RunLedger
+from MLOps_Engineer1.core.profiling.sketches import DatasetSketch, SketchStore
+from MLOps_Engineer1.core.validation.accumulators import ValidationAccumulator, load_state, save_state
+from MLOps_Engineer1.core.validation.fingerprint import FingerprintStore, dataset_fingerprint
+from MLOps_Engineer1.core.validation.parallel import accumulate_partitions, build_report
 
-@step(enable_cache=False)  # Disable cache to always run fresh validation
-def validate_data(df: pd.DataFrame, schema_rel=None) -> str:
-    base_dir = Path(__file__).resolve().parents[3]  # .../MLOps_Engineer1
-    schema_path = base_dir / "configs" / "schema.yaml"
-    schema = yaml.safe_load(schema_path.read_text())
-    
-    issues = {"missing": {}, "dtypes": {}, "rules": {}, "ok": True}
-    
-    for col in schema["columns"]:
-        name = col["name"]; want = col["dtype"]; allow_null = col["allow_null"]
-        
-        if name not in df.columns:
-            issues["dtypes"][name] = "missing column"; issues["ok"] = False; continue
-        
-        got = _dtype_name(df[name])
-        if want not in got:
-            issues["dtypes"][name] = f"expected {want}, got {got}"; issues["ok"] = False
-        
-        null_frac = df[name].isna().mean()
-        if not allow_null and null_frac > 0:
-            issues["missing"][name] = f"{null_frac:.2%} nulls (not allowed)"; issues["ok"] = False
-    
-    max_null_fraction = float(schema["rules"]["max_null_fraction"])
-    global_null_frac = df.isna().mean().mean()
-    if global_null_frac > max_null_fraction:
-        issues["rules"]["max_null_fraction"] = f"{global_null_frac:.2%} > {max_null_fraction:.2%}"
-        issues["ok"] = False
-    
-    art_dir = base_dir / "artifacts" / "validation"
+BASE_DIR = Path(__file__).resolve().parents[3]  # .../MLOps_Engineer1
+STATE_FILE = BASE_DIR / "artifacts" / "validation" / "state" / "accumulators.json"
+FRAME_STATE_FILE = BASE_DIR / "artifacts" / "validation" / "state" / "frame_sketch.json"
+JSON_PATH = BASE_DIR / "artifacts" / "validation" / "validation_results.json"
+
+def _load_schema() -> dict:
+    schema_path = BASE_DIR / "configs" / "schema.yaml"
+    return yaml.safe_load(schema_path.read_text())
+
+def _publish(issues: dict, fingerprint: Optional[str] = None, ledger_run: Optional[LedgerRun] = None,
+             reused: bool = False) -> str:
+    """Write artifacts, queue them for MLflow, close the ledger run and tell the dashboard sync.
+
+    A ``reused`` result was validated by an earlier run, so this run closes as ``skipped``.
+    """
+    art_dir = BASE_DIR / "artifacts" / "validation"
     art_dir.mkdir(parents=True, exist_ok=True)
-    
-    json_path = art_dir / "validation_results.json"
+
+    json_path = JSON_PATH
     html_path = art_dir / "validation_report.html"
-    
+
     json_path.write_text(json.dumps(issues, indent=2))
     html_path.write_text(f"<html><body><h2>Data Validation Report</h2><pre>{json.dumps(issues, indent=2)}</pre></body></html>")
-    
-    with mlflow.start_run(run_name="validation"):
-        mlflow.log_artifact(str(json_path), artifact_path="validation")
-        mlflow.log_artifact(str(html_path), artifact_path="validation")
-        mlflow.log_dict(issues, "validation/validation_results.json")
-        mlflow.log_metric("validation_ok", 1.0 if issues["ok"] else 0.0)
-    
-    # Sync data to Engineer 4 dashboard
-    try:
-        from MLOps_Engineer1.core.integration.data_sync import sync_pipeline_data
-        sync_result = sync_pipeline_data()
-        print(f"✅ Data synced to Engineer 4 dashboard: {sync_result.get('status', 'unknown')}")
-    except Exception as e:
-        print(f"⚠️ Data sync failed: {e}")
-    
-    return str(json_path)
\ No newline at end of file
+
+    # Queued: the MLflow calls run on a background worker, off the step's critical path
+    with get_tracker().run("validation") as run:
+        run.log_artifact(json_path, artifact_path="validation")
+        run.log_artifact(html_path, artifact_path="validation")
+        run.log_dict(issues, "validation/validation_results.json")
+        run.log_metric("validation_ok", 1.0 if issues["ok"] else 0.0)
+
+    # Finished before the sync is told, so the sync never counts this run as queued
+    if ledger_run is not None:
+        ledger_run.finish("skipped" if reused else "succeeded" if issues["ok"] else "failed")
+
+    # The dashboard sync runs on a background worker; the step does not wait for it
+    notify_sync("validation_finished", fingerprint)
+
+    return str(json_path)
+
+def _reuse(fingerprint: Optional[str], force: bool):
+    """Stored result for an already-validated fingerprint.
+
+    Returns the artifact path if that result is already published (nothing to
+    do), the stored issues if it needs re-publishing, or None to validate.
+    """
+    if not fingerprint or force:
+        return None
+    store = FingerprintStore()
+    if store.is_current(fingerprint) and JSON_PATH.exists():
+        print(f"⏭️ Fingerprint {fingerprint[:12]} already validated; reusing {JSON_PATH.name}")
+        return str(JSON_PATH)
+    return store.get(fingerprint)
+
+def _record(fingerprint: Optional[str], issues: dict) -> None:
+    if fingerprint:
+        FingerprintStore().put(fingerprint, issues)
+
+def _save_sketch(sketch: Optional[DatasetSketch], fingerprint: Optional[str]) -> None:
+    """Keep this run's per-column sketches for later time-range queries"""
+    if sketch is not None and sketch.rows:
+        path = SketchStore().save(sketch, tag=fingerprint or "")
+        print(f"🧮 Column sketches for {sketch.rows} rows written to {path.name}")
+
+def _unsketched_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """Rows of a whole-frame run not already in an earlier run's sketch.
+
+    If ``df`` starts with exactly the rows of the last whole-frame run (the
+    source was appended to), only the rows after them are new; otherwise
+    every row is. The frame's row count and a hash of its rows are kept in
+    FRAME_STATE_FILE for the next run.
+    """
+    hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    state = json.loads(FRAME_STATE_FILE.read_text()) if FRAME_STATE_FILE.exists() else {}
+    start = int(state.get("rows", 0))
+    if not 0 < start <= len(df) or hashlib.sha256(hashes[:start].tobytes()).hexdigest() != state.get("key"):
+        start = 0
+    FRAME_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    FRAME_STATE_FILE.write_text(json.dumps({"rows": len(df), "key": hashlib.sha256(hashes.tobytes()).hexdigest()}))
+    return df.iloc[start:]
+
+@step(enable_cache=False)  # Disable cache to always run fresh validation
+def validate_data(df: pd.DataFrame, schema_rel=None, fingerprint: Optional[str] = None,
+                  force: bool = False) -> str:
+    with span("validate_data", rows=0) as s, RunLedger().run("validation", fingerprint) as ledger_run:
+        reused = _reuse(fingerprint, force)
+        s.attrs["reused"] = reused is not None
+        if isinstance(reused, str):
+            ledger_run.finish("skipped")
+            return reused
+        if reused is None:
+            issues = ValidationAccumulator.from_frame(df).to_issues(_load_schema())
+            # Re-validating the same or an appended-to frame sketches only rows not sketched before
+            _save_sketch(DatasetSketch.from_frame(_unsketched_rows(df)), fingerprint)
+            s.rows = ledger_run.rows = len(df)
+        else:
+            issues = reused
+        _record(fingerprint, issues)
+        return _publish(issues, fingerprint, ledger_run, reused=reused is not None)
+
+@step(enable_cache=False)
+def validate_data_stream(source: dict, workers: Optional[int] = None, force: bool = False) -> str:
+    """Validate a lazy chunked handle from `ingest_data_stream` one chunk at a time.
+
+    A directory of partitions is fanned out to `workers` processes (default: all
+    cores) and the report gains a per-partition breakdown. Per-file accumulator
+    state is persisted, so files that were only appended to since the last run
+    are re-validated by reading just the new rows; only those rows go into the
+    run's column sketches. Inputs whose fingerprint (file stats + sampled
+    blocks + schema) was already validated are skipped unless `force` is set.
+    """
+    with span("validate_data_stream", rows=0) as s, RunLedger().run("validation") as ledger_run:
+        handle = CsvChunkSource.from_dict(source)
+        fingerprint = ledger_run.fingerprint = dataset_fingerprint(handle.paths)
+        reused = _reuse(fingerprint, force)
+        s.attrs["reused"] = reused is not None
+        if isinstance(reused, str):
+            ledger_run.finish("skipped")
+            return reused
+        if reused is not None:
+            _record(fingerprint, reused)
+            return _publish(reused, fingerprint, ledger_run, reused=True)
+
+        states = load_state(STATE_FILE)
+        partition_states = accumulate_partitions(handle.paths, handle.chunksize, workers, states, sketch=True)
+        sketch = DatasetSketch()
+        for state in partition_states.values():
+            sketch = sketch.merge(state.pop("sketch"))
+        s.rows = ledger_run.rows = sketch.rows  # appended-to files count only their new rows
+        _save_sketch(sketch, fingerprint)
+        states.update(partition_states)
+        save_state(STATE_FILE, states)
+
+        issues = build_report(partition_states, _load_schema())
+        _record(fingerprint, issues)
+        return _publish(issues, fingerprint, ledger_run)
@@ -0,0 +1,262 @@
+"""Engineer-1 | Dataset Profile
+
+Reads a dataset once, chunk by chunk, and captures everything the dashboard
+sync needs: row count, per-column nulls, dtypes, duplicate count, value
+counts and numeric summaries. Memory is bounded by the chunk size: counts,
+means and standard deviations are merged exactly across chunks, while
+quartiles come from a t-digest, value counts from Misra-Gries heavy hitters
+(exact for columns with few distinct values) and the duplicate count from
+the streaming ``DuplicateCounter``. The profile is persisted next to the
+validation artifacts so later consumers can reuse it without touching the CSV.
+"""
+import json
+import math
+import pandas as pd
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from MLOps_Engineer1.core.ingestion.streaming import CsvChunkSource, DEFAULT_CHUNKSIZE
+from MLOps_Engineer1.core.profiling.sketches import TDigest, TopK
+from MLOps_Engineer1.core.validation.duplicates import DuplicateCounter
+
+PROFILE_FILENAME = "dataset_profile.json"
+PROFILE_VERSION = 2
+NUMERIC_DTYPES = ("int64", "float64")
+HEAVY_HITTERS = 256  # value counts are exact for columns with at most this many distinct values
+
+def _to_builtin(value: Any) -> Any:
+    """Convert numpy/pandas scalars to JSON-friendly Python values"""
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+def _file_stat(path: Path) -> Dict[str, Any]:
+    stat = path.stat()
+    return {"path": str(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+class ColumnProfile:
+    def __init__(self, name: str, dtype: str, null_count: int,
+                 head: List[Any], value_counts: List[List[Any]],
+                 numeric: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.dtype = dtype
+        self.null_count = null_count
+        self.head = head
+        self.value_counts = value_counts
+        self.numeric = numeric
+
+    @property
+    def is_numeric(self) -> bool:
+        return self.dtype in ("int64", "float64")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "dtype": self.dtype,
+            "null_count": self.null_count,
+            "head": self.head,
+            "value_counts": self.value_counts,
+            "numeric": self.numeric,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ColumnProfile":
+        return cls(
+            name=data["name"],
+            dtype=data["dtype"],
+            null_count=int(data["null_count"]),
+            head=list(data.get("head", [])),
+            value_counts=[list(pair) for pair in data.get("value_counts", [])],
+            numeric=data.get("numeric"),
+        )
+
+def _merge_dtype(a: Optional[str], b: str) -> str:
+    """The dtype pandas infers for a whole column whose chunks were inferred as ``a`` and ``b``"""
+    if a is None or a == b:
+        return b
+    return "float64" if {a, b} <= set(NUMERIC_DTYPES) else "object"
+
+class _ColumnAccumulator:
+    """Per-column state of a chunked profile; every part merges exactly except the
+    t-digest quartiles and the heavy-hitter value counts"""
+
+    def __init__(self, name: str, missing_rows: int = 0):
+        self.name = name
+        self.dtype: Optional[str] = None
+        self.null_count = missing_rows  # rows of earlier chunks that lacked the column
+        self.head: List[Any] = []
+        self.topk = TopK(HEAVY_HITTERS)
+        # numeric values: count, mean and sum of squared deviations (Chan et al.), range, quartiles
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.tdigest = TDigest()
+
+    def update(self, series: pd.Series, head_n: int) -> None:
+        self.dtype = _merge_dtype(self.dtype, str(series.dtype))
+        present = series.dropna()
+        self.null_count += len(series) - len(present)
+        if len(self.head) < head_n:
+            self.head += [_to_builtin(v) for v in series.head(head_n - len(self.head)).tolist()]
+        self.topk.add(present)
+        if str(series.dtype) in NUMERIC_DTYPES and len(present):
+            values = present.to_numpy(dtype=float)
+            n, mean = len(values), float(values.mean())
+            m2 = float(((values - mean) ** 2).sum())
+            total = self.n + n
+            delta = mean - self.mean
+            self.m2 += m2 + delta * delta * self.n * n / total
+            self.mean += delta * n / total
+            self.n = total
+            self.tdigest.add(values)
+
+    def finish(self, top_k: int) -> ColumnProfile:
+        numeric = None
+        if self.dtype in NUMERIC_DTYPES:
+            quartiles = self.tdigest.quantile([0.25, 0.5, 0.75]) if self.n else [None] * 3
+            numeric = {
+                "count": float(self.n),
+                "mean": self.mean if self.n else None,
+                "std": math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else None,
+                "min": self.tdigest.min if self.n else None,
+                "25%": _to_builtin(quartiles[0]),
+                "50%": _to_builtin(quartiles[1]),
+                "75%": _to_builtin(quartiles[2]),
+                "max": self.tdigest.max if self.n else None,
+            }
+        return ColumnProfile(
+            name=self.name,
+            dtype=self.dtype or "object",
+            null_count=int(self.null_count),
+            head=self.head,
+            value_counts=[[value, int(count)] for value, count in self.topk.top(top_k)],
+            numeric=numeric,
+        )
+
+class DatasetProfile:
+    def __init__(self, row_count: int, columns: List[ColumnProfile], duplicate_rows: int,
+                 source: Optional[Dict[str, Any]] = None, created_at: Optional[str] = None):
+        self.row_count = row_count
+        self.columns = columns
+        self.duplicate_rows = duplicate_rows
+        self.source = source
+        self.created_at = created_at or datetime.now().isoformat()
+
+    @property
+    def column_names(self) -> List[str]:
+        return [c.name for c in self.columns]
+
+    @property
+    def column_count(self) -> int:
+        return len(self.columns)
+
+    @property
+    def dtypes(self) -> Dict[str, str]:
+        return {c.name: c.dtype for c in self.columns}
+
+    @property
+    def missing_values(self) -> Dict[str, int]:
+        """Null counts for columns that have at least one null"""
+        return {c.name: c.null_count for c in self.columns if c.null_count > 0}
+
+    def column(self, name: str) -> ColumnProfile:
+        for c in self.columns:
+            if c.name == name:
+                return c
+        raise KeyError(name)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, source: Optional[Dict[str, Any]] = None,
+                   top_k: int = 10, head_n: int = 10) -> "DatasetProfile":
+        """Profile an in-memory DataFrame"""
+        return cls.from_chunks([df], source, top_k, head_n)
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[pd.DataFrame], source: Optional[Dict[str, Any]] = None,
+                    top_k: int = 10, head_n: int = 10) -> "DatasetProfile":
+        """Profile a dataset in one pass over its chunks"""
+        rows = 0
+        columns: Dict[str, _ColumnAccumulator] = {}
+        duplicates = DuplicateCounter("auto")
+        for chunk in chunks:
+            rows += len(chunk)
+            duplicates.update(chunk)
+            for name in chunk.columns:
+                acc = columns.get(str(name))
+                if acc is None:
+                    acc = columns[str(name)] = _ColumnAccumulator(str(name), rows - len(chunk))
+                acc.update(chunk[name], head_n)
+        return cls(
+            row_count=rows,
+            columns=[acc.finish(top_k) for acc in columns.values()],
+            duplicate_rows=duplicates.duplicate_rows,
+            source=source,
+        )
+
+    @classmethod
+    def from_csv(cls, path: Path, chunksize: int = DEFAULT_CHUNKSIZE, **kwargs) -> "DatasetProfile":
+        """Profile a CSV chunk by chunk"""
+        path = Path(path)
+        return cls.from_chunks(CsvChunkSource([path], chunksize), source=_file_stat(path), **kwargs)
+
+    def matches_source(self, path: Path) -> bool:
+        """True if the profile was built from the file as it is on disk now"""
+        path = Path(path)
+        if not self.source or not path.exists():
+            return False
+        return _file_stat(path) == self.source
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": PROFILE_VERSION,
+            "created_at": self.created_at,
+            "source": self.source,
+            "row_count": self.row_count,
+            "duplicate_rows": self.duplicate_rows,
+            "columns": [c.to_dict() for c in self.columns],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DatasetProfile":
+        return cls(
+            row_count=int(data["row_count"]),
+            columns=[ColumnProfile.from_dict(c) for c in data.get("columns", [])],
+            duplicate_rows=int(data.get("duplicate_rows", 0)),
+            source=data.get("source"),
+            created_at=data.get("created_at"),
+        )
+
+    def save(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2))
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["DatasetProfile"]:
+        """Load a persisted profile, or None if missing/unreadable/outdated"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != PROFILE_VERSION:
+            return None
+        return cls.from_dict(data)
+
+def load_or_build_profile(data_file: Path, profile_file: Path) -> Optional[DatasetProfile]:
+    """Reuse the persisted profile if the source file is unchanged, otherwise rebuild it"""
+    data_file = Path(data_file)
+    if not data_file.exists():
+        return None
+    profile = DatasetProfile.load(profile_file)
+    if profile is not None and profile.matches_source(data_file):
+        return profile
+    profile = DatasetProfile.from_csv(data_file)
+    profile.save(profile_file)
+    return profile
@@ -0,0 +1,253 @@
+"""Engineer-1 | Chunked batch scoring
+
+Streams a dataset through a model chunk by chunk and writes one output
+partition per chunk: the input rows plus ``prediction`` and ``model_version``
+columns, as ``part-NNNNN.parquet`` (CSV without pyarrow). These are the
+columns the fairness sync expects.
+
+Up to ``parallelism`` chunks are scored at once. The reader stops once
+``max_pending`` chunks are waiting, so memory is bounded by
+``max_pending x chunksize`` rows however slow the model is. Each partition
+is written atomically, so one that exists is complete. A run for the same
+input fingerprint writes to the same directory, so an interrupted run
+resumes by skipping chunks whose partition already exists.
+
+The model is the serving API (``/predict``, same JSON contract as
+MLOps_Engineer4/app/integrations/serving_stub.py) or an in-process stand-in.
+
+    python -m MLOps_Engineer1.core.scoring.batch MLOps_Engineer1/data/adult_small.csv --chunksize 5000
+    python -m MLOps_Engineer1.core.scoring.batch data.csv --url http://127.0.0.1:8000 --parallelism 8
+"""
+import argparse
+import io
+import json
+import random
+import shutil
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from MLOps_Engineer1.core.ingestion.streaming import CsvChunkSource, DEFAULT_CHUNKSIZE
+from MLOps_Engineer1.core.integration.publish import atomic_write_bytes
+from MLOps_Engineer1.core.validation.fingerprint import dataset_fingerprint
+
+try:
+    import pyarrow  # noqa: F401 - parquet engine
+    PART_FORMAT = "parquet"
+except ImportError:  # pragma: no cover - optional dependency
+    PART_FORMAT = "csv"
+
+BASE_DIR = Path(__file__).resolve().parents[2]  # .../MLOps_Engineer1
+SCORES_DIR = BASE_DIR / "artifacts" / "scoring"
+MANIFEST_FILENAME = "_manifest.json"  # leading underscore: skipped by parquet dataset readers
+
+class LocalModel:
+    """In-process stand-in with the serving stub's rule, vectorized over a chunk"""
+
+    version = "local-stub"
+
+    def predict(self, chunk: pd.DataFrame) -> Tuple[np.ndarray, str]:
+        education = pd.to_numeric(chunk.get("education_num"), errors="coerce")
+        hours = pd.to_numeric(chunk.get("hours_per_week"), errors="coerce")
+        positive = ((education >= 13) & (hours >= 40)).to_numpy()
+        return np.where(positive, ">50K", "<=50K").astype(object), self.version
+
+class EndpointModel:
+    """The serving API's /predict, one call per chunk.
+
+    Connections are kept alive in a pool of ``pool_size`` (one per concurrent
+    chunk). Connection errors, timeouts and 429/5xx are retried with jittered
+    exponential backoff.
+    """
+
+    def __init__(self, url: str, timeout: float = 30.0, retries: int = 3, backoff: float = 0.2,
+                 pool_size: int = 4):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self._requests = requests
+        self.url = url.rstrip("/") + "/predict"
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def predict(self, chunk: pd.DataFrame) -> Tuple[List[Any], str]:
+        # to_json maps NaN to null and numpy scalars to JSON numbers
+        body = ('{"instances": ' + chunk.to_json(orient="records") + "}").encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        for attempt in range(self.retries + 1):
+            try:
+                resp = self._session.post(self.url, data=body, headers=headers, timeout=self.timeout)
+                if resp.status_code not in (429, 500, 502, 503, 504):
+                    resp.raise_for_status()
+                    result = resp.json()
+                    if len(result["predictions"]) != len(chunk):
+                        raise ValueError(f"/predict returned {len(result['predictions'])} predictions "
+                                         f"for {len(chunk)} rows")
+                    return result["predictions"], str(result.get("model_version", "unknown"))
+                error: Exception = RuntimeError(f"/predict returned {resp.status_code}")
+            except (self._requests.ConnectionError, self._requests.Timeout) as e:
+                error = e
+            if attempt == self.retries:
+                raise error
+            time.sleep(self.backoff * 2 ** attempt * (0.5 + random.random() / 2))
+        raise AssertionError("unreachable")
+
+    def close(self) -> None:
+        self._session.close()
+
+def _part_path(run_dir: Path, index: int) -> Path:
+    return run_dir / f"part-{index:05d}.{PART_FORMAT}"
+
+def completed_chunks(run_dir: Path) -> set:
+    """Indices of the chunks whose partition has been written"""
+    return {int(p.stem.split("-")[1]) for p in Path(run_dir).glob(f"part-*.{PART_FORMAT}")}
+
+def _write_part(path: Path, frame: pd.DataFrame) -> None:
+    buf = io.BytesIO()
+    if PART_FORMAT == "parquet":
+        frame.to_parquet(buf, index=False)
+    else:
+        buf.write(frame.to_csv(index=False).encode("utf-8"))
+    atomic_write_bytes(path, buf.getvalue())
+
+class BatchScorer:
+    def __init__(self, model, out_root: Path = SCORES_DIR, parallelism: int = 4,
+                 max_pending: Optional[int] = None):
+        if parallelism <= 0:
+            raise ValueError(f"parallelism must be positive, got {parallelism}")
+        self.model = model
+        self.out_root = Path(out_root)
+        self.parallelism = int(parallelism)
+        self.max_pending = max(int(max_pending or 2 * parallelism), self.parallelism)
+
+    def _score(self, run_dir: Path, index: int, chunk: pd.DataFrame) -> Tuple[int, int, str]:
+        predictions, version = self.model.predict(chunk)
+        _write_part(_part_path(run_dir, index), chunk.assign(prediction=predictions, model_version=version))
+        return index, len(chunk), version
+
+    def run(self, source: CsvChunkSource, fingerprint: Optional[str] = None, restart: bool = False) -> Dict[str, Any]:
+        """Score every chunk of ``source`` not already scored; returns the run manifest"""
+        fingerprint = fingerprint or dataset_fingerprint(source.paths)
+        run_dir = self.out_root / fingerprint[:16]
+        manifest_path = run_dir / MANIFEST_FILENAME
+        if restart and run_dir.exists():
+            shutil.rmtree(run_dir)
+        previous = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+        if previous.get("chunksize", source.chunksize) != source.chunksize:
+            raise ValueError(f"{run_dir} was scored in chunks of {previous['chunksize']} rows, not "
+                             f"{source.chunksize}; resume with that chunksize or pass restart=True")
+        done = completed_chunks(run_dir)
+        manifest = {"fingerprint": fingerprint, "paths": [str(p) for p in source.paths],
+                    "chunksize": source.chunksize, "format": PART_FORMAT, "status": "running",
+                    "started_at": datetime.now().isoformat(), "resumed_chunks": len(done)}
+        atomic_write_bytes(manifest_path, json.dumps(manifest, indent=2).encode())
+
+        rows = skipped_rows = chunks = 0
+        versions = set()
+        pending = set()
+        start = time.perf_counter()
+
+        def collect(block: bool) -> None:
+            nonlocal rows
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED) if block else (
+                {f for f in pending if f.done()}, None)
+            for future in finished:
+                pending.discard(future)
+                _, n, version = future.result()  # re-raises a failed chunk
+                rows += n
+                versions.add(version)
+
+        executor = ThreadPoolExecutor(max_workers=self.parallelism, thread_name_prefix="batch-score")
+        try:
+            for index, chunk in enumerate(source):
+                chunks += 1
+                if index in done:
+                    skipped_rows += len(chunk)
+                    continue
+                while len(pending) >= self.max_pending:
+                    collect(block=True)  # backpressure: stop reading until a chunk finishes
+                pending.add(executor.submit(self._score, run_dir, index, chunk))
+                collect(block=False)
+            while pending:
+                collect(block=True)
+        except BaseException:
+            # chunks already in flight still finish and are kept for the next run
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            manifest.update(status="failed", completed_chunks=len(completed_chunks(run_dir)))
+            atomic_write_bytes(manifest_path, json.dumps(manifest, indent=2).encode())
+            raise
+        executor.shutdown(wait=True)
+
+        elapsed = time.perf_counter() - start
+        manifest.update({
+            "status": "complete", "finished_at": datetime.now().isoformat(),
+            "run_dir": str(run_dir), "chunks": chunks, "rows": rows + skipped_rows,
+            "scored_rows": rows, "skipped_rows": skipped_rows,
+            "model_versions": sorted(versions | set(previous.get("model_versions", []))),
+            "seconds": round(elapsed, 3), "rows_per_sec": round(rows / elapsed, 1) if elapsed > 0 and rows else None,
+            "parallelism": self.parallelism, "max_pending": self.max_pending,
+        })
+        atomic_write_bytes(manifest_path, json.dumps(manifest, indent=2).encode())
+        return manifest
+
+def latest_run(out_root: Path = SCORES_DIR) -> Optional[Dict[str, Any]]:
+    """Manifest of the most recently finished complete run"""
+    manifests = []
+    for path in Path(out_root).glob(f"*/{MANIFEST_FILENAME}"):
+        try:
+            manifest = json.loads(path.read_text())
+        except (OSError, ValueError):
+            continue
+        if manifest.get("status") == "complete":
+            manifests.append(manifest)
+    return max(manifests, key=lambda m: m["finished_at"]) if manifests else None
+
+def load_scores(run_dir: Path, columns: Optional[List[str]] = None, last_part: bool = False) -> pd.DataFrame:
+    """All partitions of a run in chunk order (only the final one with ``last_part``)"""
+    parts = sorted(Path(run_dir).glob(f"part-*.{PART_FORMAT}"))
+    if not parts:
+        return pd.DataFrame()
+    if last_part:
+        parts = parts[-1:]
+    if PART_FORMAT == "parquet":
+        return pd.concat([pd.read_parquet(p, columns=columns) for p in parts], ignore_index=True)
+    return pd.concat([pd.read_csv(p, usecols=columns) for p in parts], ignore_index=True)
+
+def make_model(url: Optional[str] = None, parallelism: int = 4, timeout: float = 30.0):
+    """The serving API at ``url``, or the in-process stand-in when no URL is given"""
+    return EndpointModel(url, timeout=timeout, pool_size=parallelism) if url else LocalModel()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Score a CSV (or directory of CSV partitions) in chunks")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--url", default=None, help="serving API base URL (default: in-process stand-in model)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--parallelism", type=int, default=4, help="chunks scored concurrently")
+    parser.add_argument("--max-pending", type=int, default=None,
+                        help="chunks read ahead before the reader waits (default: 2 x parallelism)")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--out", type=Path, default=SCORES_DIR)
+    parser.add_argument("--restart", action="store_true", help="discard partitions from an earlier run")
+    args = parser.parse_args(argv)
+
+    source = CsvChunkSource.from_path(args.path, args.chunksize)
+    scorer = BatchScorer(make_model(args.url, args.parallelism, args.timeout), args.out,
+                         args.parallelism, args.max_pending)
+    print(json.dumps(scorer.run(source, restart=args.restart), indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""Engineer-1 | Mergeable validation accumulators
+
+Validation is reduced to partial results that can be computed per chunk,
+partition or appended slice and combined exactly: row count, per-column null
+counts and the observed dtype of each column. Merging follows pandas' own
+inference for concatenated CSV input, so the merged result produces the same
+issues as validating the whole file in one DataFrame.
+"""
+import hashlib
+import json
+import pandas as pd
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from MLOps_Engineer1.core.profiling.sketches import DatasetSketch
+
+NUMERIC_DTYPES = ("int64", "float64")
+TAIL_WINDOW = 64 * 1024  # bytes hashed to detect a rewritten (not appended) file
+
+def merge_dtype(a: str, b: str) -> str:
+    """dtype pandas infers for the concatenation of two columns read from CSV"""
+    if a == b:
+        return a
+    if a in NUMERIC_DTYPES and b in NUMERIC_DTYPES:
+        return "float64"
+    return "object"
+
+class ValidationAccumulator:
+    """Row count, per-column null counts and dtypes for a slice of a dataset"""
+
+    def __init__(self, row_count: int = 0, null_counts: Optional[Dict[str, int]] = None,
+                 dtypes: Optional[Dict[str, str]] = None):
+        self.row_count = row_count
+        self.null_counts = dict(null_counts or {})
+        self.dtypes = dict(dtypes or {})
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "ValidationAccumulator":
+        return cls(
+            row_count=len(df),
+            null_counts={str(name): int(count) for name, count in df.isna().sum().items()},
+            dtypes={str(name): str(df[name].dtype) for name in df.columns},
+        )
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[pd.DataFrame]) -> "ValidationAccumulator":
+        acc = cls()
+        for chunk in chunks:
+            acc.update(chunk)
+        return acc
+
+    def update(self, df: pd.DataFrame) -> "ValidationAccumulator":
+        """Fold one more chunk into this accumulator in place"""
+        merged = self.merge(ValidationAccumulator.from_frame(df))
+        self.row_count, self.null_counts, self.dtypes = merged.row_count, merged.null_counts, merged.dtypes
+        return self
+
+    def merge(self, other: "ValidationAccumulator") -> "ValidationAccumulator":
+        """Exact combination of two disjoint slices (self's rows first)"""
+        null_counts: Dict[str, int] = {}
+        dtypes: Dict[str, str] = {}
+        for name in list(self.dtypes) + [n for n in other.dtypes if n not in self.dtypes]:
+            # A column absent from one side is all-null (float64) for that side's rows
+            null_counts[name] = (self.null_counts.get(name, self.row_count)
+                                 + other.null_counts.get(name, other.row_count))
+            # Slices without rows carry no information about the inferred dtype
+            seen = [acc.dtypes.get(name, "float64") for acc in (self, other) if acc.row_count > 0]
+            if not seen:
+                seen = [self.dtypes.get(name) or other.dtypes[name]]
+            dtypes[name] = seen[0] if len(seen) == 1 else merge_dtype(*seen)
+        return ValidationAccumulator(self.row_count + other.row_count, null_counts, dtypes)
+
+    __add__ = merge
+
+    def to_issues(self, schema: dict) -> dict:
+        """Build the validation_results.json payload for this slice"""
+        issues = {"missing": {}, "dtypes": {}, "rules": {}, "ok": True}
+        null_fracs = pd.Series({name: count / self.row_count if self.row_count else float("nan")
+                                for name, count in self.null_counts.items()}, dtype="float64")
+
+        for col in schema["columns"]:
+            name = col["name"]; want = col["dtype"]; allow_null = col["allow_null"]
+
+            if name not in self.dtypes:
+                issues["dtypes"][name] = "missing column"; issues["ok"] = False; continue
+
+            got = self.dtypes[name]
+            if want not in got:
+                issues["dtypes"][name] = f"expected {want}, got {got}"; issues["ok"] = False
+
+            null_frac = null_fracs[name]
+            if not allow_null and null_frac > 0:
+                issues["missing"][name] = f"{null_frac:.2%} nulls (not allowed)"; issues["ok"] = False
+
+        max_null_fraction = float(schema["rules"]["max_null_fraction"])
+        global_null_frac = null_fracs.mean()
+        if global_null_frac > max_null_fraction:
+            issues["rules"]["max_null_fraction"] = f"{global_null_frac:.2%} > {max_null_fraction:.2%}"
+            issues["ok"] = False
+        return issues
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"row_count": self.row_count, "null_counts": self.null_counts, "dtypes": self.dtypes}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ValidationAccumulator":
+        return cls(int(data["row_count"]), data.get("null_counts"), data.get("dtypes"))
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ValidationAccumulator) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"ValidationAccumulator(rows={self.row_count}, columns={len(self.dtypes)})"
+
+def _tail_hash(path: Path, end: int) -> str:
+    with open(path, "rb") as f:
+        start = max(0, end - TAIL_WINDOW)
+        f.seek(start)
+        return hashlib.sha256(f.read(end - start)).hexdigest()
+
+def accumulate_csv(path: Path, chunksize: int, state: Optional[Dict[str, Any]] = None,
+                   sketch: bool = False) -> Dict[str, Any]:
+    """Accumulate one CSV file, reading only rows appended since ``state``.
+
+    ``state`` is the dict returned by a previous call for the same file. If the
+    file has only grown since then (same bytes up to the previous end), the
+    previous accumulator is reused and merged with the appended rows only;
+    otherwise the file is re-read from scratch. Returns the new state.
+
+    With ``sketch``, the state also carries a ``DatasetSketch`` of the rows read
+    by this call under ``"sketch"``; pop it before persisting the state.
+    """
+    path = Path(path)
+    size = path.stat().st_size
+    acc = None
+    offset = 0
+    if state and size >= state.get("bytes", -1) > 0 and state.get("columns"):
+        if _tail_hash(path, state["bytes"]) == state["tail_sha256"]:
+            acc = ValidationAccumulator.from_dict(state["accumulator"])
+            offset = state["bytes"]
+
+    sketched = DatasetSketch() if sketch else None
+    if acc is None:
+        acc = ValidationAccumulator()
+        with pd.read_csv(path, chunksize=chunksize) as reader:
+            for chunk in reader:
+                acc.update(chunk)
+                if sketched is not None:
+                    sketched.update(chunk)
+        columns = list(acc.dtypes)
+        if not columns:
+            columns = list(pd.read_csv(path, nrows=0).columns)
+    else:
+        columns = state["columns"]
+        if offset < size:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                with pd.read_csv(f, header=None, names=columns, chunksize=chunksize) as reader:
+                    for chunk in reader:
+                        acc.update(chunk)
+                        if sketched is not None:
+                            sketched.update(chunk)
+
+    # Only checkpoint at a line boundary so the next append starts on a fresh row
+    with open(path, "rb") as f:
+        f.seek(max(0, size - 1))
+        complete = size == 0 or f.read(1) == b"\n"
+    result = {
+        "path": str(path),
+        "bytes": size if complete else 0,
+        "tail_sha256": _tail_hash(path, size) if complete else None,
+        "columns": columns,
+        "accumulator": acc.to_dict(),
+    }
+    if sketched is not None:
+        result["sketch"] = sketched
+    return result
+
+def load_state(path: Path) -> Dict[str, Any]:
+    """Persisted per-file accumulator states, keyed by source path"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+def save_state(path: Path, states: Dict[str, Any]) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(states, indent=2))
@@ -0,0 +1,102 @@
+"""Engineer-1 | Streaming duplicate-row detection
+
+Rows are hashed chunk by chunk to 64-bit values with pandas' vectorized
+``hash_pandas_object``. Exact mode keeps the distinct hashes as one sorted
+uint64 array (8 bytes per distinct row, merged in linear time per chunk);
+approximate mode keeps only a HyperLogLog and reports rows minus estimated
+distinct rows, in constant memory. ``auto`` starts exact and degrades to
+approximate once the set would exceed ``max_exact`` hashes.
+
+Rows are canonicalised before hashing so a row hashes the same whatever
+dtype pandas inferred for its chunk: every value is hashed as its numeric
+value when it has one (so ``5`` and ``5.0`` agree) and as text otherwise.
+Two distinct rows collide with probability ~n²/2**65, negligible below
+billions of rows.
+"""
+import argparse
+import json
+import os
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from MLOps_Engineer1.core.profiling.sketches import HyperLogLog, row_hashes
+
+MODES = ("exact", "approx", "auto")
+MAX_EXACT = int(os.getenv("PULSEAI_DEDUP_MAX_EXACT", str(50_000_000)))  # ~400 MB of hashes
+
+class DuplicateCounter:
+    """Counts rows that repeat an earlier row, over any number of chunks"""
+
+    def __init__(self, mode: str = "auto", max_exact: int = MAX_EXACT, hll_p: int = 14,
+                 canonical: bool = True):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}, got {mode!r}")
+        self.mode = mode
+        self.max_exact = max_exact
+        self.canonical = canonical
+        self.rows = 0
+        self.duplicates = 0
+        self.hll = None if mode == "exact" else HyperLogLog(hll_p)
+        self._seen: Optional[np.ndarray] = None if mode == "approx" else np.empty(0, dtype=np.uint64)
+
+    @property
+    def exact(self) -> bool:
+        return self._seen is not None
+
+    def update(self, df: pd.DataFrame) -> "DuplicateCounter":
+        return self.update_hashes(row_hashes(df, self.canonical))
+
+    def update_hashes(self, hashes: np.ndarray) -> "DuplicateCounter":
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        self.rows += len(hashes)
+        if self.hll is not None:
+            self.hll.add_hashes(hashes)
+        if self._seen is None:
+            return self
+        uniq = np.unique(hashes)
+        pos = np.searchsorted(self._seen, uniq)
+        known = pos < len(self._seen)
+        known[known] = self._seen[pos[known]] == uniq[known]
+        self.duplicates += len(hashes) - len(uniq) + int(known.sum())
+        # both inputs are sorted, so the stable sort (timsort) is a linear merge
+        self._seen = np.sort(np.concatenate((self._seen, uniq[~known])), kind="stable")
+        if self.mode == "auto" and len(self._seen) > self.max_exact:
+            self._seen = None
+        return self
+
+    @property
+    def distinct(self) -> int:
+        if self._seen is not None:
+            return len(self._seen)
+        return min(self.rows, int(round(self.hll.estimate())))
+
+    @property
+    def duplicate_rows(self) -> int:
+        """Exact while the hash set is kept, otherwise rows minus estimated distinct rows"""
+        return self.duplicates if self._seen is not None else self.rows - self.distinct
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"rows": self.rows, "distinct": self.distinct, "duplicate_rows": self.duplicate_rows,
+                "exact": self.exact}
+
+def count_duplicates(chunks: Iterable[pd.DataFrame], mode: str = "auto",
+                     max_exact: int = MAX_EXACT) -> DuplicateCounter:
+    counter = DuplicateCounter(mode, max_exact)
+    for chunk in chunks:
+        counter.update(chunk)
+    return counter
+
+def main():
+    from MLOps_Engineer1.core.ingestion.streaming import CsvChunkSource, DEFAULT_CHUNKSIZE
+    parser = argparse.ArgumentParser(description="Count duplicate rows in a CSV file or directory in one pass")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--mode", choices=MODES, default="auto")
+    args = parser.parse_args()
+    source = CsvChunkSource.from_path(args.path, args.chunksize)
+    print(json.dumps(count_duplicates(source, args.mode).to_dict(), indent=2))
+
+if __name__ == "__main__":
+    main()
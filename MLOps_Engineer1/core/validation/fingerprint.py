@@ -0,0 +1,97 @@
+"""Engineer-1 | Validation fingerprints
+
+A cheap content address for "this dataset validated against this schema":
+file names, sizes and mtimes plus a hash of a few sampled blocks (head, tail
+and evenly spaced slices) of each file, combined with the hash of
+schema.yaml. Computing it reads a few hundred KB regardless of file size.
+
+Validated results are remembered per fingerprint so an unchanged run can
+reuse them instead of re-validating.
+"""
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from MLOps_Engineer1.core.integration.publish import atomic_write_bytes
+
+BASE_DIR = Path(__file__).resolve().parents[2]  # .../MLOps_Engineer1
+SCHEMA_PATH = BASE_DIR / "configs" / "schema.yaml"
+STORE_FILE = BASE_DIR / "artifacts" / "validation" / "state" / "fingerprints.json"
+
+SAMPLE_BLOCK = 16 * 1024
+SAMPLE_COUNT = 16
+
+def _sampled_hash(path: Path, size: int) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        if size <= SAMPLE_BLOCK * (SAMPLE_COUNT + 2):
+            h.update(f.read())
+        else:
+            offsets = [0, size - SAMPLE_BLOCK]
+            stride = (size - SAMPLE_BLOCK) // (SAMPLE_COUNT + 1)
+            offsets[1:1] = [stride * (i + 1) for i in range(SAMPLE_COUNT)]
+            for offset in offsets:
+                f.seek(offset)
+                h.update(f.read(SAMPLE_BLOCK))
+    return h.hexdigest()
+
+def file_fingerprint(path: Path) -> str:
+    path = Path(path)
+    stat = path.stat()
+    h = hashlib.sha256()
+    h.update(f"{path.name}|{stat.st_size}|{stat.st_mtime_ns}|".encode())
+    h.update(_sampled_hash(path, stat.st_size).encode())
+    return h.hexdigest()
+
+def dataset_fingerprint(paths: Iterable[Path], schema_path: Path = SCHEMA_PATH) -> str:
+    """Fingerprint of a set of data files validated against ``schema_path``"""
+    h = hashlib.sha256()
+    h.update(hashlib.sha256(Path(schema_path).read_bytes()).digest())
+    for path in sorted(Path(p) for p in paths):
+        h.update(file_fingerprint(path).encode())
+    return h.hexdigest()
+
+class FingerprintStore:
+    """Validation results keyed by fingerprint, plus the last published fingerprint"""
+
+    def __init__(self, path: Path = STORE_FILE, max_entries: int = 256):
+        self.path = Path(path)
+        self.max_entries = max_entries
+
+    def _read(self) -> Dict[str, Any]:
+        if not self.path.exists():
+            return {"published": None, "results": {}}
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {"published": None, "results": {}}
+
+    def _write(self, data: Dict[str, Any]) -> None:
+        # a crash mid-write must not leave a store that reads back as empty
+        atomic_write_bytes(self.path, json.dumps(data, indent=2).encode("utf-8"))
+
+    def get(self, fingerprint: str) -> Optional[dict]:
+        entry = self._read()["results"].get(fingerprint)
+        return entry["issues"] if entry else None
+
+    @property
+    def published(self) -> Optional[str]:
+        return self._read().get("published")
+
+    def put(self, fingerprint: str, issues: dict) -> None:
+        """Remember a validated result and mark it as the one currently published"""
+        data = self._read()
+        results = data["results"]
+        results.pop(fingerprint, None)
+        results[fingerprint] = {"issues": issues, "validated_at": datetime.now().isoformat()}
+        while len(results) > self.max_entries:
+            results.pop(next(iter(results)))
+        data["published"] = fingerprint
+        self._write(data)
+
+    def is_current(self, fingerprint: str) -> bool:
+        """True if this fingerprint was validated and its result is what is published now"""
+        data = self._read()
+        return data.get("published") == fingerprint and fingerprint in data["results"]
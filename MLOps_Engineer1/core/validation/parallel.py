@@ -0,0 +1,55 @@
+"""Engineer-1 | Parallel partition validation
+
+Fans a directory of CSV partitions out to a process pool. Each worker reduces
+one partition to a ValidationAccumulator state (only small dicts cross the
+process boundary), and the parent merges them in partition order into one
+report with a per-partition issue breakdown.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from MLOps_Engineer1.core.validation.accumulators import ValidationAccumulator, accumulate_csv
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+def _accumulate_partition(args: Tuple[str, int, Optional[Dict[str, Any]], bool]) -> Dict[str, Any]:
+    path, chunksize, state, sketch = args
+    return accumulate_csv(Path(path), chunksize, state, sketch)
+
+def accumulate_partitions(paths: List[Path], chunksize: int, workers: Optional[int] = None,
+                          states: Optional[Dict[str, Any]] = None, sketch: bool = False) -> Dict[str, Any]:
+    """Accumulate every partition, in parallel when there is more than one.
+
+    Returns the new per-partition states keyed by path, in partition order.
+    With ``sketch``, each state also carries a sketch of the rows it read.
+    """
+    states = states or {}
+    workers = min(workers or default_workers(), len(paths)) or 1
+    jobs = [(str(p), chunksize, states.get(str(p)), sketch) for p in paths]
+
+    if workers == 1:
+        results = [_accumulate_partition(job) for job in jobs]
+    else:
+        # spawn: pipeline steps run inside threaded ZenML/MLflow processes where fork is unsafe
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            results = list(pool.map(_accumulate_partition, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+    return {state["path"]: state for state in results}
+
+def build_report(partition_states: Dict[str, Any], schema: dict) -> dict:
+    """Merge partition states into one issues dict with a per-partition breakdown"""
+    merged = ValidationAccumulator()
+    partitions = {}
+    for path, state in partition_states.items():
+        acc = ValidationAccumulator.from_dict(state["accumulator"])
+        merged = merged.merge(acc)
+        partitions[Path(path).name] = {"rows": acc.row_count, **acc.to_issues(schema)}
+
+    issues = merged.to_issues(schema)
+    if len(partitions) > 1:
+        issues["partitions"] = partitions
+    return issues
@@ -0,0 +1,102 @@
+"""Known-value checks for atomic dashboard publishing and manifest versions.
+
+    python -m pytest MLOps_Engineer1/publish_test.py
+    python -m MLOps_Engineer1.publish_test
+"""
+import hashlib
+import json
+import multiprocessing
+import sys
+import tempfile
+from pathlib import Path
+
+from MLOps_Engineer1.core.integration.publish import (
+    MANIFEST_FILENAME, ManifestError, Publisher, atomic_write_bytes, read_manifest,
+)
+
+def test_commit_increments_version_and_skips_unchanged_files():
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        publisher = Publisher(data_dir)
+        assert read_manifest(data_dir) == {"version": 0, "files": {}}
+
+        assert publisher.write_json("a.json", {"x": 1})
+        manifest = read_manifest(data_dir)
+        data = (data_dir / "a.json").read_bytes()
+        assert manifest["version"] == 1 and manifest["changed"] == ["a.json"]
+        assert manifest["files"]["a.json"]["sha256"] == hashlib.sha256(data).hexdigest()
+        assert manifest["files"]["a.json"]["size"] == len(data)
+
+        # same content: the file is not rewritten and no version is committed
+        mtime = (data_dir / "a.json").stat().st_mtime_ns
+        assert not publisher.write_json("a.json", {"x": 1})
+        assert read_manifest(data_dir)["version"] == 1
+        assert (data_dir / "a.json").stat().st_mtime_ns == mtime
+
+        # a batch commits all its changed files as one version
+        with publisher.batch():
+            publisher.write_json("a.json", {"x": 1})
+            publisher.write_json("b.json", [1, 2])
+            publisher.write_json("c.json", None)
+        manifest = read_manifest(data_dir)
+        assert manifest["version"] == 2 and manifest["changed"] == ["b.json", "c.json"]
+        assert manifest["files"]["a.json"]["version"] == 1
+        assert publisher.changed_since(1) == ["b.json", "c.json"] and publisher.changed_since(2) == []
+
+        publisher.write_json("a.json", {"x": 2})
+        assert read_manifest(data_dir)["version"] == 3 and publisher.changed_since(2) == ["a.json"]
+        assert json.loads((data_dir / "a.json").read_text()) == {"x": 2}
+
+def test_atomic_write_leaves_no_temp_files():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "sub" / "f.json"
+        atomic_write_bytes(path, b"one")
+        atomic_write_bytes(path, b"two")
+        assert path.read_bytes() == b"two"
+        assert [p.name for p in path.parent.iterdir()] == ["f.json"]
+
+def test_unreadable_manifest_is_not_reset():
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        publisher = Publisher(data_dir)
+        publisher.write_json("a.json", {"x": 1})
+        (data_dir / MANIFEST_FILENAME).write_text('{"version": 7, "fi')
+        try:
+            publisher.write_json("a.json", {"x": 2})
+        except ManifestError:
+            pass
+        else:
+            raise AssertionError("a truncated manifest must not restart the version count")
+        assert (data_dir / MANIFEST_FILENAME).read_text() == '{"version": 7, "fi'
+
+def _publish_many(data_dir: str, worker: int, count: int) -> None:
+    publisher = Publisher(Path(data_dir))
+    for i in range(count):
+        publisher.write_json(f"w{worker}.json", {"i": i})
+
+def test_concurrent_commits_lose_no_entries():
+    with tempfile.TemporaryDirectory() as tmp:
+        ctx = multiprocessing.get_context("spawn")
+        workers = [ctx.Process(target=_publish_many, args=(tmp, w, 20)) for w in range(3)]
+        for p in workers:
+            p.start()
+        for p in workers:
+            p.join()
+        manifest = read_manifest(Path(tmp))
+        assert manifest["version"] == 60
+        assert sorted(manifest["files"]) == ["w0.json", "w1.json", "w2.json"]
+
+def main():
+    tests = [(name, fn) for name, fn in globals().items() if name.startswith("test_") and callable(fn)]
+    failed = 0
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"✅ {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {name}: {e}")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
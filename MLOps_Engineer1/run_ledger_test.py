@@ -0,0 +1,110 @@
+"""Known-value checks for the pipeline run ledger's Control Room figures.
+
+    python -m pytest MLOps_Engineer1/run_ledger_test.py
+    python -m MLOps_Engineer1.run_ledger_test
+"""
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from MLOps_Engineer1.core.monitoring.run_ledger import STALE_RUNNING, RunLedger, _midnight
+
+def _ledger(tmp: str) -> RunLedger:
+    return RunLedger(Path(tmp) / "runs.db")
+
+def _backdate(ledger: RunLedger, run_id: str, started_at: float) -> None:
+    with sqlite3.connect(ledger.path) as conn:
+        conn.execute("UPDATE runs SET started_at = ? WHERE run_id = ?", (started_at, run_id))
+
+def test_counts_across_statuses():
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = _ledger(tmp)
+        for rows, status in ((100, "succeeded"), (200, "succeeded"), (50, "failed"), (0, "skipped")):
+            with ledger.run("validation", fingerprint="fp") as run:
+                run.rows = rows
+                run.finish(status)
+        try:
+            with ledger.run("validation") as run:
+                run.rows = 10
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        with ledger.run("scoring") as run:
+            run.rows = 999
+
+        # skipped runs are neither batches nor part of the rate or totals
+        assert ledger.batches_today() == 4
+        assert ledger.success_rate() == 50.0  # 2 of 4 finished: succeeded, succeeded, failed, error
+        assert ledger.success_rate(window=None) == 50.0
+        assert ledger.total_processed() == 360
+        assert ledger.total_processed("scoring") == 999
+        assert ledger.success_rate("scoring") == 100.0
+        statuses = [r["status"] for r in ledger.recent(10, kind="validation")]
+        assert sorted(statuses) == ["error", "failed", "skipped", "succeeded", "succeeded"]
+        error = next(r for r in ledger.recent(10) if r["status"] == "error")
+        assert error["error"] == "RuntimeError: boom"
+
+def test_only_skipped_or_empty_is_none():
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = _ledger(tmp)
+        assert ledger.success_rate() is None and ledger.success_rate(window=None) is None
+        with ledger.run("validation") as run:
+            run.finish("skipped")
+        assert ledger.batches_today() == 0
+        assert ledger.success_rate() is None and ledger.success_rate(window=None) is None
+        assert ledger.total_processed() == 0
+        assert len(ledger.recent(5)) == 1
+
+def test_windows_and_queue_depth():
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = _ledger(tmp)
+        now = time.time()
+        with ledger.run("validation") as old:
+            old.finish("failed")
+        _backdate(ledger, old.run_id, _midnight(now) - 3600)  # yesterday, and outside a 1 s window
+        with ledger.run("validation") as run:
+            run.finish("succeeded")
+
+        assert ledger.batches_today(now=now) == 1
+        assert ledger.success_rate(window=now - _midnight(now) + 1, now=now) == 100.0
+        assert ledger.success_rate(window=None) == 50.0
+
+        # an unfinished run is queued until it is older than STALE_RUNNING
+        running = ledger.run("validation")
+        running.__enter__()
+        assert ledger.queue_depth(now=now) == 1
+        assert ledger.success_rate(window=None) == 50.0
+        _backdate(ledger, running.run_id, now - STALE_RUNNING - 1)
+        assert ledger.queue_depth(now=now) == 0
+
+def test_finish_is_final_and_checked():
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = _ledger(tmp)
+        with ledger.run("validation") as run:
+            run.finish("failed")
+            run.finish("succeeded")  # ignored: the run is already closed
+        assert ledger.recent(1)[0]["status"] == "failed"
+        try:
+            with ledger.run("validation") as run:
+                run.finish("done")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("an unknown status must be rejected")
+
+def main():
+    tests = [(name, fn) for name, fn in globals().items() if name.startswith("test_") and callable(fn)]
+    failed = 0
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"✅ {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {name}: {e}")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
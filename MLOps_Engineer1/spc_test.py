@@ -0,0 +1,89 @@
+"""Known-value checks for the SPC engine and its Western Electric rules.
+
+    python -m pytest MLOps_Engineer1/spc_test.py
+    python -m MLOps_Engineer1.spc_test
+"""
+import sys
+import numpy as np
+
+from MLOps_Engineer1.core.monitoring.spc import TAIL, SPCEngine, cusum, western_electric
+
+def _flagged(values, rule, n_prefix=0):
+    return np.flatnonzero(western_electric(np.asarray(values, dtype=float), 0.0, 1.0, n_prefix)[rule]).tolist()
+
+def test_beyond_3sigma():
+    assert _flagged([0, 3.5, 0, -3.2, 2.9], "beyond_3sigma") == [1, 3]
+
+def test_2_of_3_beyond_2sigma():
+    assert _flagged([2.5, 0, 2.5, 0, 0], "2_of_3_beyond_2sigma") == [2]
+    # only full windows count: the first two points are flagged once a third arrives
+    assert _flagged([-2.1, -2.2, 0, 0], "2_of_3_beyond_2sigma") == [2]
+    assert _flagged([0, -2.1, -2.2, 0, 0], "2_of_3_beyond_2sigma") == [2, 3]
+    # the two points must be on the same side
+    assert _flagged([2.5, -2.5, 0], "2_of_3_beyond_2sigma") == []
+
+def test_4_of_5_beyond_1sigma():
+    assert _flagged([1.5, 1.5, 0, 1.5, 1.5], "4_of_5_beyond_1sigma") == [4]
+    assert _flagged([1.5, 1.5, 0, 1.5, 0], "4_of_5_beyond_1sigma") == []
+
+def test_8_same_side():
+    assert _flagged([0.1] * 8, "8_same_side") == [7]
+    assert _flagged([0.1] * 7 + [-0.1], "8_same_side") == []
+    assert _flagged([-0.1] * 9, "8_same_side") == [7, 8]
+
+def test_rules_with_history_prefix():
+    # rules over appended points, given the previous TAIL points as history, match one pass
+    rng = np.random.default_rng(0)
+    values = np.concatenate((rng.normal(size=200), rng.normal(1.2, 1.0, size=100)))
+    whole = western_electric(values, 0.0, 1.0)
+    for split in (1, 5, 150, 299):
+        history = values[max(0, split - TAIL):]
+        part = western_electric(history, 0.0, 1.0, n_prefix=min(split, TAIL))
+        for rule, flags in whole.items():
+            assert (part[rule] == flags[split:]).all(), (rule, split)
+
+def test_cusum_known_values():
+    assert np.allclose(cusum(np.array([1.0, 2.0, 0.0, 0.0]), 0.5), [0.5, 2.0, 1.5, 1.0])
+    assert np.allclose(cusum(np.array([0.0, 0.0]), 0.5, start=0.7), [0.2, 0.0])
+
+def test_limits_known_values():
+    engine = SPCEngine(subgroup_size=5)
+    engine.append_subgroups(np.array([[1, 2, 3, 4, 5], [2, 3, 4, 5, 6]]))
+    lim = engine.limits()
+    # X-bar 3 and 4, ranges 4: centre 3.5, UCL/LCL 3.5 +- A2(5) * 4, R UCL D4(5) * 4
+    assert lim["mean"] == 3.5 and lim["r_bar"] == 4.0
+    assert np.isclose(lim["ucl"], 3.5 + 0.577 * 4) and np.isclose(lim["lcl"], 3.5 - 0.577 * 4)
+    assert np.isclose(lim["r_ucl"], 2.114 * 4) and lim["r_lcl"] == 0.0
+
+def test_incremental_appends_match_one_pass():
+    rng = np.random.default_rng(1)
+    values = rng.normal(40, 5, size=(300, 5))
+    values[200:] += 4  # a shift the rules should catch
+    one = SPCEngine(subgroup_size=5)
+    one.append_subgroups(values)
+    assert any(v["rule"] == "beyond_3sigma" for v in one.violations)
+    # limits are running sums: they move with every append, so compare appends of the same
+    # batches through a save/load round trip against appending them directly
+    direct, restored = SPCEngine(subgroup_size=5), SPCEngine(subgroup_size=5)
+    for start in range(0, 300, 37):
+        direct.append_subgroups(values[start:start + 37])
+        restored = SPCEngine.from_dict(restored.to_dict())
+        restored.append_subgroups(values[start:start + 37])
+    assert restored.n_batches == direct.n_batches == 300
+    assert np.isclose(restored.center, one.center) and np.isclose(restored.r_bar, one.r_bar)
+    assert restored.chart() == direct.chart()
+
+def main():
+    tests = [(name, fn) for name, fn in globals().items() if name.startswith("test_") and callable(fn)]
+    failed = 0
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"✅ {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {name}: {e}")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Known-value checks for the drift tests and the profiling sketches.
+
+    python -m pytest MLOps_Engineer1/stats_test.py
+    python -m MLOps_Engineer1.stats_test
+"""
+import sys
+import numpy as np
+import pandas as pd
+
+from MLOps_Engineer1.core.monitoring.drift import (
+    MAX_CATEGORIES, ReferenceProfile, chi2_sf, chi2_test, kolmogorov_sf, ks_test, reference_key,
+)
+from MLOps_Engineer1.core.profiling.sketches import HyperLogLog, TDigest, TopK
+
+def test_chi2_sf_critical_points():
+    # upper 5% points of the chi-square distribution (standard tables)
+    x = np.array([3.841, 5.991, 11.070, 18.307, 124.342])
+    dof = np.array([1, 2, 5, 10, 100])
+    assert np.allclose(chi2_sf(x, dof), 0.05, atol=1e-4)
+    # lower 5% point of df=1 and the two edges of the support
+    assert abs(float(chi2_sf(np.array([0.0039321]), np.array([1]))[0]) - 0.95) < 1e-4
+    assert chi2_sf(np.array([0.0]), np.array([3]))[0] == 1.0
+    assert chi2_sf(np.array([1e4]), np.array([3]))[0] < 1e-12
+
+def test_chi2_test_homogeneous_and_shifted():
+    ref = np.array([[250, 250, 250, 250]])
+    stat, p = chi2_test(ref, ref * 2)
+    assert stat[0] == 0.0 and p[0] == 1.0
+    stat, p = chi2_test(ref, np.array([[400, 200, 200, 200]]))
+    assert stat[0] > 0 and p[0] < 1e-6
+
+def test_kolmogorov_sf_critical_points():
+    # asymptotic Kolmogorov critical values: lambda 1.2238 -> 10%, 1.3581 -> 5%, 1.6276 -> 1%
+    n_eff = np.full(3, 1e8)
+    p = kolmogorov_sf(np.array([1.2238, 1.3581, 1.6276]) / np.sqrt(n_eff), n_eff)
+    assert np.allclose(p, [0.10, 0.05, 0.01], atol=1e-3)
+    assert kolmogorov_sf(np.array([0.0]), np.array([100.0]))[0] == 1.0
+
+def test_ks_test_identical_and_shifted():
+    rng = np.random.default_rng(0)
+    reference = ReferenceProfile.fit(pd.DataFrame({"x": rng.normal(size=20_000)}))
+    same = reference.histogram(pd.DataFrame({"x": rng.normal(size=20_000)}))
+    shifted = reference.histogram(pd.DataFrame({"x": rng.normal(0.2, 1.0, size=20_000)}))
+
+    stat, p = ks_test(reference.counts.numeric[:, :-1], reference.counts.numeric[:, :-1])
+    assert stat[0] == 0.0 and p[0] == 1.0
+    _, p = ks_test(reference.counts.numeric[:, :-1], same.numeric[:, :-1])
+    assert p[0] > 0.01
+    stat, p = ks_test(reference.counts.numeric[:, :-1], shifted.numeric[:, :-1])
+    # D of two unit normals 0.2 apart is 2 * Phi(0.1) - 1 = 0.0797
+    assert abs(stat[0] - 0.0797) < 0.01 and p[0] < 1e-20
+    assert reference.compare(shifted)["drifted_columns"] == ["x"]
+
+def test_reference_histogram_counts():
+    reference = ReferenceProfile(["x"], [[1.0, 2.0, 3.0]], ["c"], [["a", "b"]], bins=1, resolution=4)
+    df = pd.DataFrame({"x": [0.0, 1.0, 1.5, 2.0, 3.0, 5.0, np.nan],
+                       "c": ["a", "b", "b", "z", None, "a", "a"]})
+    hist = reference.histogram(df)
+    assert hist.rows == 7
+    # (-inf, 1], (1, 2], (2, 3], (3, inf), missing
+    assert hist.numeric.tolist() == [[2, 2, 1, 1, 1]]
+    expected = np.zeros(MAX_CATEGORIES + 2, dtype=np.int64)
+    expected[[0, 1, MAX_CATEGORIES, MAX_CATEGORIES + 1]] = [3, 2, 1, 1]
+    assert hist.categorical.tolist() == [expected.tolist()]
+
+def test_histogram_chunks_add_up():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({"x": rng.normal(size=5_000), "c": rng.choice(list("abcde"), size=5_000)})
+    reference = ReferenceProfile.fit(df)
+    # the reference bins its own rows into equal quantile bins
+    assert (reference._coarse(reference.counts.numeric)[0, :-1] == 500).all()
+    chunked = reference.histogram_chunks(df.iloc[i:i + 1_000] for i in range(0, len(df), 1_000))
+    assert chunked.rows == reference.counts.rows
+    assert (chunked.numeric == reference.counts.numeric).all()
+    assert (chunked.categorical == reference.counts.categorical).all()
+
+def test_reference_key_sees_duplicate_rows():
+    # pairs of identical rows must not cancel out of the key
+    assert reference_key(pd.DataFrame({"x": [1, 2, 5, 5]})) != reference_key(pd.DataFrame({"x": [1, 2, 99, 99]}))
+    assert reference_key(pd.DataFrame({"x": [1, 2]})) != reference_key(pd.DataFrame({"x": [2, 1]}))
+    assert reference_key(pd.DataFrame({"x": [1, 2]})) == reference_key(pd.DataFrame({"x": [1, 2]}))
+
+def test_tdigest_quantiles():
+    rng = np.random.default_rng(2)
+    x = rng.normal(size=200_000)
+    digest = TDigest().add(x[:100_000]) + TDigest().add(x[100_000:])
+    q = np.array([0.001, 0.01, 0.25, 0.5, 0.75, 0.99, 0.999])
+    rank = np.searchsorted(np.sort(x), digest.quantile(q)) / len(x)
+    assert np.abs(rank - q).max() < 1e-3
+    assert digest.quantile(0.0) == x.min() and digest.quantile(1.0) == x.max()
+    assert digest.count == len(x) and len(digest.means) <= 200
+
+def test_hyperloglog_error_bound():
+    hll = HyperLogLog(p=14)
+    bound = 3 * 1.04 / np.sqrt(hll.m)
+    for n in (1_000, 100_000, 1_000_000):
+        estimate = HyperLogLog(p=14).add_hashes(np.arange(n, dtype=np.uint64)).estimate()
+        assert abs(estimate - n) / n < bound, (n, estimate)
+    # duplicates do not count, and merging gives the union
+    a = HyperLogLog(p=14).add_hashes(np.arange(0, 60_000, dtype=np.uint64))
+    b = HyperLogLog(p=14).add_hashes(np.arange(40_000, 100_000, dtype=np.uint64))
+    b.add_hashes(np.arange(40_000, 100_000, dtype=np.uint64))
+    assert abs((a + b).estimate() - 100_000) / 100_000 < bound
+
+def test_topk_misra_gries_guarantees():
+    rng = np.random.default_rng(3)
+    heavy = np.repeat(["h0", "h1", "h2"], [3_000, 2_000, 1_000])
+    values = pd.Series(np.concatenate((heavy, rng.integers(0, 50_000, size=14_000).astype(str))))
+    values = values.sample(frac=1.0, random_state=0).reset_index(drop=True)
+    truth = values.value_counts()
+    sketch = TopK(capacity=64)
+    for start in range(0, len(values), 2_500):
+        sketch = sketch + TopK(capacity=64).add(values.iloc[start:start + 2_500])
+    assert sketch.total == len(values) and len(sketch.counts) <= 64
+    assert sketch.error <= len(values) / 64
+    for value, count in sketch.counts.items():
+        assert count <= truth[value] <= count + sketch.error
+    # anything above total / capacity is kept, in order
+    assert [v for v, _ in sketch.top(3)] == ["h0", "h1", "h2"]
+    # below capacity the counts are exact
+    exact = TopK(capacity=64).add(pd.Series(["a", "b", "b", None, "c", "c", "c"]))
+    assert exact.top() == [("c", 3), ("b", 2), ("a", 1)] and exact.error == 0 and exact.total == 6
+
+def main():
+    tests = [(name, fn) for name, fn in globals().items() if name.startswith("test_") and callable(fn)]
+    failed = 0
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"✅ {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {name}: {e}")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Known-value checks for the mergeable validation accumulators.
+
+    python -m pytest MLOps_Engineer1/validation_test.py
+    python -m MLOps_Engineer1.validation_test
+"""
+import io
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from MLOps_Engineer1.core.validation.accumulators import ValidationAccumulator, accumulate_csv
+from MLOps_Engineer1.core.validation.parallel import build_report
+
+SCHEMA = {
+    "columns": [
+        {"name": "age", "dtype": "int64", "allow_null": False},
+        {"name": "hours", "dtype": "int64", "allow_null": False},
+        {"name": "code", "dtype": "int64", "allow_null": True},
+        {"name": "workclass", "dtype": "object", "allow_null": True},
+        {"name": "late", "dtype": "float64", "allow_null": True},
+    ],
+    "rules": {"max_null_fraction": 0.1},
+}
+
+# chunks of 4 rows: hours gains a null in the third chunk (int64 -> float64), code turns
+# into text in the second (int64 -> object), late is all-null until the last chunk
+CSV = """age,hours,code,workclass,late
+39,40,1,State-gov,
+50,13,2,Private,
+38,40,3,,
+53,40,4,Private,
+28,40,A7,Private,
+37,40,B2,,
+49,16,9,Private,
+52,45,4,Self-emp,
+31,,5,Private,
+42,40,6,Private,
+37,80,7,,
+30,40,8,State-gov,2.5
+"""
+
+def _whole() -> pd.DataFrame:
+    return pd.read_csv(io.StringIO(CSV))
+
+def _chunks(chunksize: int = 4):
+    return pd.read_csv(io.StringIO(CSV), chunksize=chunksize)
+
+def test_merged_chunks_equal_whole_frame():
+    whole = ValidationAccumulator.from_frame(_whole())
+    assert whole.dtypes == {"age": "int64", "hours": "float64", "code": "object",
+                            "workclass": "object", "late": "float64"}
+    for chunksize in (1, 3, 4, 5, 12):
+        merged = ValidationAccumulator.from_chunks(_chunks(chunksize))
+        assert merged == whole, (chunksize, merged.to_dict(), whole.to_dict())
+        assert merged.to_issues(SCHEMA) == whole.to_issues(SCHEMA)
+
+def test_merge_order_and_empty_slices():
+    parts = [ValidationAccumulator.from_frame(c) for c in _chunks(4)]
+    left = (parts[0] + parts[1]) + parts[2]
+    right = parts[0] + (parts[1] + parts[2])
+    assert left == right
+    # a header-only slice changes nothing
+    empty = ValidationAccumulator.from_frame(_whole().iloc[:0])
+    assert empty + left == left and left + empty == left
+
+def test_issues_known_values():
+    issues = ValidationAccumulator.from_frame(_whole()).to_issues(SCHEMA)
+    assert not issues["ok"]
+    assert issues["dtypes"] == {"hours": "expected int64, got float64", "code": "expected int64, got object"}
+    assert issues["missing"] == {"hours": "8.33% nulls (not allowed)"}
+    # (0 + 1 + 0 + 3 + 11) / 12 / 5 columns
+    assert issues["rules"] == {"max_null_fraction": "25.00% > 10.00%"}
+
+def test_build_report_merges_partitions():
+    states = {f"part-{i}.csv": {"accumulator": ValidationAccumulator.from_frame(c).to_dict()}
+              for i, c in enumerate(_chunks(6))}
+    report = build_report(states, SCHEMA)
+    whole = ValidationAccumulator.from_frame(_whole()).to_issues(SCHEMA)
+    assert {k: v for k, v in report.items() if k != "partitions"} == whole
+    assert [p["rows"] for p in report["partitions"].values()] == [6, 6]
+
+def test_accumulate_csv_reads_only_appended_rows():
+    lines = CSV.splitlines(keepends=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "data.csv"
+        path.write_text("".join(lines[:7]))
+        state = accumulate_csv(path, chunksize=4)
+        assert state["accumulator"]["row_count"] == 6
+        with open(path, "a") as f:
+            f.write("".join(lines[7:]))
+        state = accumulate_csv(path, chunksize=4, state=state, sketch=True)
+        assert ValidationAccumulator.from_dict(state["accumulator"]) == ValidationAccumulator.from_frame(_whole())
+        assert state.pop("sketch").rows == 6  # only the appended rows were read
+
+        # a rewritten (not appended) file is read again from the start
+        path.write_text(CSV.replace("39,40,1", "40,40,1"))
+        state = accumulate_csv(path, chunksize=4, state=state, sketch=True)
+        assert state.pop("sketch").rows == 12
+        assert state["accumulator"]["row_count"] == 12
+
+def main():
+    tests = [(name, fn) for name, fn in globals().items() if name.startswith("test_") and callable(fn)]
+    failed = 0
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"✅ {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {name}: {e}")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
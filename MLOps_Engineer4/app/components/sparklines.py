@@ -0,0 +1,49 @@
+import math
+import pandas as pd
+import streamlit as st  # type: ignore
+
+PAGE_SIZE = 50        # parameter rows per page
+MAX_SPARK_POINTS = 60 # points kept per sparkline
+
+def _thin(series, max_points=MAX_SPARK_POINTS):
+    """Evenly strided subset so every sparkline ships a bounded payload"""
+    series = list(series)
+    if len(series) <= max_points:
+        return series
+    step = len(series) / max_points
+    return [series[int(i * step)] for i in range(max_points - 1)] + [series[-1]]
+
+def parameter_grid(params, page_size=PAGE_SIZE, key="params"):
+    """All parameter sparklines as one virtualised table instead of one chart per row.
+
+    Streamlit draws the LineChartColumn cells client-side and only for rows in view,
+    so render cost stays flat as the parameter count grows; pages bound the payload.
+    """
+    if not params:
+        st.info("No parameters available.")
+        return
+
+    pages = math.ceil(len(params) / page_size)
+    page = 1
+    if pages > 1:
+        page = int(st.number_input(f"Page (1–{pages})", min_value=1, max_value=pages, value=1, key=f"{key}-page"))
+    rows = params[(page - 1) * page_size: page * page_size]
+
+    df = pd.DataFrame({
+        "Parameter": [p["name"] for p in rows],
+        "Trend": [_thin(p["spark"]) for p in rows],
+        "OOC %": [float(p["ooc"]) for p in rows],
+        "Status": ["✅" if p["pass"] else "❌" for p in rows],
+    })
+    st.dataframe(
+        df,
+        hide_index=True,
+        use_container_width=True,
+        height=min(38 + 35 * len(df), 38 + 35 * 15),
+        column_config={
+            "Parameter": st.column_config.TextColumn(width="medium"),
+            "Trend": st.column_config.LineChartColumn(width="large"),
+            "OOC %": st.column_config.ProgressColumn(format="%.2f%%", min_value=0, max_value=100),
+            "Status": st.column_config.TextColumn(width="small"),
+        },
+    )
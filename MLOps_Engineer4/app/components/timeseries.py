@@ -0,0 +1,27 @@
+from datetime import timedelta
+import streamlit as st  # type: ignore
+from utils.data import series_bounds, load_series
+
+DEFAULT_DAYS = 30      # initial zoom: the most recent month
+SLIDER_STEPS = 2000    # resolution of the zoom slider
+
+def zoom_range(series, key, default_days=DEFAULT_DAYS):
+    """Date-range slider over a series' history; moving it re-queries that range"""
+    bounds = series_bounds(series)
+    if bounds is None:
+        return None, None
+    lo, hi = bounds
+    if lo == hi:
+        return lo, hi
+    step = max(timedelta(minutes=1), (hi - lo) / SLIDER_STEPS)
+    return st.slider("Zoom", min_value=lo, max_value=hi, value=(max(lo, hi - timedelta(days=default_days)), hi),
+                     step=step, format="YYYY-MM-DD HH:mm", key=key)
+
+def zoomed_series(series, fields, key):
+    """Downsampled long-format points for the selected range, with a resolution caption"""
+    start, end = zoom_range(series, key)
+    df = load_series(series, fields, start, end)
+    total = df.attrs.get("total_points", 0)
+    if len(df) and total > df["metric"].value_counts().max():
+        st.caption(f"Showing {len(df):,} of {total * len(fields):,} points — zoom in for full resolution.")
+    return df
@@ -0,0 +1,36 @@
+"""
+Engineer 1 – Time-series store
+Read-only access to the SQLite store the E1 sync appends dashboard series to
+(MLOps_Engineer1.core.monitoring.timeseries). The dashboard never writes to it.
+Supports dummy mode via env var PULSEAI_USE_DUMMY=1. In dummy mode, when
+MLOps_Engineer1 is not importable, or before the first sync has created the
+store, open_series_store returns None and the tabs read the JSON files instead.
+"""
+from pathlib import Path
+from typing import Optional
+import os
+
+USE_DUMMY = os.getenv("PULSEAI_USE_DUMMY", "0")  # "1" -> dummy
+
+if USE_DUMMY == "1":
+    def open_series_store(path: Path) -> Optional[object]:
+        return None
+
+else:
+    try:
+        from MLOps_Engineer1.core.monitoring.timeseries import TimeSeriesStore
+
+        def open_series_store(path: Path) -> Optional[object]:
+            """The store at ``path`` opened read-only, or None if it does not exist yet"""
+            if not Path(path).exists():
+                return None
+            try:
+                return TimeSeriesStore(path, read_only=True)
+            except Exception:
+                return None
+
+    except Exception as e:
+        _import_error = str(e)  # `e` itself is unbound once the except block ends
+
+        def open_series_store(path: Path) -> Optional[object]:
+            return None
@@ -1,7 +1,69 @@
-"""Engineer 2 — Monitoring & Fairness (Evidently + Fairlearn)
-
-# TODO: add HTTP client to fetch JSON reports from monitoring service.
-# def fetch_drift_report(): ...
-# def fetch_fairness_report(): ...
+"""Engineer 2 — Monitoring & Fairness
+Drift is computed in-process by MLOps_Engineer1.core.monitoring.drift (PSI, KS and
+chi-square against a frozen reference profile); fairness slices by
+MLOps_Engineer1.core.monitoring.fairness. No monitoring service is called.
+Supports dummy mode via env var PULSEAI_USE_DUMMY=1.
 """
-# Placeholder only — no runtime code.
+from typing import Dict
+import os
+
+USE_DUMMY = os.getenv("PULSEAI_USE_DUMMY", "0")  # "1" -> dummy
+
+if USE_DUMMY == "1":
+    def fetch_drift_report() -> Dict:
+        return {"p_value": None, "drifted_columns": [], "columns": {},
+                "note": "Dummy mode enabled (PULSEAI_USE_DUMMY=1)."}
+
+    def check_drift(reference, current, alpha: float = 0.05) -> Dict:
+        return fetch_drift_report()
+
+    def fetch_fairness_report() -> Dict:
+        return {"meta": {}, "slices": [], "note": "Dummy mode enabled (PULSEAI_USE_DUMMY=1)."}
+
+else:
+    try:
+        from MLOps_Engineer1.core.monitoring.drift import ReferenceProfile, load_report
+        from MLOps_Engineer1.core.monitoring.fairness import FairnessCache
+
+        def fetch_drift_report() -> Dict:
+            """Per-column report of the latest drift check run by the E1 sync"""
+            try:
+                report = load_report()
+            except Exception as e:
+                return {"p_value": None, "drifted_columns": [], "columns": {},
+                        "error": f"drift report unreadable: {e}"}
+            if report is None:
+                return {"p_value": None, "drifted_columns": [], "columns": {},
+                        "note": "No drift check has run yet."}
+            return report
+
+        def check_drift(reference, current, alpha: float = 0.05) -> Dict:
+            """Ad-hoc drift report of one DataFrame against another"""
+            try:
+                return ReferenceProfile.fit(reference).compare(current, alpha)
+            except Exception as e:
+                return {"p_value": None, "drifted_columns": [], "columns": {},
+                        "error": f"drift check failed: {e}"}
+
+        def fetch_fairness_report() -> Dict:
+            """Every slice of the latest fairness computation, as records"""
+            try:
+                entry = FairnessCache().latest()
+            except Exception as e:
+                return {"meta": {}, "slices": [], "error": f"fairness cache unreadable: {e}"}
+            if entry is None:
+                return {"meta": {}, "slices": [], "note": "No fairness metrics have been computed yet."}
+            return {"meta": entry["meta"], "slices": entry["slices"].to_dict("records")}
+
+    except Exception as e:
+        _import_error = str(e)  # `e` itself is unbound once the except block ends
+
+        def fetch_drift_report() -> Dict:
+            return {"p_value": None, "drifted_columns": [], "columns": {},
+                    "error": f"MLOps_Engineer1 not importable: {_import_error}"}
+
+        def check_drift(reference, current, alpha: float = 0.05) -> Dict:
+            return fetch_drift_report()
+
+        def fetch_fairness_report() -> Dict:
+            return {"meta": {}, "slices": [], "error": f"MLOps_Engineer1 not importable: {_import_error}"}
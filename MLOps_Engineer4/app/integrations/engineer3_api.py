@@ -1,6 +1,252 @@
 """Engineer 3 — APIs & Serving (FastAPI)
+Typed client for the serving API: /predict, /status and /rollback.
 
-# TODO: add typed client for /predict, /status, /rollback endpoints.
-# class ModelAPI: ...
+One keep-alive connection pool (a requests Session) serves the sync
+``ModelAPI`` and the asyncio ``AsyncModelAPI``. At most ``max_concurrency``
+requests are in flight. Single-row ``predict_one`` calls from any number of
+threads or tasks are coalesced into batched /predict calls: a batch closes
+after ``max_batch`` rows or ``max_wait_ms``, whichever comes first. Requests
+time out after ``timeout`` seconds. Connection errors, timeouts and
+429/502/503/504 responses are retried with jittered exponential backoff.
+
+Local stand-in server: integrations/serving_stub.py. Benchmark: scripts/bench_serving.py.
+Configured via PULSEAI_API_URL and friends; PULSEAI_USE_DUMMY=1 makes the
+fetch_* helpers return placeholders without any network call.
 """
-# Placeholder only — no runtime code.
+import asyncio
+import os
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Mapping, Optional, Sequence, TypedDict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+USE_DUMMY = os.getenv("PULSEAI_USE_DUMMY", "0")  # "1" -> dummy
+API_URL = os.getenv("PULSEAI_API_URL", "http://127.0.0.1:8000")
+TIMEOUT = float(os.getenv("PULSEAI_API_TIMEOUT", "5"))
+MAX_CONCURRENCY = int(os.getenv("PULSEAI_API_CONCURRENCY", "8"))
+MAX_BATCH = int(os.getenv("PULSEAI_API_MAX_BATCH", "64"))
+MAX_WAIT_MS = float(os.getenv("PULSEAI_API_MAX_WAIT_MS", "2"))
+
+RETRY_STATUS = {429, 502, 503, 504}
+
+class PredictResponse(TypedDict):
+    predictions: List[Any]
+    model_version: str
+
+class ModelStatus(TypedDict, total=False):
+    model_version: str
+    status: str
+    uptime_s: float
+    requests: int
+    rows: int
+    history: List[str]
+
+class RollbackResponse(TypedDict):
+    model_version: str
+    previous_version: str
+    status: str
+
+class APIError(Exception):
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+_STOP = object()
+
+class _MicroBatcher:
+    """Coalesces single rows submitted from any thread into batched calls of ``send``"""
+
+    def __init__(self, send, executor: ThreadPoolExecutor, max_batch: int, max_wait_ms: float):
+        self._send = send
+        self._executor = executor
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, row: Mapping[str, Any]) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="predict-batcher", daemon=True)
+                self._thread.start()
+        self._queue.put((row, future))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    self._queue.put(_STOP)  # finish this batch, then stop
+                    break
+                batch.append(item)
+            # the executor bounds how many batches are in flight
+            self._executor.submit(self._dispatch, batch)
+
+    def _dispatch(self, batch) -> None:
+        try:
+            predictions = self._send([row for row, _ in batch])["predictions"]
+            if len(predictions) != len(batch):
+                raise APIError(f"/predict returned {len(predictions)} predictions for {len(batch)} rows")
+        except BaseException as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), prediction in zip(batch, predictions):
+            future.set_result(prediction)
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+
+class ModelAPI:
+    """Sync client; safe to share between threads"""
+
+    def __init__(self, base_url: str = API_URL, timeout: float = TIMEOUT, max_concurrency: int = MAX_CONCURRENCY,
+                 max_batch: int = MAX_BATCH, max_wait_ms: float = MAX_WAIT_MS, retries: int = 3,
+                 backoff: float = 0.05, backoff_max: float = 2.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self._session = requests.Session()
+        # pool_block: callers wait for a free keep-alive connection rather than opening extra ones
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency, pool_block=True, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="model-api")
+        self._batcher = _MicroBatcher(self.predict, self._executor, max_batch, max_wait_ms)
+
+    def _request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None,
+                 idempotent: bool = True) -> Dict[str, Any]:
+        url = f"{self.base_url}{path}"
+        retries = self.retries if idempotent else 0
+        for attempt in range(retries + 1):
+            retry_after = None
+            try:
+                resp = self._session.request(method, url, json=payload, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = APIError(f"{method} {path} failed: {e}")
+            else:
+                if resp.status_code < 400:
+                    return resp.json()
+                error = APIError(f"{method} {path} returned {resp.status_code}: {resp.text[:200]}", resp.status_code)
+                if resp.status_code not in RETRY_STATUS:
+                    raise error
+                retry_after = resp.headers.get("Retry-After")
+            if attempt == retries:
+                raise error
+            delay = min(self.backoff_max, self.backoff * 2 ** attempt) * (0.5 + random.random() / 2)
+            if retry_after and retry_after.replace(".", "", 1).isdigit():
+                delay = min(self.backoff_max, float(retry_after))
+            time.sleep(delay)
+        raise AssertionError("unreachable")
+
+    def predict(self, rows: Sequence[Mapping[str, Any]]) -> PredictResponse:
+        """One /predict call for a batch of rows"""
+        return self._request("POST", "/predict", {"instances": list(rows)})
+
+    def predict_one(self, row: Mapping[str, Any]) -> Any:
+        """Prediction for one row, sent together with concurrent callers' rows"""
+        return self._batcher.submit(row).result()
+
+    def submit(self, row: Mapping[str, Any]) -> Future:
+        """Non-blocking ``predict_one``"""
+        return self._batcher.submit(row)
+
+    def status(self) -> ModelStatus:
+        return self._request("GET", "/status")
+
+    def rollback(self, version: Optional[str] = None) -> RollbackResponse:
+        """Roll back to ``version``, or to the previous model if None (never retried: not idempotent)"""
+        return self._request("POST", "/rollback", {"version": version} if version else {},
+                             idempotent=version is not None)
+
+    def close(self) -> None:
+        self._batcher.close()
+        self._executor.shutdown(wait=True)
+        self._session.close()
+
+    def __enter__(self) -> "ModelAPI":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+class AsyncModelAPI:
+    """asyncio interface over the same pool, batcher and retry policy as :class:`ModelAPI`"""
+
+    def __init__(self, base_url: str = API_URL, **kwargs):
+        self._client = ModelAPI(base_url, **kwargs)
+
+    async def _call(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._client._executor, fn, *args)
+
+    async def predict(self, rows: Sequence[Mapping[str, Any]]) -> PredictResponse:
+        return await self._call(self._client.predict, rows)
+
+    async def predict_one(self, row: Mapping[str, Any]) -> Any:
+        return await asyncio.wrap_future(self._client.submit(row))
+
+    async def status(self) -> ModelStatus:
+        return await self._call(self._client.status)
+
+    async def rollback(self, version: Optional[str] = None) -> RollbackResponse:
+        return await self._call(self._client.rollback, version)
+
+    async def close(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self._client.close)
+
+    async def __aenter__(self) -> "AsyncModelAPI":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+_default: Optional[ModelAPI] = None
+_default_lock = threading.Lock()
+
+def default_client() -> ModelAPI:
+    """Process-wide client, so every caller shares one connection pool"""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = ModelAPI()
+        return _default
+
+if USE_DUMMY == "1":
+    def fetch_status() -> Dict:
+        return {"model_version": None, "status": "unknown", "note": "Dummy mode enabled (PULSEAI_USE_DUMMY=1)."}
+
+    def request_rollback(version: Optional[str] = None) -> Dict:
+        return {"model_version": None, "status": "unknown", "note": "Dummy mode enabled (PULSEAI_USE_DUMMY=1)."}
+
+else:
+    def fetch_status() -> Dict:
+        try:
+            return default_client().status()
+        except Exception as e:
+            return {"model_version": None, "status": "unreachable", "error": f"serving API error: {e}"}
+
+    def request_rollback(version: Optional[str] = None) -> Dict:
+        try:
+            return default_client().rollback(version)
+        except Exception as e:
+            return {"model_version": None, "status": "failed", "error": f"serving API error: {e}"}
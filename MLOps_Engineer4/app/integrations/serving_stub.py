@@ -0,0 +1,161 @@
+"""Engineer 3 — local stand-in for the serving API
+Speaks the same /predict, /status and /rollback JSON as the real service, with
+HTTP/1.1 keep-alive, so the client and dashboard can be exercised without a
+deployed model. Latency is simulated as a fixed per-call cost plus a per-row
+cost, and ``fail_rate`` makes that share of calls answer 503 to exercise
+client retries.
+
+    python MLOps_Engineer4/app/integrations/serving_stub.py --port 8000 --latency-ms 5
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Mapping, Optional
+
+DEFAULT_HISTORY = ["v3.0.0", "v3.1.0", "v3.2.1", "v3.3.0"]
+
+def predict_row(row: Mapping[str, Any]) -> str:
+    """Deterministic stand-in model over the adult-income columns"""
+    try:
+        education = float(row.get("education_num", 0) or 0)
+        hours = float(row.get("hours_per_week", 0) or 0)
+    except (TypeError, ValueError):
+        return "<=50K"
+    return ">50K" if education >= 13 and hours >= 40 else "<=50K"
+
+class StubModel:
+    def __init__(self, latency_ms: float = 5.0, per_row_us: float = 20.0, fail_rate: float = 0.0,
+                 history: Optional[List[str]] = None):
+        self.latency = latency_ms / 1000.0
+        self.per_row = per_row_us / 1e6
+        self.fail_rate = fail_rate
+        self.history = list(history or DEFAULT_HISTORY)
+        self.started = time.time()
+        self.requests = 0
+        self.rows = 0
+        self._lock = threading.Lock()
+
+    def predict(self, instances: List[Mapping[str, Any]]) -> Dict[str, Any]:
+        time.sleep(self.latency + self.per_row * len(instances))
+        with self._lock:
+            self.requests += 1
+            self.rows += len(instances)
+            version = self.history[-1]
+        return {"predictions": [predict_row(row) for row in instances], "model_version": version}
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"model_version": self.history[-1], "status": "serving",
+                    "uptime_s": round(time.time() - self.started, 3), "requests": self.requests,
+                    "rows": self.rows, "history": list(self.history)}
+
+    def rollback(self, version: Optional[str]) -> Dict[str, Any]:
+        with self._lock:
+            previous = self.history[-1]
+            if version is None:
+                if len(self.history) < 2:
+                    raise ValueError("no earlier model to roll back to")
+                self.history.pop()
+            elif version in self.history:
+                del self.history[self.history.index(version) + 1:]
+            else:
+                raise ValueError(f"unknown model version {version!r}")
+            return {"model_version": self.history[-1], "previous_version": previous, "status": "rolled_back"}
+
+def _handler(model: StubModel):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+        # headers and body go out in separate writes; with Nagle on, every response
+        # stalls ~40 ms on the client's delayed ACK (real servers set TCP_NODELAY too)
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, code: int, body: Dict[str, Any]) -> None:
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _body(self) -> Dict[str, Any]:
+            length = int(self.headers.get("Content-Length") or 0)
+            return json.loads(self.rfile.read(length) or b"{}") if length else {}
+
+        def do_GET(self):
+            if self.path == "/status":
+                self._send(200, model.status())
+            else:
+                self._send(404, {"detail": "not found"})
+
+        def do_POST(self):
+            try:
+                body = self._body()
+            except ValueError:
+                self._send(400, {"detail": "invalid JSON"})
+                return
+            if model.fail_rate and random.random() < model.fail_rate:
+                self._send(503, {"detail": "injected failure"})
+            elif self.path == "/predict":
+                instances = body.get("instances")
+                if not isinstance(instances, list):
+                    self._send(422, {"detail": "'instances' must be a list of rows"})
+                else:
+                    self._send(200, model.predict(instances))
+            elif self.path == "/rollback":
+                try:
+                    self._send(200, model.rollback(body.get("version")))
+                except ValueError as e:
+                    self._send(409, {"detail": str(e)})
+            else:
+                self._send(404, {"detail": "not found"})
+
+    return Handler
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # listen backlog; the default of 5 resets bursts of new connections
+
+def make_server(host: str = "127.0.0.1", port: int = 0, **model_kwargs) -> StubServer:
+    return StubServer((host, port), _handler(StubModel(**model_kwargs)))
+
+@contextmanager
+def running_stub(**kwargs):
+    """A stub serving in a background thread; yields its base URL"""
+    server = make_server(**kwargs)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://{server.server_address[0]}:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Local stand-in for the serving API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="fixed cost of every call")
+    parser.add_argument("--per-row-us", type=float, default=20.0, help="extra cost per predicted row")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="share of POSTs answered with 503")
+    args = parser.parse_args(argv)
+    server = make_server(args.host, args.port, latency_ms=args.latency_ms, per_row_us=args.per_row_us,
+                         fail_rate=args.fail_rate)
+    # the actual port (for --port 0) on the first line, for scripts that launch the stub
+    print(f"serving on http://{server.server_address[0]}:{server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,9 +4,10 @@ _repo_root = pathlib.Path(__file__).resolve().parents[2]
 if str(_repo_root) not in sys.path:
     sys.path.insert(0, str(_repo_root))
 
-import time
+import os, time
 import streamlit as st  # type: ignore
 from components.ui import inject_css, topbar
+from utils.data import manifest_version
 from tabs import control_room, data_health, model_status, drift_fairness, recovery, explainability, reports
 
 
@@ -155,6 +156,20 @@ def login_view():
     )
     st.markdown('</div>', unsafe_allow_html=True)  # /login-card
 
+# --------- Data refresh ---------
+MANIFEST_POLL_SECONDS = float(os.getenv("PULSEAI_MANIFEST_POLL", "5"))
+
+@st.fragment(run_every=MANIFEST_POLL_SECONDS)
+def _watch_manifest():
+    """Polls only manifest.json and reruns the page when a new sync is published"""
+    version = manifest_version()
+    seen = st.session_state.setdefault("manifest_version", version)
+    if version != seen:
+        st.session_state.manifest_version = version
+        st.rerun(scope="app")
+    if version:
+        st.caption(f"Data version {version}")
+
 # --------- Router ---------
 def _app():
     topbar(title="PulseAI", org="Company XYZ", role="Business Viewer")
@@ -176,6 +191,8 @@ def _app():
         st.session_state.logged_in = False
         st.rerun()
     choice = st.sidebar.radio("Go to", list(tabs.keys()), index=0)
+    with st.sidebar:
+        _watch_manifest()
     tabs[choice]()
 
 # --------- Entry ---------
@@ -1,16 +1,10 @@
 import streamlit as st  # type: ignore
 import pandas as pd
+from pathlib import Path
 import plotly.express as px  # type: ignore
 import plotly.graph_objects as go  # type: ignore
-from utils.data import load_json, dummy_dir
-
-def sparkline(series):
-    df = pd.DataFrame({"x": list(range(len(series))), "y": series})
-    fig = px.line(df, x="x", y="y")
-    fig.update_layout(height=80, margin=dict(l=0, r=0, t=0, b=0), showlegend=False)
-    fig.update_xaxes(visible=False)
-    fig.update_yaxes(visible=False)
-    return fig
+from utils.data import load_json, load_batches, dummy_dir
+from components.sparklines import parameter_grid
 
 def render():
     st.title("Control Room")
@@ -21,14 +15,21 @@ def render():
     c1.metric("Operator ID", f"{meta['operator_id']}")
     c2.metric("Batches Today", f"{meta['batches_today']}")
     c3.metric("Drift Alerts (24h)", f"{meta['drift_alerts_24h']}")
-    c4.metric("OOC%", f"{meta['ooc_percent']:.2f}%")
+    c4.metric("OOC%", "n/a" if meta.get("ooc_percent") is None else f"{meta['ooc_percent']:.2f}%")
     c5.metric("Queue", f"{meta['queue']}")
 
+    # Written by the E1 background sync worker after every sync
+    if (Path(dummy_dir()) / "sync_status.json").exists():
+        sync = load_json("sync_status.json")
+        note = f" · ⚠️ last sync failed: {sync['error']}" if sync.get("error") else ""
+        st.caption(f"Dashboard sync lag {sync['lag_seconds']:.1f} s · last sync {sync['last_sync_at'][:19]} · "
+                   f"{sync['events_coalesced']} run events coalesced · {sync['pending']} pending{note}")
+
     # Radial gauge for Time to completion
     st.subheader("Time to completion")
     gauge = go.Figure(go.Indicator(
         mode="gauge+number",
-        value=float(meta.get("time_to_completion", 0)),
+        value=float(meta.get("time_to_completion") or 0),
         number={'suffix': " min"},
         gauge={
             'axis': {'range': [0, 120]},
@@ -44,27 +45,28 @@ def render():
     gauge.update_layout(height=260, margin=dict(l=10, r=10, t=10, b=10))
     st.plotly_chart(gauge, use_container_width=True)
 
+    # Measured by the E1 step timing spans; absent before the first instrumented run
+    if meta.get("avg_processing_time") is not None:
+        sync_time = meta.get("avg_sync_time")
+        st.caption(f"Processing time {meta['avg_processing_time']:.2f} s per batch (ingest + validation, "
+                   f"recent runs)" + (f" · dashboard sync {sync_time:.2f} s" if sync_time is not None else ""))
+    else:
+        st.caption("No step timings recorded yet")
+    if meta.get("step_timings"):
+        with st.expander("Step timings (24h)"):
+            st.dataframe(pd.DataFrame(meta["step_timings"]), use_container_width=True, hide_index=True)
+
     st.markdown("### Process Control Metrics Summary")
     params = load_json("parameters.json")
 
-    # Grid of parameter rows
-    for p in params:
-        with st.container():
-            c1, c2, c3, c4 = st.columns([1.5, 3, 1.5, 1])
-            c1.write(f"**{p['name']}**")
-            c2.plotly_chart(sparkline(p['spark']), use_container_width=True)
-            # Backward-compatible progress text
-            val = min(1.0, float(p['ooc']) / 100.0)
-            try:
-                c3.progress(val, text=f"OOC {p['ooc']:.2f}%")
-            except TypeError:
-                c3.progress(val)
-            c4.write("✅" if p['pass'] else "❌")
+    # All parameter rows in one batched, paginated table
+    parameter_grid(params)
 
     st.markdown("---")
     st.subheader("Live SPC Chart")
-    spc = load_json("spc.json")
-    df = pd.DataFrame({"batch": spc["batch"], "value": spc["value"]})
+    spc = load_json("spc.json")  # control limits; the points come from the time-series store
+    shown = st.select_slider("Batches shown", options=[20, 50, 100, 200, 500, 1000], value=200)
+    df = load_batches("spc", shown).reindex(columns=["batch", "value"])
     df["value"] = pd.to_numeric(df["value"], errors="coerce")
 
     fig = go.Figure()
@@ -2,20 +2,34 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 from utils.data import load_json, dummy_dir
+from components.timeseries import zoomed_series
+from integrations.engineer2_monitoring import fetch_drift_report
 
 def render():
     st.title("Drift & Fairness")
     st.caption(f"Source: {dummy_dir()}")
 
-    drift = load_json("drift_timeline.json")
-    df_drift = pd.DataFrame({"date": drift["dates"], "p_value": drift["p_value"]})
     st.subheader("Data drift p-value over time")
+    df_drift = zoomed_series("drift", ["p_value"], key="drift_zoom").rename(columns={"value": "p_value"})
     fig1 = px.line(df_drift, x="date", y="p_value", markers=True,
                    title="Drift p-value (lower means more drift)")
     st.plotly_chart(fig1, use_container_width=True)
 
+    report = fetch_drift_report()
+    if report.get("columns"):
+        st.caption(f"Latest check ({report.get('checked_at', 'n/a')}): {report['rows']} rows against "
+                   f"{report['reference_rows']} reference rows, batch p-value {report['p_value']}")
+        df_cols = pd.DataFrame(report["columns"]).T
+        st.dataframe(df_cols[["kind", "psi", "ks", "chi2", "p_value", "drifted"]], use_container_width=True)
+
     fair = load_json("fairness.json")
-    df_fair = pd.DataFrame(fair)
-    st.subheader("Group fairness — accuracy by subgroup")
-    fig2 = px.bar(df_fair, x="group", y="accuracy", title="Accuracy by Group")
+    df_fair = pd.DataFrame({k: v for k, v in fair.items() if isinstance(v, list)})
+    st.subheader("Group fairness by subgroup")
+    if "model_version" in fair:
+        st.caption(f"Model {fair['model_version']}: every group plus the least accurate of "
+                   f"{fair['slices_total']} slices (groups and pairwise intersections)")
+    metrics = [m for m in ("accuracy", "tpr", "fpr", "selection_rate") if m in df_fair]
+    metric = st.radio("Metric", metrics, horizontal=True, key="fair_metric")
+    fig2 = px.bar(df_fair, x="group", y=metric, color="kind" if "kind" in df_fair else None,
+                  title=f"{metric.replace('_', ' ').title()} by Group")
     st.plotly_chart(fig2, use_container_width=True)
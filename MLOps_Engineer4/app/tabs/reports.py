@@ -7,11 +7,55 @@ import plotly.graph_objects as go # type: ignore
 from reportlab.lib.pagesizes import A4 # type: ignore
 from reportlab.pdfgen import canvas # type: ignore
 from reportlab.lib.utils import ImageReader # type: ignore
-from utils.data import load_json, dummy_dir
+from utils.data import load_json, json_digest, dummy_dir
+from utils.render import BytesLRU, render_many
 
-def _fig_bytes(fig, w=1000, h=600, scale=2):
-    # Requires kaleido
-    return fig.to_image(format="png", width=w, height=h, scale=scale)
+# Rendered chart PNGs and finished PDFs, keyed by the hashes of the JSON files they
+# were built from, so unchanged data never goes through kaleido twice.
+_png_cache = BytesLRU(max_entries=32)
+_pdf_cache = BytesLRU(max_entries=8)
+
+SOURCES = ("model_status.json", "metrics_timeseries.json", "drift_timeline.json",
+           "fairness.json", "validation.json")
+
+def _perf_fig():
+    ts = load_json("metrics_timeseries.json")
+    df_perf = pd.DataFrame({"date": ts["dates"], "accuracy": ts["accuracy"], "precision": ts["precision"], "recall": ts["recall"]})
+    perf_melt = df_perf.melt(id_vars="date", var_name="metric", value_name="value")
+    return px.line(perf_melt, x="date", y="value", color="metric", markers=True, title="Accuracy / Precision / Recall")
+
+def _drift_fig():
+    drift = load_json("drift_timeline.json")
+    df_drift = pd.DataFrame({"date": drift["dates"], "p_value": drift["p_value"]})
+    return px.line(df_drift, x="date", y="p_value", markers=True, title="Drift p-value (lower → more drift)")
+
+def _fair_fig():
+    fair = load_json("fairness.json")
+    df_fair = pd.DataFrame({"group": fair["group"], "accuracy": fair["accuracy"]})
+    return px.bar(df_fair, x="group", y="accuracy", title="Accuracy by Group")
+
+def _mv_fig():
+    val = load_json("validation.json")
+    mv = pd.DataFrame(list(val.get("missing_values", {}).items()), columns=["column", "missing_count"])
+    return px.bar(mv, x="column", y="missing_count", title="Missing Values by Column")
+
+# chart name -> (figure builder, source file)
+CHARTS = {
+    "perf": (_perf_fig, "metrics_timeseries.json"),
+    "drift": (_drift_fig, "drift_timeline.json"),
+    "fair": (_fair_fig, "fairness.json"),
+    "mv": (_mv_fig, "validation.json"),
+}
+
+def _chart_pngs():
+    """PNG bytes per chart; cache misses are rendered concurrently"""
+    keys = {name: (name, json_digest(src)) for name, (_, src) in CHARTS.items()}
+    pngs = {name: _png_cache.get(key) for name, key in keys.items()}
+    missing = {name: CHARTS[name][0]().to_json() for name, png in pngs.items() if png is None}
+    for name, png in render_many(missing).items():
+        _png_cache.put(keys[name], png)
+        pngs[name] = png
+    return pngs
 
 def _draw_title(c, title):
     c.setFont("Helvetica-Bold", 18)
@@ -26,29 +70,9 @@ def _draw_image(c, img_bytes, x, y, w):
     c.drawImage(img, x, y, width=w, height=h, preserveAspectRatio=True, mask='auto')
     return h
 
-def render():
-    st.title("Report")
-    st.caption(f"Source: {dummy_dir()}")
-
+def _build_pdf():
     ms = load_json("model_status.json")
-    ts = load_json("metrics_timeseries.json")
-    drift = load_json("drift_timeline.json")
-    fair = load_json("fairness.json")
-    val = load_json("validation.json")
-
-    # ----- Build charts -----
-    df_perf = pd.DataFrame({"date": ts["dates"], "accuracy": ts["accuracy"], "precision": ts["precision"], "recall": ts["recall"]})
-    perf_melt = df_perf.melt(id_vars="date", var_name="metric", value_name="value")
-    fig_perf = px.line(perf_melt, x="date", y="value", color="metric", markers=True, title="Accuracy / Precision / Recall")
-
-    df_drift = pd.DataFrame({"date": drift["dates"], "p_value": drift["p_value"]})
-    fig_drift = px.line(df_drift, x="date", y="p_value", markers=True, title="Drift p-value (lower → more drift)")
-
-    df_fair = pd.DataFrame(fair)
-    fig_fair = px.bar(df_fair, x="group", y="accuracy", title="Accuracy by Group")
-
-    mv = pd.DataFrame(list(val.get("missing_values", {}).items()), columns=["column", "missing_count"])
-    fig_mv = px.bar(mv, x="column", y="missing_count", title="Missing Values by Column")
+    pngs = _chart_pngs()
 
     # ----- Compose PDF -----
     buf = io.BytesIO()
@@ -65,31 +89,45 @@ def render():
     c.drawString(40, 755, f"Last Trained: {ms.get('last_trained','N/A')}")
 
     y = 740
-    img_h = _draw_image(c, _fig_bytes(fig_perf), x=40, y=y-300, w=W-80)
+    img_h = _draw_image(c, pngs["perf"], x=40, y=y-300, w=W-80)
     c.showPage()
 
     # Page 2: Drift + Fairness
     _draw_title(c, "Drift & Fairness")
     y = 760
-    img_h = _draw_image(c, _fig_bytes(fig_drift), x=40, y=y-300, w=W-80)
+    img_h = _draw_image(c, pngs["drift"], x=40, y=y-300, w=W-80)
     y = y - img_h - 40
-    _draw_image(c, _fig_bytes(fig_fair), x=40, y=y-280, w=W-80)
+    _draw_image(c, pngs["fair"], x=40, y=y-280, w=W-80)
     c.showPage()
 
     # Page 3: Data Health (Missing Values)
     _draw_title(c, "Data Health")
-    _draw_image(c, _fig_bytes(fig_mv), x=40, y=420, w=W-80)
+    _draw_image(c, pngs["mv"], x=40, y=420, w=W-80)
     c.showPage()
 
     c.save()
-    pdf_bytes = buf.getvalue()
-
-    st.download_button(
-        "📄 Download PDF Report",
-        data=pdf_bytes,
-        file_name="pulseai_report.pdf",
-        mime="application/pdf",
-        use_container_width=True,
-    )
+    return buf.getvalue()
+
+def render():
+    st.title("Report")
+    st.caption(f"Source: {dummy_dir()}")
+
+    # Nothing is rasterised until the user asks for the report; a PDF already built
+    # from the current data is offered straight away.
+    key = tuple(json_digest(name) for name in SOURCES)
+    pdf_bytes = _pdf_cache.get(key)
+    if pdf_bytes is None and st.button("🛠️ Generate PDF Report", use_container_width=True):
+        with st.spinner("Rendering charts…"):
+            pdf_bytes = _build_pdf()
+        _pdf_cache.put(key, pdf_bytes)
+
+    if pdf_bytes is not None:
+        st.download_button(
+            "📄 Download PDF Report",
+            data=pdf_bytes,
+            file_name="pulseai_report.pdf",
+            mime="application/pdf",
+            use_container_width=True,
+        )
 
     st.info("This PDF includes KPIs and the key charts only (not the whole webpage).")
@@ -1,7 +1,106 @@
-import json, os
+import hashlib, json, os, threading, time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict
 
+# Process-wide cache shared by every Streamlit session. When the data dir has a
+# manifest.json (written by the E1 sync), only the manifest is polled: a file is
+# re-read when its sha256 there changes. Other files are re-parsed when their
+# mtime or size changes. Within STAT_TTL seconds of the last check the cached
+# value is returned without touching the filesystem at all.
+CACHE_MAX_ENTRIES = int(os.getenv("PULSEAI_JSON_CACHE_ENTRIES", "64"))
+CACHE_MAX_BYTES = int(os.getenv("PULSEAI_JSON_CACHE_BYTES", str(64 * 1024 * 1024)))
+STAT_TTL = float(os.getenv("PULSEAI_JSON_CACHE_TTL", "1.0"))
+MANIFEST_FILENAME = "manifest.json"
+
+class _JsonCache:
+    def __init__(self, max_entries: int, max_bytes: int, stat_ttl: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stat_ttl = stat_ttl
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path):
+        return self.entry(path)["value"]
+
+    def manifest(self, data_dir: Path):
+        try:
+            return self._stat_entry(Path(data_dir) / MANIFEST_FILENAME)["value"]
+        except FileNotFoundError:
+            return None
+
+    def entry(self, path: Path) -> Dict[str, Any]:
+        path = Path(path)
+        if path.name == MANIFEST_FILENAME:
+            return self._stat_entry(path)
+        manifest = self.manifest(path.parent)
+        published = manifest.get("files", {}).get(path.name) if manifest else None
+        if published is None:
+            return self._stat_entry(path)
+        with self._lock:
+            entry = self._entries.get(str(path))
+            if entry is not None and entry["digest"] == published["sha256"]:
+                self._entries.move_to_end(str(path))
+                self.hits += 1
+                return entry
+        # the manifest announced new content: skip the TTL and go to the file
+        return self._stat_entry(path, use_ttl=False)
+
+    def _stat_entry(self, path: Path, use_ttl: bool = True) -> Dict[str, Any]:
+        key = str(path)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if use_ttl and entry is not None and now - entry["checked"] < self.stat_ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        st = os.stat(path)
+        signature = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["signature"] == signature:
+                entry["checked"] = now
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        with open(path, "rb") as f:
+            raw = f.read()
+        value = json.loads(raw.decode("utf-8"))
+
+        with self._lock:
+            self.misses += 1
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old["size"]
+            entry = {"value": value, "digest": hashlib.sha256(raw).hexdigest(),
+                     "signature": signature, "size": st.st_size, "checked": now}
+            self._entries[key] = entry
+            self._bytes += st.st_size
+            while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted["size"]
+        return entry
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "entries": len(self._entries), "bytes": self._bytes}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = 0
+
+_cache = _JsonCache(CACHE_MAX_ENTRIES, CACHE_MAX_BYTES, STAT_TTL)
+
 def dummy_dir() -> str:
     # Get the absolute path to MLOps_Engineer4/data directory
     current_file = Path(__file__).resolve()
@@ -10,6 +109,146 @@ def dummy_dir() -> str:
     return os.getenv("DUMMY_DATA_DIR", str(engineer4_data))
 
 def load_json(name: str):
-    path = Path(dummy_dir()) / name
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Parsed JSON from the data dir, cached across reruns and sessions.
+
+    The returned object is shared between callers; treat it as read-only.
+    """
+    return _cache.get(Path(dummy_dir()) / name)
+
+def json_digest(name: str) -> str:
+    """sha256 of the file's current content (shares the load_json cache)"""
+    return _cache.entry(Path(dummy_dir()) / name)["digest"]
+
+def manifest_version() -> int:
+    """Version of the last published sync (0 if the data dir has no manifest)"""
+    manifest = _cache.manifest(Path(dummy_dir()))
+    return manifest.get("version", 0) if manifest else 0
+
+def cache_stats() -> Dict[str, int]:
+    """Hit/miss counters and size of the shared JSON cache"""
+    return _cache.stats()
+
+def clear_cache():
+    _cache.clear()
+
+# ---- Time-series store -------------------------------------------------------
+# History-bearing series are read from the SQLite store the E1 sync appends to,
+# so a tab loads only the window it displays. The store is opened read-only
+# through integrations/engineer1_timeseries.py; a series the store does not hold
+# yet (no sync so far, dummy mode, no MLOps_Engineer1) is read from its JSON file.
+TIMESERIES_DB = "timeseries.db"
+SERIES_SOURCES = {
+    "metrics": ("metrics_timeseries.json", "dates"),
+    "drift": ("drift_timeline.json", "dates"),
+    "spc": ("spc.json", "batch"),
+}
+# Traces are downsampled to about one point per horizontal pixel of a full-width chart
+CHART_WIDTH_PX = int(os.getenv("PULSEAI_CHART_WIDTH_PX", "1200"))
+# Windows holding more than this many points per pixel are min/max-bucketed in SQLite
+# first, so a year of per-minute data never crosses into Python point by point
+PREFETCH_FACTOR = 20
+_stores: Dict[str, Any] = {}
+_stores_lock = threading.Lock()
+
+def series_store(series: str):
+    """The read-only time-series store if it holds ``series``, else None"""
+    from integrations.engineer1_timeseries import open_series_store
+    path = Path(dummy_dir()) / TIMESERIES_DB
+    with _stores_lock:
+        store = _stores.get(str(path))
+        if store is None:
+            store = open_series_store(path)
+            if store is None:
+                return None
+            _stores[str(path)] = store
+    try:
+        return store if store.bounds(series) is not None else None
+    except Exception:  # a store the sync has not finished creating
+        return None
+
+def _json_series(series: str):
+    """Wide frame (t, one column per numeric field) of a series' JSON file"""
+    import pandas as pd
+    source, time_key = SERIES_SOURCES[series]
+    try:
+        doc = load_json(source) or {}
+    except (FileNotFoundError, ValueError):
+        doc = {}
+    times = doc.get(time_key) or []
+    if time_key == "dates":
+        t = (pd.to_datetime(pd.Series(times)).astype("int64") // 10**9).astype(float)
+    else:
+        t = pd.Series(times, dtype=float)
+    fields = {k: v for k, v in doc.items()
+              if k != time_key and isinstance(v, list) and len(v) == len(times)
+              and all(x is None or isinstance(x, (int, float)) for x in v)}
+    return pd.DataFrame({"t": t.to_numpy(), **fields}).astype(float)
+
+def series_bounds(series: str):
+    """(first, last) timestamp of a dated series, or None if it is empty"""
+    import pandas as pd
+    store = series_store(series)
+    if store is not None:
+        bounds = store.bounds(series)
+    else:
+        t = _json_series(series)["t"]
+        bounds = (t.min(), t.max()) if len(t) else None
+    if bounds is None:
+        return None
+    return tuple(pd.to_datetime(b, unit="s").to_pydatetime() for b in bounds)
+
+def load_series(series: str, fields, start=None, end=None, max_points: int = CHART_WIDTH_PX):
+    """Long-format (date, metric, value) points of ``fields`` between ``start`` and ``end``.
+
+    Each trace is capped at ``max_points``: LTTB over the raw points for moderate
+    windows, min/max bucketing in SQLite for very large ones. Narrowing the range
+    re-queries at full resolution. ``attrs["total_points"]`` holds the raw count.
+    """
+    import numpy as np
+    import pandas as pd
+    from utils.downsample import downsample
+    store = series_store(series)
+    t0 = None if start is None else pd.Timestamp(start).value / 1e9
+    t1 = None if end is None else pd.Timestamp(end).value / 1e9
+
+    if store is None:
+        wide = _json_series(series)
+        if t0 is not None:
+            wide = wide[wide["t"] >= t0]
+        if t1 is not None:
+            wide = wide[wide["t"] <= t1]
+        total = wide["t"].nunique()
+        raw = wide.melt(id_vars="t", value_vars=[f for f in fields if f in wide.columns],
+                        var_name="field", value_name="value").dropna(subset=["value"])
+        long = None
+    else:
+        total = store.count(series, t0, t1)
+        if total > PREFETCH_FACTOR * max_points:
+            bounds = store.bounds(series)
+            lo = bounds[0] if t0 is None else t0
+            hi = bounds[1] if t1 is None else t1
+            long = store.extrema(series, (hi - lo) / (max_points // 2), lo, hi, fields)
+        else:
+            raw, long = store.query_long(series, t0, t1, fields), None
+
+    if long is None:
+        parts = []
+        for field, trace in raw.groupby("field", sort=False):
+            t, v = downsample(trace["t"].to_numpy(), trace["value"].to_numpy(), max_points)
+            parts.append(pd.DataFrame({"t": t, "field": field, "value": v}))
+        long = pd.concat(parts) if parts else pd.DataFrame({"t": [], "field": [], "value": []})
+
+    df = pd.DataFrame({
+        "date": pd.to_datetime(np.asarray(long["t"], dtype=float), unit="s"),
+        "metric": long["field"].to_numpy(),
+        "value": long["value"].to_numpy(),
+    })
+    df.attrs["total_points"] = total
+    return df
+
+def load_batches(series: str, last: int):
+    """The last ``last`` batches of a batch-indexed series, with a ``batch`` column"""
+    store = series_store(series)
+    df = store.tail(series, last) if store is not None else _json_series(series).tail(last).reset_index(drop=True)
+    df.insert(0, "batch", df.pop("t").astype(int))
+    return df
@@ -0,0 +1,63 @@
+import numpy as np
+
+# Kept free of Streamlit imports so it can be reused outside the app.
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int):
+    """Largest-Triangle-Three-Buckets: ``n_out`` points that preserve the visual shape.
+
+    The first and last points are always kept; every bucket in between contributes
+    the point forming the largest triangle with the previously chosen point and
+    the mean of the next bucket, so spikes survive where plain striding drops them.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    edges = np.floor(np.linspace(1, n - 1, n_out - 1)).astype(int)
+    # mean of each bucket, used as the third vertex for the bucket before it
+    counts = np.diff(edges)
+    cx = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts
+    cy = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / counts
+    cx = np.append(cx[1:], x[-1])
+    cy = np.append(cy[1:], y[-1])
+
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs((x[a] - cx[i]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy[i] - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return x[keep], y[keep]
+
+def minmax(x: np.ndarray, y: np.ndarray, n_out: int):
+    """Keep the minimum and maximum of each of ``n_out // 2`` equal-count buckets, in x order"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    buckets = n_out // 2
+    if n_out >= n or buckets < 1:
+        return x, y
+    edges = np.linspace(0, n, buckets + 1).astype(int)
+    counts = np.diff(edges)
+    bucket = np.repeat(np.arange(buckets), counts)
+    keep = []
+    for reduce in (np.minimum, np.maximum):
+        # first position in each bucket equal to that bucket's extreme
+        hits = np.flatnonzero(y == np.repeat(reduce.reduceat(y, edges[:-1]), counts))
+        _, first = np.unique(bucket[hits], return_index=True)
+        keep.append(hits[first])
+    keep = np.unique(np.concatenate(keep))
+    return x[keep], y[keep]
+
+METHODS = {"lttb": lttb, "minmax": minmax}
+
+def downsample(x, y, n_out: int, method: str = "lttb"):
+    """Drop NaNs, then reduce a trace to at most ``n_out`` points"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    ok = ~np.isnan(y)
+    return METHODS[method](x[ok], y[ok], n_out)
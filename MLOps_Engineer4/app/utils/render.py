@@ -0,0 +1,66 @@
+import atexit, multiprocessing, threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Hashable, Optional
+
+# Kept free of Streamlit imports: render_png runs inside spawned worker processes.
+
+MAX_WORKERS = 4
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+def render_png(fig_json: str, w: int = 1000, h: int = 600, scale: int = 2) -> bytes:
+    # Requires kaleido
+    import plotly.io as pio  # type: ignore
+    return pio.from_json(fig_json).to_image(format="png", width=w, height=h, scale=scale)
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Long-lived pool so each worker keeps its kaleido renderer warm between reports"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = min(MAX_WORKERS, multiprocessing.cpu_count() or 1)
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+        return _pool
+
+def _reset_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+def render_many(figs: Dict[Hashable, str], **kwargs) -> Dict[Hashable, bytes]:
+    """Render {key: figure JSON} to PNG bytes concurrently, serially if the pool is unavailable"""
+    if len(figs) > 1:
+        try:
+            pool = _get_pool()
+            futures = {key: pool.submit(render_png, fig_json, **kwargs) for key, fig_json in figs.items()}
+            return {key: fut.result() for key, fut in futures.items()}
+        except Exception:
+            # e.g. BrokenProcessPool or a platform that cannot spawn; fall back below
+            _reset_pool()
+    return {key: render_png(fig_json, **kwargs) for key, fig_json in figs.items()}
+
+class BytesLRU:
+    """Small thread-safe LRU of rendered bytes, shared across sessions"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: bytes):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
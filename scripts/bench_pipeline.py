@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Pipeline benchmark suite
+Generates adult-schema datasets of the given sizes and times each stage on them:
+  ingest_data            cold parse (columnar cache emptied first)
+  ingest_data_cached     the same call served from the columnar cache
+  validate_data          whole-frame validation, called directly (no ZenML run, MLflow off)
+  validate_data_stream   chunked validation of the same file
+  sync_<name>            every DataSynchronizer.sync_* method, then sync_all_data
+  tab:<name>             every load_json / load_series / load_batches call of a dashboard tab, cold cache
+
+Each stage runs in a fresh interpreter, so its peak RSS is not inflated by earlier
+stages. Each size runs in a scratch copy of the repo, so nothing in this checkout is
+touched. The stages run in the order above in that copy, so sync_all_data sees the
+profile and SPC state the single sync stages left behind, as a repeated sync would.
+For every stage the suite records wall time, CPU time, peak RSS and rows/sec
+(dataset rows / wall time; not for tabs, which read the synced JSON). Results go
+to a JSON file; --compare prints the change against an earlier one.
+
+    python scripts/bench_pipeline.py --rows 10000 1000000 10000000
+    python scripts/bench_pipeline.py --rows 10000 --compare MLOps_Engineer1/artifacts/benchmarks/<earlier>.json
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+RESULTS_DIR = project_root / "MLOps_Engineer1" / "artifacts" / "benchmarks"
+TABS_DIR = project_root / "MLOps_Engineer4" / "app" / "tabs"
+
+# ---- datasets ----------------------------------------------------------------
+
+def generate_adult(path: Path, rows: int, seed: int = 0) -> Path:
+    """CSV with the columns and generator settings of configs/schema.yaml, streamed in chunks"""
+    # imported here: a --stage child must import MLOps_Engineer1 from its scratch tree
+    from MLOps_Engineer1.core.ingestion.synthetic import SyntheticDataset
+    SyntheticDataset.from_config(seed=seed).write(path, rows, "csv")
+    return path
+
+def _scratch_tree(root: Path, dataset: Path) -> Path:
+    """Copy of the code and dashboard data with ``dataset`` as the pipeline input"""
+    skip = shutil.ignore_patterns("__pycache__", "artifacts", "timeseries.db*")
+    shutil.copytree(project_root / "MLOps_Engineer1", root / "MLOps_Engineer1", ignore=skip)
+    shutil.copytree(project_root / "MLOps_Engineer4", root / "MLOps_Engineer4", ignore=skip)
+    target = root / "MLOps_Engineer1" / "data" / "adult_small.csv"
+    target.unlink()
+    try:
+        os.link(dataset, target)
+    except OSError:
+        shutil.copy2(dataset, target)
+    return root
+
+# ---- stages ------------------------------------------------------------------
+
+def _tab_loads():
+    """{tab: [(loader, args)]} for every data path the tab sources name literally"""
+    loads = {}
+    for path in sorted(TABS_DIR.glob("*.py")):
+        src = path.read_text()
+        calls = [("load_json", (name,)) for name in dict.fromkeys(re.findall(r'load_json\("([^"]+)"\)', src))]
+        calls += [("load_series", (series, json.loads(fields.replace("'", '"'))))
+                  for series, fields in re.findall(r'zoomed_series\("(\w+)",\s*(\[[^\]]*\])', src)]
+        calls += [("load_batches", (series, 200)) for series in re.findall(r'load_batches\("(\w+)"', src)]
+        if calls:
+            loads[path.stem] = calls
+    return loads
+
+def _stage_names():
+    from MLOps_Engineer1.core.integration.data_sync import DataSynchronizer
+    syncs = [name for name in vars(DataSynchronizer) if name.startswith("sync_") and name != "sync_all_data"]
+    return (["ingest_data", "ingest_data_cached", "validate_data", "validate_data_stream"]
+            + syncs + ["sync_all_data"] + [f"tab:{tab}" for tab in _tab_loads()])
+
+def _entrypoint(step):
+    """The plain function behind a ZenML step"""
+    return getattr(step, "entrypoint", None) or step
+
+def _prepare(stage: str, tree: Path):
+    """Untimed setup in the child; returns the callable to time"""
+    e1 = tree / "MLOps_Engineer1"
+    if stage.startswith("ingest_data"):
+        from MLOps_Engineer1.core.pipelines.steps.ingest import ingest_data
+        if stage == "ingest_data":
+            shutil.rmtree(e1 / "artifacts" / "cache", ignore_errors=True)
+        return _entrypoint(ingest_data)
+    if stage.startswith("validate_data"):
+        from MLOps_Engineer1.core.pipelines.steps import ingest, validate
+        shutil.rmtree(e1 / "artifacts" / "validation" / "state", ignore_errors=True)  # no incremental reuse
+        if stage == "validate_data":
+            df = _entrypoint(ingest.ingest_data)()
+            return lambda: _entrypoint(validate.validate_data)(df, force=True)
+        source = _entrypoint(ingest.ingest_data_stream)()
+        return lambda: _entrypoint(validate.validate_data_stream)(source, workers=1, force=True)
+    if stage.startswith("sync_"):
+        from MLOps_Engineer1.core.integration.data_sync import DataSynchronizer
+        return getattr(DataSynchronizer(), stage)
+    tab = stage.split(":", 1)[1]
+    sys.path.insert(0, str(tree / "MLOps_Engineer4" / "app"))
+    import utils.data as data
+    calls = _tab_loads()[tab]
+    return lambda: [getattr(data, loader)(*args) for loader, args in calls]
+
+def _peak_rss() -> int:
+    """This process's RSS high-water mark.
+
+    On Linux ru_maxrss survives fork + exec, so a child would report the parent's
+    peak; VmHWM belongs to the address space created at exec.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    from MLOps_Engineer1.core.ingestion.streaming import _peak_rss_bytes
+    return _peak_rss_bytes()
+
+def run_stage(stage: str, tree: Path, rows: int) -> dict:
+    """Time one stage in this (fresh) interpreter"""
+    fn = _prepare(stage, tree)
+    setup_rss = _peak_rss()
+    cpu, start = time.process_time(), time.perf_counter()
+    fn()
+    wall = time.perf_counter() - start
+    per_row = not stage.startswith("tab:")  # tabs read the synced JSON, not the dataset
+    return {"stage": stage, "rows": rows, "seconds": round(wall, 4),
+            "cpu_seconds": round(time.process_time() - cpu, 4),
+            "rows_per_sec": round(rows / wall, 1) if per_row and wall > 0 else None,
+            "peak_rss_bytes": _peak_rss(), "setup_rss_bytes": setup_rss}
+
+def _run_child(stage: str, tree: Path, rows: int, timeout: float) -> dict:
+    env = dict(os.environ, PULSEAI_MLFLOW_MODE="off", PULSEAI_SYNC_WORKER="external",
+               PYTHONPATH=os.pathsep.join(filter(None, [str(tree), os.environ.get("PYTHONPATH")])))
+    env.pop("PULSEAI_USE_DUMMY", None)
+    env.pop("DUMMY_DATA_DIR", None)
+    try:
+        out = subprocess.run([sys.executable, str(Path(__file__).resolve()), "--stage", stage,
+                              "--tree", str(tree), "--stage-rows", str(rows)],
+                             cwd=str(tree), env=env, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"stage": stage, "rows": rows, "error": f"timed out after {timeout:g}s"}
+    lines = [line for line in out.stdout.splitlines() if line.startswith("{")]
+    if out.returncode != 0 or not lines:
+        tail = (out.stderr or out.stdout).strip().splitlines()[-1:] or ["no output"]
+        return {"stage": stage, "rows": rows, "error": tail[0][:300]}
+    return json.loads(lines[-1])
+
+# ---- reporting -----------------------------------------------------------------
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=str(project_root),
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _print_row(r):
+    if "error" in r:
+        print(f"   {r['stage']:28s} ❌ {r['error']}")
+        return
+    rss = f"{r['peak_rss_bytes'] / 2**20:8.1f} MB" if r.get("peak_rss_bytes") else "     n/a"
+    rate = f"{r['rows_per_sec']:14,.0f} rows/s" if r.get("rows_per_sec") else ""
+    print(f"   {r['stage']:28s} {r['seconds']:9.3f} s {rss} {rate}")
+
+def compare(baseline: dict, current: dict) -> None:
+    before = {(r["rows"], r["stage"]): r for r in baseline["results"] if "error" not in r}
+    print(f"\nvs {baseline.get('commit')} ({baseline.get('created_at', '')[:19]}): time ratio, >1 is slower")
+    for r in current["results"]:
+        old = before.get((r["rows"], r["stage"]))
+        if old and "error" not in r and old["seconds"] > 0:
+            ratio = r["seconds"] / old["seconds"]
+            flag = " ⚠️" if ratio > 1.2 else ""
+            print(f"   {r['rows']:>10,} {r['stage']:28s} {old['seconds']:9.3f} -> {r['seconds']:9.3f} s  x{ratio:5.2f}{flag}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ingest, validation, sync and dashboard loading")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--stages", nargs="+", default=None, help="only these stages (default: all)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--data-dir", type=Path, default=None,
+                        help="keep generated datasets here and reuse them across runs")
+    parser.add_argument("--timeout", type=float, default=3600, help="seconds allowed per stage")
+    parser.add_argument("--out", type=Path, default=None, help="results JSON (default: artifacts/benchmarks/)")
+    parser.add_argument("--compare", type=Path, default=None, help="earlier results JSON to compare against")
+    parser.add_argument("--stage", help=argparse.SUPPRESS)
+    parser.add_argument("--tree", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--stage-rows", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.stage:  # child process: one stage in a scratch tree, importing the tree's copy of the code
+        sys.path.remove(str(project_root))
+        sys.path.insert(0, str(args.tree))
+        print(json.dumps(run_stage(args.stage, args.tree, args.stage_rows)))
+        return 0
+
+    stages = args.stages or _stage_names()
+    report = {"created_at": datetime.now().isoformat(), "commit": _git_commit(),
+              "python": platform.python_version(), "platform": platform.platform(),
+              "cpus": os.cpu_count(), "seed": args.seed, "results": []}
+    with tempfile.TemporaryDirectory(prefix="pulseai-bench-") as tmp:
+        data_dir = args.data_dir or Path(tmp) / "datasets"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        for rows in args.rows:
+            dataset = data_dir / f"adult_{rows}_{args.seed}.csv"
+            if not dataset.exists():
+                start = time.perf_counter()
+                generate_adult(dataset, rows, args.seed)
+                print(f"🧪 Generated {rows:,} rows in {time.perf_counter() - start:.1f}s")
+            tree = _scratch_tree(Path(tmp) / f"tree_{rows}", dataset)
+            print(f"🔄 {rows:,} rows")
+            for stage in stages:
+                result = _run_child(stage, tree, rows, args.timeout)
+                report["results"].append(result)
+                _print_row(result)
+            shutil.rmtree(tree, ignore_errors=True)
+
+    out = args.out or RESULTS_DIR / f"pipeline_{datetime.now():%Y%m%dT%H%M%S}_{report['commit'] or 'nogit'}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {out}")
+    if args.compare:
+        compare(json.loads(args.compare.read_text()), report)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
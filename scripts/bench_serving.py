@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Serving client benchmark
+Sends single-row predictions to the serving API (by default a local stand-in
+server started in a subprocess) and reports requests/sec and p50/p99 latency for:
+  fresh      - a new connection per request (no pooling)
+  pooled     - keep-alive pool, one /predict call per row
+  batched    - keep-alive pool, concurrent rows coalesced into batched calls
+  async      - the asyncio client, concurrent tasks coalesced the same way
+
+    python scripts/bench_serving.py --requests 2000 --concurrency 32
+    python scripts/bench_serving.py --url http://127.0.0.1:8000   # an already running server
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import requests
+
+project_root = Path(__file__).parent.parent
+APP_DIR = project_root / "MLOps_Engineer4" / "app"
+sys.path.insert(0, str(APP_DIR))
+
+from integrations.engineer3_api import AsyncModelAPI, ModelAPI  # noqa: E402
+
+ROW = {"age": 39, "workclass": "Private", "education_num": 13, "hours_per_week": 40}
+
+def _summary(name, latencies, elapsed):
+    lat_ms = np.asarray(latencies) * 1000
+    return {"scenario": name, "requests": len(lat_ms), "req_per_s": round(len(lat_ms) / elapsed, 1),
+            "p50_ms": round(float(np.percentile(lat_ms, 50)), 2),
+            "p99_ms": round(float(np.percentile(lat_ms, 99)), 2)}
+
+def _threaded(name, call, n, concurrency):
+    def timed(_):
+        start = time.perf_counter()
+        call()
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(timed, range(n)))
+    return _summary(name, latencies, time.perf_counter() - start)
+
+def bench_fresh(url, n, concurrency):
+    def call():
+        # Connection: close defeats keep-alive, as a client without a pool would
+        requests.post(f"{url}/predict", json={"instances": [ROW]}, headers={"Connection": "close"},
+                      timeout=10).raise_for_status()
+    return _threaded("fresh", call, n, concurrency)
+
+def bench_pooled(url, n, concurrency):
+    with ModelAPI(url, max_concurrency=concurrency) as api:
+        return _threaded("pooled", lambda: api.predict([ROW]), n, concurrency)
+
+def bench_batched(url, n, concurrency, max_batch, max_wait_ms):
+    with ModelAPI(url, max_concurrency=max(1, concurrency // 4), max_batch=max_batch,
+                  max_wait_ms=max_wait_ms) as api:
+        return _threaded("batched", lambda: api.predict_one(ROW), n, concurrency)
+
+def bench_async(url, n, concurrency, max_batch, max_wait_ms):
+    async def run():
+        async with AsyncModelAPI(url, max_concurrency=max(1, concurrency // 4), max_batch=max_batch,
+                                 max_wait_ms=max_wait_ms) as api:
+            gate = asyncio.Semaphore(concurrency)
+            latencies = []
+
+            async def one():
+                async with gate:
+                    start = time.perf_counter()
+                    await api.predict_one(ROW)
+                    latencies.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            await asyncio.gather(*(one() for _ in range(n)))
+            return _summary("async", latencies, time.perf_counter() - start)
+    return asyncio.run(run())
+
+def _start_stub(latency_ms, per_row_us):
+    proc = subprocess.Popen([sys.executable, str(APP_DIR / "integrations" / "serving_stub.py"), "--port", "0",
+                             "--latency-ms", str(latency_ms), "--per-row-us", str(per_row_us)],
+                            stdout=subprocess.PIPE, text=True)
+    line = proc.stdout.readline().strip()
+    if not line.startswith("serving on "):
+        proc.kill()
+        raise RuntimeError(f"stand-in server did not start: {line!r}")
+    return proc, line[len("serving on "):]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the serving API client")
+    parser.add_argument("--url", default=None, help="benchmark this server instead of a local stand-in")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="stand-in server cost per call")
+    parser.add_argument("--per-row-us", type=float, default=20.0, help="stand-in server cost per row")
+    parser.add_argument("--scenarios", nargs="+", default=["fresh", "pooled", "batched", "async"])
+    parser.add_argument("--json", type=Path, default=None, help="also write the results here")
+    args = parser.parse_args()
+
+    proc = None
+    url = args.url
+    if url is None:
+        proc, url = _start_stub(args.latency_ms, args.per_row_us)
+    try:
+        runners = {
+            "fresh": lambda: bench_fresh(url, args.requests, args.concurrency),
+            "pooled": lambda: bench_pooled(url, args.requests, args.concurrency),
+            "batched": lambda: bench_batched(url, args.requests, args.concurrency, args.max_batch, args.max_wait_ms),
+            "async": lambda: bench_async(url, args.requests, args.concurrency, args.max_batch, args.max_wait_ms),
+        }
+        results = []
+        print(f"🔄 {args.requests} single-row requests, concurrency {args.concurrency}, server {url}")
+        for name in args.scenarios:
+            result = runners[name]()
+            results.append(result)
+            print(f"   {name:8s} {result['req_per_s']:9.1f} req/s   p50 {result['p50_ms']:7.2f} ms   "
+                  f"p99 {result['p99_ms']:7.2f} ms")
+        if args.json:
+            args.json.write_text(json.dumps(results, indent=2))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())